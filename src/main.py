@@ -5,16 +5,7 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent))
 
-from sql.db_operations import (
-    DatabaseConnection,
-    UserOperations,
-    RestaurantOperations,
-    MenuItemOperations,
-    OrderOperations,
-    DeliveryPartnerOperations,
-    CartOperations,
-    RatingOperations
-)
+from sql.registry import OperationsRegistry
 from ui.customer_view import render_customer_view
 from ui.restaurant_admin_view import render_restaurant_admin_view
 from ui.system_admin_view import render_system_admin_view
@@ -25,6 +16,10 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource(show_spinner=False)
+def get_registry(host: str, user: str, password: str, database: str, port: int):
+    return OperationsRegistry.connect(host, user, password, database, port)
+
 st.title("Food Delivery System")
 st.markdown("---")
 
@@ -53,9 +48,6 @@ with st.sidebar:
                 'port': 26098
             }
         
-        if 'db' not in st.session_state:
-            st.session_state.db = None
-        
         host = st.text_input("Host", value=st.session_state.db_config['host'])
         user = st.text_input("User", value=st.session_state.db_config['user'])
         password = st.text_input("Password", type="password", value=st.session_state.db_config['password'])
@@ -74,10 +66,7 @@ with st.sidebar:
             }
             
             try:
-                db = DatabaseConnection(host, user, password, database, port)
-                with db.get_connection() as conn:
-                    pass
-                st.session_state.db = db
+                get_registry(**st.session_state.db_config)
                 st.session_state.db_connected = True
                 st.success("Connected to database!")
                 st.rerun()
@@ -108,7 +97,7 @@ with st.sidebar:
                                     st.error("Passwords do not match!")
                                 else:
                                     try:
-                                        user_ops = UserOperations(st.session_state.db)
+                                        user_ops = get_registry(**st.session_state.db_config).user_ops
                                         existing_user = user_ops.read_by_username(username)
                                         if existing_user:
                                             st.error("Username already exists!")
@@ -142,7 +131,7 @@ with st.sidebar:
                         if st.form_submit_button("Login", type="primary"):
                             if username and password:
                                 try:
-                                    user_ops = UserOperations(st.session_state.db)
+                                    user_ops = get_registry(**st.session_state.db_config).user_ops
                                     user = user_ops.read_by_username(username)
                                     
                                     if user and user['password'] == password:
@@ -181,7 +170,6 @@ with st.sidebar:
                 st.rerun()
             
             if st.button("Disconnect Database"):
-                st.session_state.db = None
                 st.session_state.db_connected = False
                 st.session_state.current_user_role = None
                 st.session_state.current_user_id = None
@@ -229,27 +217,19 @@ if not st.session_state.db_connected:
     """)
 else:
     if st.session_state.current_user_role:
-        db = st.session_state.db
-        
-        user_ops = UserOperations(db)
-        restaurant_ops = RestaurantOperations(db)
-        menu_item_ops = MenuItemOperations(db)
-        order_ops = OrderOperations(db)
-        delivery_partner_ops = DeliveryPartnerOperations(db)
-        cart_ops = CartOperations(db)
-        rating_ops = RatingOperations(db)
+        ops = get_registry(**st.session_state.db_config)
         
         if st.session_state.current_user_role == 'customer':
-            render_customer_view(user_ops, restaurant_ops, menu_item_ops, order_ops, cart_ops, rating_ops)
+            render_customer_view(ops.user_ops, ops.restaurant_ops, ops.menu_item_ops, ops.order_ops, ops.cart_ops, ops.rating_ops)
         
         elif st.session_state.current_user_role == 'restaurant_admin':
-            render_restaurant_admin_view(user_ops, restaurant_ops, menu_item_ops, order_ops, rating_ops)
+            render_restaurant_admin_view(ops.user_ops, ops.restaurant_ops, ops.menu_item_ops, ops.order_ops, ops.rating_ops, ops.analytics_ops)
         
         elif st.session_state.current_user_role == 'system_admin':
-            render_system_admin_view(user_ops, restaurant_ops, menu_item_ops, order_ops, delivery_partner_ops)
+            render_system_admin_view(ops.user_ops, ops.restaurant_ops, ops.menu_item_ops, ops.order_ops, ops.delivery_partner_ops, ops.analytics_ops)
         
         elif st.session_state.current_user_role == 'delivery_partner':
-            render_delivery_partner_view(user_ops, order_ops, delivery_partner_ops)
+            render_delivery_partner_view(ops.user_ops, ops.order_ops, ops.delivery_partner_ops, ops.location_ingestor)
     
     else:
         st.info("Please select a user from the sidebar to login.")
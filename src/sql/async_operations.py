@@ -0,0 +1,87 @@
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from sql.db_operations import (
+    DatabaseConnection,
+    UserOperations,
+    RestaurantOperations,
+    MenuItemOperations,
+    OrderOperations,
+    DeliveryPartnerOperations,
+    CartOperations,
+    RatingOperations,
+    RestaurantAnalyticsOperations
+)
+
+_executors = weakref.WeakKeyDictionary()
+_executors_lock = threading.Lock()
+
+def _executor_for(db: DatabaseConnection):
+    with _executors_lock:
+        executor = _executors.get(db)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=db.pool.max_size, thread_name_prefix='db-fanout')
+            _executors[db] = executor
+            weakref.finalize(db, executor.shutdown, wait=False)
+        return executor
+
+class AsyncOperations:
+    def __init__(self, operations):
+        self.operations = operations
+        self.db = operations.db
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self.operations, name)
+        if not callable(attr):
+            return attr
+        
+        async def call(*args, **kwargs):
+            # The transaction's connection is thread-local, so calls made inside one stay on this thread
+            if self.db.in_transaction():
+                return attr(*args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_executor_for(self.db), functools.partial(attr, *args, **kwargs))
+        
+        call.__name__ = name
+        return call
+
+class AsyncUserOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(UserOperations(db))
+
+class AsyncRestaurantOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(RestaurantOperations(db))
+
+class AsyncMenuItemOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(MenuItemOperations(db))
+
+class AsyncOrderOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(OrderOperations(db))
+
+class AsyncDeliveryPartnerOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(DeliveryPartnerOperations(db))
+
+class AsyncCartOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(CartOperations(db))
+
+class AsyncRatingOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(RatingOperations(db))
+
+class AsyncRestaurantAnalyticsOperations(AsyncOperations):
+    def __init__(self, db: DatabaseConnection):
+        super().__init__(RestaurantAnalyticsOperations(db))
+
+async def gather_queries(*calls):
+    return list(await asyncio.gather(*calls))
+
+def run_queries(*calls):
+    return asyncio.run(gather_queries(*calls))
@@ -0,0 +1,328 @@
+import argparse
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Any, List
+
+from sql.db_operations import (
+    DatabaseConnection,
+    UserOperations,
+    RestaurantOperations,
+    MenuItemOperations,
+    OrderOperations,
+    DeliveryPartnerOperations,
+    CartOperations,
+    RatingOperations
+)
+from sql.data_generator import DatasetGenerator
+
+logger = logging.getLogger(__name__)
+
+BENCHMARKED_CLASSES = (UserOperations, RestaurantOperations, MenuItemOperations, OrderOperations, DeliveryPartnerOperations, CartOperations, RatingOperations)
+
+TABLES = ('DeliveryTracking', 'Cart', 'ItemRatings', 'RestaurantRatings', 'OrderItems', 'Orders', 'MenuItemDailySales', 'RestaurantDailySales', 'RollupWatermarks', 'DeliveryPartners', 'MenuItems', 'Restaurants', 'Users')
+
+class _Rollback(Exception):
+    pass
+
+class Fixtures:
+    def __init__(self, db: DatabaseConnection, sample_size: int = 200):
+        def ids(query: str, params: tuple = None):
+            return [row['id'] for row in db.execute_query(query, params, fetch=True)]
+        
+        def spread(table: str):
+            bounds = db.execute_query(f"SELECT MIN(id) as low, MAX(id) as high FROM {table}", fetch=True)[0]
+            if bounds['low'] is None:
+                return []
+            step = max(1, (bounds['high'] - bounds['low']) // sample_size)
+            return ids(f"SELECT id FROM {table} WHERE id IN ({', '.join(['%s'] * sample_size)})", tuple(range(bounds['low'], bounds['low'] + step * sample_size, step)))
+        
+        self.customer_ids = ids("SELECT id FROM Users WHERE role = 'customer' ORDER BY id LIMIT %s", (sample_size,))
+        self.admin_ids = ids("SELECT id FROM Users WHERE role = 'restaurant_admin' ORDER BY id LIMIT %s", (sample_size,))
+        self.usernames = [row['username'] for row in db.execute_query("SELECT username FROM Users ORDER BY id LIMIT %s", (sample_size,), fetch=True)]
+        self.restaurant_ids = spread('Restaurants')
+        menu_item_ids = spread('MenuItems')
+        self.menu_items = db.execute_query(f"SELECT id, restaurant_id, price FROM MenuItems WHERE id IN ({', '.join(['%s'] * len(menu_item_ids)) or 'NULL'})", tuple(menu_item_ids), fetch=True)
+        self.order_ids = spread('Orders')
+        self.order_items = db.execute_query(f"SELECT order_id, menu_item_id FROM OrderItems WHERE order_id IN ({', '.join(['%s'] * len(self.order_ids)) or 'NULL'})", tuple(self.order_ids), fetch=True)
+        self.partners = db.execute_query("SELECT id, user_id, current_latitude, current_longitude FROM DeliveryPartners ORDER BY id LIMIT %s", (sample_size,), fetch=True)
+        self.restaurant_ratings = db.execute_query("SELECT restaurant_id, customer_id FROM RestaurantRatings ORDER BY id LIMIT %s", (sample_size,), fetch=True)
+        self.item_ratings = db.execute_query("SELECT menu_item_id, customer_id FROM ItemRatings ORDER BY id LIMIT %s", (sample_size,), fetch=True)
+        self.cart_items = db.execute_query("SELECT customer_id, menu_item_id FROM Cart ORDER BY id LIMIT %s", (sample_size,), fetch=True)
+    
+    @staticmethod
+    def pick(values: List[Any], i: int):
+        return values[i % len(values)]
+    
+    def is_complete(self):
+        return all((self.customer_ids, self.admin_ids, self.restaurant_ids, self.menu_items, self.order_ids, self.order_items, self.partners, self.restaurant_ratings, self.item_ratings, self.cart_items))
+
+def _cases(ops: Dict[str, Any], fx: Fixtures):
+    users, restaurants, menu, orders, partners, carts, ratings = (ops[cls.__name__] for cls in BENCHMARKED_CLASSES)
+    pick = Fixtures.pick
+    
+    def menu_item(i):
+        return pick(fx.menu_items, i)
+    
+    def partner(i):
+        return pick(fx.partners, i)
+    
+    def location(i):
+        row = partner(i)
+        return float(row['current_latitude'] or 12.9716), float(row['current_longitude'] or 77.5946)
+    
+    def exhaust(stream):
+        return sum(1 for _ in stream)
+    
+    # name -> (call, writes, heavy); writes run inside a rolled-back transaction, heavy ones scan whole tables
+    return {
+        'UserOperations.create': (lambda i: users.create(f"bench_user_{i}", 'bench', f"bench_user_{i}@example.com"), True, False),
+        'UserOperations.create_many': (lambda i: users.create_many([{'username': f"bench_{i}_{n}", 'password': 'bench', 'email': f"bench_{i}_{n}@example.com"} for n in range(10)]), True, False),
+        'UserOperations.delete': (lambda i: users.delete(pick(fx.customer_ids, i)), True, True),
+        'UserOperations.read_all': (lambda i: users.read_all(), False, True),
+        'UserOperations.read_by_id': (lambda i: users.read_by_id(pick(fx.customer_ids, i)), False, False),
+        'UserOperations.read_by_role': (lambda i: users.read_by_role('delivery_partner'), False, True),
+        'UserOperations.read_by_username': (lambda i: users.read_by_username(pick(fx.usernames, i)), False, False),
+        'UserOperations.read_page': (lambda i: users.read_page(after=pick(fx.customer_ids, i), limit=50), False, False),
+        'UserOperations.update': (lambda i: users.update(pick(fx.customer_ids, i), phone='9000000000'), True, False),
+        'RestaurantOperations.create': (lambda i: restaurants.create(f"Bench Kitchen {i}", 'Bench Street', admin_id=pick(fx.admin_ids, i)), True, False),
+        'RestaurantOperations.create_many': (lambda i: restaurants.create_many([{'name': f"Bench Kitchen {i}.{n}", 'address': 'Bench Street', 'admin_id': pick(fx.admin_ids, i)} for n in range(10)]), True, False),
+        'RestaurantOperations.delete': (lambda i: restaurants.delete(pick(fx.restaurant_ids, i)), True, True),
+        'RestaurantOperations.read_all': (lambda i: restaurants.read_all(), False, True),
+        'RestaurantOperations.read_by_admin': (lambda i: restaurants.read_by_admin(pick(fx.admin_ids, i)), False, False),
+        'RestaurantOperations.read_by_id': (lambda i: restaurants.read_by_id(pick(fx.restaurant_ids, i)), False, False),
+        'RestaurantOperations.update': (lambda i: restaurants.update(pick(fx.restaurant_ids, i), phone='0800000000'), True, False),
+        'MenuItemOperations.create': (lambda i: menu.create(pick(fx.restaurant_ids, i), f"Bench Dish {i}", price=99.0), True, False),
+        'MenuItemOperations.create_many': (lambda i: menu.create_many([{'restaurant_id': pick(fx.restaurant_ids, i), 'name': f"Bench Dish {i}.{n}", 'price': 99.0} for n in range(10)]), True, False),
+        'MenuItemOperations.delete': (lambda i: menu.delete(menu_item(i)['id']), True, True),
+        'MenuItemOperations.read_all': (lambda i: menu.read_all(), False, True),
+        'MenuItemOperations.read_available_by_restaurant': (lambda i: menu.read_available_by_restaurant(pick(fx.restaurant_ids, i)), False, False),
+        'MenuItemOperations.read_by_id': (lambda i: menu.read_by_id(menu_item(i)['id']), False, False),
+        'MenuItemOperations.read_by_restaurant': (lambda i: menu.read_by_restaurant(pick(fx.restaurant_ids, i)), False, False),
+        'MenuItemOperations.read_page': (lambda i: menu.read_page(after=menu_item(i)['id'], limit=50), False, False),
+        'MenuItemOperations.search': (lambda i: menu.search(pick(['chicken', 'paneer', 'pizza', 'dosa', 'biryani'], i), {'max_price': 300}), False, False),
+        'MenuItemOperations.update': (lambda i: menu.update(menu_item(i)['id'], price=float(menu_item(i)['price'])), True, False),
+        'OrderOperations.add_item': (lambda i: orders.add_item(pick(fx.order_ids, i), menu_item(i)['id'], 1), True, False),
+        'OrderOperations.add_items': (lambda i: orders.add_items(pick(fx.order_ids, i), [{'menu_item_id': menu_item(i + n)['id'], 'quantity': 1} for n in range(3)]), True, False),
+        'OrderOperations.assign_delivery_partner': (lambda i: orders.assign_delivery_partner(pick(fx.order_ids, i), partner(i)['id']), True, False),
+        'OrderOperations.create': (lambda i: orders.create(pick(fx.customer_ids, i), pick(fx.restaurant_ids, i), 'Bench Street', 199.0, 'UPI'), True, False),
+        'OrderOperations.delete': (lambda i: orders.delete(pick(fx.order_ids, i)), True, False),
+        'OrderOperations.get_order_items': (lambda i: orders.get_order_items(pick(fx.order_ids, i)), False, False),
+        'OrderOperations.get_order_items_for_orders': (lambda i: orders.get_order_items_for_orders([pick(fx.order_ids, i + n) for n in range(50)]), False, False),
+        'OrderOperations.get_prices': (lambda i: orders.get_prices([menu_item(i + n)['id'] for n in range(20)]), False, False),
+        'OrderOperations.read_all': (lambda i: orders.read_all(), False, True),
+        'OrderOperations.read_available_for_pickup': (lambda i: orders.read_available_for_pickup(limit=50, near=location(i), radius_km=10.0), False, False),
+        'OrderOperations.read_by_customer': (lambda i: orders.read_by_customer(pick(fx.customer_ids, i)), False, False),
+        'OrderOperations.read_by_delivery_partner': (lambda i: orders.read_by_delivery_partner(partner(i)['id']), False, True),
+        'OrderOperations.read_by_id': (lambda i: orders.read_by_id(pick(fx.order_ids, i)), False, False),
+        'OrderOperations.read_by_restaurant': (lambda i: orders.read_by_restaurant(pick(fx.restaurant_ids, i)), False, True),
+        'OrderOperations.read_page': (lambda i: orders.read_page(limit=50, customer_id=pick(fx.customer_ids, i)), False, False),
+        'OrderOperations.remove_item': (lambda i: orders.remove_item(pick(fx.order_items, i)['order_id'], pick(fx.order_items, i)['menu_item_id']), True, False),
+        'OrderOperations.stream_all': (lambda i: exhaust(orders.stream_all()), False, True),
+        'OrderOperations.stream_order_items': (lambda i: exhaust(orders.stream_order_items()), False, True),
+        'OrderOperations.stream_order_lines': (lambda i: exhaust(orders.stream_order_lines(restaurant_id=pick(fx.restaurant_ids, i))), False, False),
+        'OrderOperations.update': (lambda i: orders.update(pick(fx.order_ids, i), payment_method='UPI'), True, False),
+        'OrderOperations.update_payment_status': (lambda i: orders.update_payment_status(pick(fx.order_ids, i), 'paid'), True, False),
+        'OrderOperations.update_status': (lambda i: orders.update_status(pick(fx.order_ids, i), 'delivered'), True, False),
+        'DeliveryPartnerOperations.create': (lambda i: partners.create(pick(fx.customer_ids, i), 'bike', f"KA-BENCH-{i}"), True, False),
+        'DeliveryPartnerOperations.delete': (lambda i: partners.delete(partner(i)['id']), True, False),
+        'DeliveryPartnerOperations.find_nearest': (lambda i: partners.find_nearest(*location(i)), False, False),
+        'DeliveryPartnerOperations.get_user_ids': (lambda i: partners.get_user_ids([partner(i + n)['id'] for n in range(20)]), False, False),
+        'DeliveryPartnerOperations.increment_deliveries': (lambda i: partners.increment_deliveries(partner(i)['id']), True, False),
+        'DeliveryPartnerOperations.read_all': (lambda i: partners.read_all(), False, True),
+        'DeliveryPartnerOperations.read_by_id': (lambda i: partners.read_by_id(partner(i)['id']), False, False),
+        'DeliveryPartnerOperations.read_online': (lambda i: partners.read_online(), False, True),
+        'DeliveryPartnerOperations.refresh_location_index': (lambda i: partners.refresh_location_index(), False, True),
+        'DeliveryPartnerOperations.update_location': (lambda i: partners.update_location(partner(i)['id'], *location(i)), True, False),
+        'DeliveryPartnerOperations.update_locations': (lambda i: partners.update_locations([dict(zip(('delivery_partner_id', 'latitude', 'longitude'), (partner(i + n)['id'], *location(i + n)))) for n in range(20)]), True, False),
+        'DeliveryPartnerOperations.update_online_status': (lambda i: partners.update_online_status(partner(i)['id'], True), True, False),
+        'DeliveryPartnerOperations.update_rating': (lambda i: partners.update_rating(partner(i)['id'], 4.5), True, False),
+        'CartOperations.add_item': (lambda i: carts.add_item(pick(fx.customer_ids, i), menu_item(i)['id'], 2), True, False),
+        'CartOperations.clear_cart': (lambda i: carts.clear_cart(pick(fx.cart_items, i)['customer_id']), True, False),
+        'CartOperations.get_cart': (lambda i: carts.get_cart(pick(fx.cart_items, i)['customer_id']), False, False),
+        'CartOperations.get_cart_total': (lambda i: carts.get_cart_total(pick(fx.cart_items, i)['customer_id']), False, False),
+        'CartOperations.remove_item': (lambda i: carts.remove_item(pick(fx.cart_items, i)['customer_id'], pick(fx.cart_items, i)['menu_item_id']), True, False),
+        'CartOperations.remove_items': (lambda i: carts.remove_items(pick(fx.cart_items, i)['customer_id'], [pick(fx.cart_items, i)['menu_item_id']]), True, False),
+        'CartOperations.update_quantity': (lambda i: carts.update_quantity(pick(fx.cart_items, i)['customer_id'], pick(fx.cart_items, i)['menu_item_id'], 3), True, False),
+        'CartOperations.upsert_many': (lambda i: carts.upsert_many(pick(fx.customer_ids, i), [{'menu_item_id': menu_item(i + n)['id'], 'quantity': 1} for n in range(5)]), True, False),
+        'RatingOperations.create_item_rating': (lambda i: ratings.create_item_rating(menu_item(i)['id'], pick(fx.customer_ids, i), 4), True, False),
+        'RatingOperations.create_restaurant_rating': (lambda i: ratings.create_restaurant_rating(pick(fx.restaurant_ids, i), pick(fx.customer_ids, i), 4), True, False),
+        'RatingOperations.delete_item_rating': (lambda i: ratings.delete_item_rating(pick(fx.item_ratings, i)['menu_item_id'], pick(fx.item_ratings, i)['customer_id']), True, False),
+        'RatingOperations.delete_restaurant_rating': (lambda i: ratings.delete_restaurant_rating(pick(fx.restaurant_ratings, i)['restaurant_id'], pick(fx.restaurant_ratings, i)['customer_id']), True, False),
+        'RatingOperations.get_item_average_rating': (lambda i: ratings.get_item_average_rating(menu_item(i)['id']), False, False),
+        'RatingOperations.get_item_average_ratings': (lambda i: ratings.get_item_average_ratings(pick(fx.restaurant_ids, i)), False, False),
+        'RatingOperations.get_item_ratings': (lambda i: ratings.get_item_ratings(menu_item(i)['id']), False, False),
+        'RatingOperations.get_restaurant_average_rating': (lambda i: ratings.get_restaurant_average_rating(pick(fx.restaurant_ids, i)), False, False),
+        'RatingOperations.get_restaurant_ratings': (lambda i: ratings.get_restaurant_ratings(pick(fx.restaurant_ids, i)), False, False),
+        'RatingOperations.rebuild_rating_aggregates': (lambda i: ratings.rebuild_rating_aggregates(), True, True),
+        'RatingOperations.upsert_item_ratings': (lambda i: ratings.upsert_item_ratings([{'menu_item_id': menu_item(i + n)['id'], 'customer_id': pick(fx.customer_ids, i), 'rating': 5} for n in range(10)]), True, False),
+        'RatingOperations.upsert_restaurant_ratings': (lambda i: ratings.upsert_restaurant_ratings([{'restaurant_id': pick(fx.restaurant_ids, i + n), 'customer_id': pick(fx.customer_ids, i), 'rating': 5} for n in range(10)]), True, False)
+    }
+
+CASE_NAMES = tuple(_cases({cls.__name__: None for cls in BENCHMARKED_CLASSES}, None))
+
+def _percentile(samples: List[float], fraction: float):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+def uncovered_methods(cases):
+    methods = [f"{cls.__name__}.{name}" for cls in BENCHMARKED_CLASSES for name, _ in inspect.getmembers(cls, inspect.isfunction) if not name.startswith('_')]
+    return sorted(set(methods) - set(cases))
+
+class OperationsBenchmark:
+    def __init__(self, db: DatabaseConnection, iterations: int = 50, heavy_iterations: int = 3, warmup: int = 2, use_cache: bool = False):
+        self.db = db
+        self.iterations = iterations
+        self.heavy_iterations = heavy_iterations
+        self.warmup = warmup
+        self.use_cache = use_cache
+        self.ops = {cls.__name__: cls(db) for cls in BENCHMARKED_CLASSES}
+    
+    def _call(self, call, i: int, writes: bool):
+        if not self.use_cache:
+            self.db.cache.clear()
+        start = time.perf_counter()
+        if not writes:
+            call(i)
+            return (time.perf_counter() - start) * 1000
+        try:
+            with self.db.transaction():
+                call(i)
+                raise _Rollback()
+        except _Rollback:
+            pass
+        elapsed = (time.perf_counter() - start) * 1000
+        self.db.cache.clear()
+        self.db.partner_locations.invalidate()
+        return elapsed
+    
+    def run_case(self, call, writes: bool, heavy: bool):
+        for i in range(self.warmup if not heavy else 0):
+            self._call(call, i, writes)
+        self.db.query_stats.reset()
+        iterations = self.heavy_iterations if heavy else self.iterations
+        samples = [self._call(call, i, writes) for i in range(iterations)]
+        statements = self.db.query_stats.summary()
+        return {
+            'iterations': iterations,
+            'mean_ms': round(sum(samples) / len(samples), 3),
+            'p50_ms': round(_percentile(samples, 0.50), 3),
+            'p95_ms': round(_percentile(samples, 0.95), 3),
+            'p99_ms': round(_percentile(samples, 0.99), 3),
+            'queries_per_call': round(sum(entry['calls'] for entry in statements) / iterations, 2),
+            'rows_per_call': round(sum(entry['rows'] for entry in statements) / iterations, 2),
+            'errors': sum(entry['errors'] for entry in statements)
+        }
+    
+    def run(self, only: List[str] = None, include_heavy: bool = True):
+        fixtures = Fixtures(self.db)
+        if not fixtures.is_complete():
+            raise RuntimeError("Benchmark database is missing rows in one or more tables; load data with sql.data_generator first")
+        cases = _cases(self.ops, fixtures)
+        results = {}
+        for name, (call, writes, heavy) in cases.items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            if heavy and not include_heavy:
+                continue
+            try:
+                results[name] = self.run_case(call, writes, heavy)
+            except Exception as e:
+                logger.exception("Benchmark %s failed", name)
+                results[name] = {'error': str(e)}
+                continue
+            logger.info("%-55s p50 %8.2f ms  p95 %8.2f ms  %5.1f queries  %8.1f rows", name, results[name]['p50_ms'], results[name]['p95_ms'], results[name]['queries_per_call'], results[name]['rows_per_call'])
+        return results
+
+def reset_database(db: DatabaseConnection):
+    with db.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SET SESSION foreign_key_checks = 0")
+            try:
+                for table in TABLES:
+                    cursor.execute(f"TRUNCATE TABLE {table}")
+            finally:
+                cursor.execute("SET SESSION foreign_key_checks = 1")
+    db.cache.clear()
+    db.partner_locations.invalidate()
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2, min_delta_ms: float = 0.5):
+    regressions = []
+    for size, cases in results['sizes'].items():
+        for name, current in cases.items():
+            previous = baseline.get('sizes', {}).get(size, {}).get(name)
+            if not previous or 'error' in previous or 'error' in current:
+                continue
+            delta = current['p95_ms'] - previous['p95_ms']
+            if delta > min_delta_ms and current['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+                regressions.append({'size': size, 'case': name, 'metric': 'p95_ms', 'baseline': previous['p95_ms'], 'current': current['p95_ms']})
+            for metric in ('queries_per_call', 'rows_per_call'):
+                if current[metric] > previous[metric] * (1 + tolerance) and current[metric] - previous[metric] >= 1:
+                    regressions.append({'size': size, 'case': name, 'metric': metric, 'baseline': previous[metric], 'current': current[metric]})
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every public Operations method against a local MySQL")
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')))
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'))
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''))
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'food_delivery_bench'))
+    parser.add_argument('--sizes', help="Comma-separated order counts; each size TRUNCATES every table and loads a fresh generated dataset")
+    parser.add_argument('--reset-database', action='store_true', help="Confirm that --sizes may truncate every table in --database")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--heavy-iterations', type=int, default=3)
+    parser.add_argument('--skip-heavy', action='store_true')
+    parser.add_argument('--cache', action='store_true', help="Keep the query cache warm instead of clearing it before every call")
+    parser.add_argument('--only', help="Comma-separated case name prefixes, e.g. OrderOperations,CartOperations.get_cart")
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help="Earlier results file to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+    if args.sizes and not args.reset_database:
+        parser.error(f"--sizes truncates every table in {args.database}; pass --reset-database to confirm")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    
+    db = DatabaseConnection(args.host, args.user, args.password, args.database, args.port, slow_query_ms=float('inf'))
+    benchmark = OperationsBenchmark(db, iterations=args.iterations, heavy_iterations=args.heavy_iterations, use_cache=args.cache)
+    only = args.only.split(',') if args.only else None
+    results = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'settings': {'iterations': args.iterations, 'heavy_iterations': args.heavy_iterations, 'cache': args.cache, 'seed': args.seed},
+        'sizes': {}
+    }
+    try:
+        for size in (args.sizes.split(',') if args.sizes else [None]):
+            label = 'existing' if size is None else f"{int(size)}_orders"
+            if size is not None:
+                reset_database(db)
+                DatasetGenerator(seed=args.seed, orders=int(size)).load(db)
+            logger.info("Running benchmarks on %s", label)
+            results['sizes'][label] = benchmark.run(only=only, include_heavy=not args.skip_heavy)
+    finally:
+        db.close()
+    results['uncovered_methods'] = uncovered_methods(CASE_NAMES)
+    for name in results['uncovered_methods']:
+        logger.warning("No benchmark case for %s", name)
+    
+    with open(args.output, 'w') as handle:
+        json.dump(results, handle, indent=2)
+    print(f"Results written to {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION [{regression['size']}] {regression['case']} {regression['metric']}: {regression['baseline']} -> {regression['current']}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+import argparse
+import json
+import logging
+import os
+import time
+from typing import Dict, Any, List
+
+import pandas as pd
+
+from sql.db_operations import DatabaseConnection
+from sql.bulk_loading import BulkLoader, write_tsv
+
+logger = logging.getLogger(__name__)
+
+ENTITIES = ('users', 'restaurants', 'menu_items')
+
+USER_ROLES = ('system_admin', 'restaurant_admin', 'customer', 'delivery_partner')
+
+BOOLEAN_VALUES = {'1': True, 'true': True, 't': True, 'yes': True, 'y': True, '0': False, 'false': False, 'f': False, 'no': False, 'n': False}
+
+EMAIL_PATTERN = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+
+# entity -> (table, [(column, kind, required, limit, default)]); limit is max length for strings and (low, high) for numbers
+SPECS = {
+    'users': ('Users', [
+        ('username', 'str', True, 50, None),
+        ('password', 'str', True, 255, None),
+        ('email', 'email', True, 100, None),
+        ('phone', 'str', False, 20, None),
+        ('address', 'str', False, None, None),
+        ('role', 'role', False, None, 'customer')
+    ]),
+    'restaurants': ('Restaurants', [
+        ('name', 'str', True, 100, None),
+        ('address', 'str', True, None, None),
+        ('phone', 'str', False, 20, None),
+        ('email', 'email', False, 100, None),
+        ('cuisine_type', 'str', False, 50, None),
+        ('opening_hours', 'str', False, 100, None),
+        ('is_active', 'bool', False, None, True),
+        ('admin_id', 'int', False, (1, None), None),
+        ('latitude', 'float', False, (-90, 90), None),
+        ('longitude', 'float', False, (-180, 180), None)
+    ]),
+    'menu_items': ('MenuItems', [
+        ('restaurant_id', 'int', False, (1, None), None),
+        ('name', 'str', True, 100, None),
+        ('description', 'str', False, None, None),
+        ('price', 'float', True, (0, 99999999.99), None),
+        ('category', 'str', False, 50, None),
+        ('is_vegetarian', 'bool', False, None, True),
+        ('is_available', 'bool', False, None, True),
+        ('preparation_time', 'int', False, (1, 600), 15),
+        ('image_url', 'str', False, 255, None)
+    ])
+}
+
+class ImportFileError(Exception):
+    pass
+
+def read_frame(source, filename: str = None):
+    name = (filename or str(source)).lower()
+    if name.endswith('.csv'):
+        return pd.read_csv(source, dtype=str, keep_default_na=False)
+    if name.endswith(('.parquet', '.pq')):
+        return pd.read_parquet(source)
+    raise ImportFileError(f"Unsupported file type for {filename or source}; expected .csv or .parquet")
+
+def _values(series: pd.Series):
+    return [None if pd.isna(value) else value for value in series.tolist()]
+
+def _lookup(db: DatabaseConnection, query: str, values: List[Any], chunk_size: int = 1000):
+    rows = []
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        rows.extend(db.execute_query(query.format(placeholders=', '.join(['%s'] * len(chunk))), tuple(chunk), fetch=True))
+    return rows
+
+class FrameValidator:
+    def __init__(self, frame: pd.DataFrame, max_errors: int = 1000):
+        self.frame = frame.rename(columns=lambda column: str(column).strip().lower())
+        self.max_errors = max_errors
+        self.invalid = pd.Series(False, index=self.frame.index)
+        self.errors = []
+        self.error_count = 0
+        self.clean = pd.DataFrame(index=self.frame.index)
+    
+    def fail(self, mask: pd.Series, column: str, message: str, values: pd.Series = None):
+        mask = mask.fillna(False).astype(bool)
+        failed = int(mask.sum())
+        if not failed:
+            return
+        self.invalid |= mask
+        self.error_count += failed
+        values = self.frame[column] if values is None and column in self.frame else values
+        for row in self.frame.index[mask][:max(0, self.max_errors - len(self.errors))]:
+            self.errors.append({'row': int(row) + 1, 'column': column, 'message': message, 'value': None if values is None or pd.isna(values[row]) else str(values[row])})
+    
+    def text(self, column: str):
+        if column not in self.frame:
+            return pd.Series(pd.NA, index=self.frame.index, dtype='string')
+        text = self.frame[column].astype('string').str.strip()
+        return text.mask(text == '')
+    
+    def column(self, column: str, kind: str, required: bool, limit, default):
+        text = self.text(column)
+        if required:
+            self.fail(text.isna(), column, "is required")
+        if kind in ('str', 'email', 'role'):
+            value = text
+            if isinstance(limit, int):
+                self.fail(value.str.len() > limit, column, f"is longer than {limit} characters")
+            if kind == 'email':
+                self.fail(value.notna() & ~value.str.match(EMAIL_PATTERN).fillna(False), column, "is not a valid email address")
+            if kind == 'role':
+                value = value.str.lower()
+                self.fail(value.notna() & ~value.isin(USER_ROLES), column, f"must be one of {', '.join(USER_ROLES)}")
+        elif kind == 'bool':
+            value = text.str.lower().map(BOOLEAN_VALUES)
+            self.fail(text.notna() & value.isna(), column, "is not a boolean")
+        else:
+            value = pd.to_numeric(text, errors='coerce')
+            self.fail(text.notna() & value.isna(), column, "is not a number")
+            if kind == 'int':
+                self.fail(value.notna() & (value % 1 != 0), column, "is not a whole number")
+            low, high = limit
+            if low is not None:
+                self.fail(value < low, column, f"must be at least {low}")
+            if high is not None:
+                self.fail(value > high, column, f"must be at most {high}")
+            if kind == 'int':
+                value = value.where(value % 1 == 0).astype('Int64')
+        if default is not None:
+            value = value.where(value.notna(), default)
+        self.clean[column] = value
+        return value
+    
+    def unique(self, column: str, existing: set):
+        folded = self.clean[column].str.casefold()
+        self.fail(folded.notna() & folded.duplicated(keep='first'), column, "is duplicated in the file")
+        self.fail(folded.isin(existing), column, "already exists")
+
+class BulkImporter:
+    def __init__(self, db: DatabaseConnection, method: str = 'insert', batch_size: int = 5000, dry_run: bool = False, strict: bool = False, max_errors: int = 1000):
+        if method not in ('infile', 'insert'):
+            raise ValueError(f"Unknown load method: {method}")
+        self.db = db
+        self.method = method
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.strict = strict
+        self.max_errors = max_errors
+    
+    def _validate_users(self, validator: FrameValidator, pending: Dict[str, set]):
+        usernames = validator.clean['username'].dropna().unique().tolist()
+        emails = validator.clean['email'].dropna().unique().tolist()
+        validator.unique('username', {row['username'].casefold() for row in _lookup(self.db, "SELECT username FROM Users WHERE username IN ({placeholders})", usernames)})
+        validator.unique('email', {row['email'].casefold() for row in _lookup(self.db, "SELECT email FROM Users WHERE email IN ({placeholders})", emails)})
+        admins = validator.clean['role'] == 'restaurant_admin'
+        pending['admins'] = set(validator.clean['username'][admins & ~validator.invalid].str.casefold())
+    
+    def _validate_restaurants(self, validator: FrameValidator, pending: Dict[str, set]):
+        admin_ids = validator.clean['admin_id']
+        usernames = validator.text('admin_username')
+        validator.fail(admin_ids.isna() & usernames.isna(), 'admin_id', "admin_id or admin_username is required")
+        given_ids = [int(value) for value in admin_ids.dropna().unique()]
+        admins = {row['id'] for row in _lookup(self.db, "SELECT id FROM Users WHERE role = 'restaurant_admin' AND id IN ({placeholders})", given_ids)}
+        validator.fail(admin_ids.notna() & ~admin_ids.isin(admins), 'admin_id', "is not a restaurant_admin user")
+        names = usernames.str.casefold()
+        found = {row['username'].casefold(): (row['id'], row['role']) for row in _lookup(self.db, "SELECT id, username, role FROM Users WHERE username IN ({placeholders})", usernames.dropna().unique().tolist())}
+        resolved = names.map(lambda name: found[name][0] if name in found and found[name][1] == 'restaurant_admin' else None, na_action='ignore')
+        awaiting = names.isin(pending.get('admins', set()))
+        validator.fail(admin_ids.isna() & names.notna() & resolved.isna() & ~awaiting, 'admin_username', "is not a known restaurant_admin", usernames)
+        validator.clean['admin_id'] = admin_ids.where(admin_ids.notna(), resolved).astype('Int64')
+        pending['restaurants'] = set(validator.clean['name'][~validator.invalid].str.casefold())
+    
+    def _validate_menu_items(self, validator: FrameValidator, pending: Dict[str, set]):
+        restaurant_ids = validator.clean['restaurant_id']
+        names = validator.text('restaurant_name')
+        validator.fail(restaurant_ids.isna() & names.isna(), 'restaurant_id', "restaurant_id or restaurant_name is required")
+        given_ids = [int(value) for value in restaurant_ids.dropna().unique()]
+        restaurants = {row['id'] for row in _lookup(self.db, "SELECT id FROM Restaurants WHERE id IN ({placeholders})", given_ids)}
+        validator.fail(restaurant_ids.notna() & ~restaurant_ids.isin(restaurants), 'restaurant_id', "does not exist")
+        matches = {}
+        for row in _lookup(self.db, "SELECT id, name FROM Restaurants WHERE name IN ({placeholders})", names.dropna().unique().tolist()):
+            matches.setdefault(row['name'].casefold(), []).append(row['id'])
+        folded = names.str.casefold()
+        by_name = folded.map(lambda name: len(matches.get(name, ())), na_action='ignore')
+        by_id = restaurant_ids.isna() & names.notna()
+        awaiting = folded.isin(pending.get('restaurants', set()))
+        validator.fail(by_id & (by_name == 0) & ~awaiting, 'restaurant_name', "is not a known restaurant", names)
+        validator.fail(by_id & (by_name > 1), 'restaurant_name', "matches several restaurants; give restaurant_id instead", names)
+        resolved = folded.map(lambda name: matches[name][0] if len(matches.get(name, ())) == 1 else None, na_action='ignore')
+        validator.clean['restaurant_id'] = restaurant_ids.where(restaurant_ids.notna(), resolved).astype('Int64')
+    
+    def validate(self, entity: str, frame: pd.DataFrame, pending: Dict[str, set] = None):
+        table, columns = SPECS[entity]
+        validator = FrameValidator(frame, self.max_errors)
+        for column, kind, required, limit, default in columns:
+            validator.column(column, kind, required, limit, default)
+        getattr(self, f"_validate_{entity}")(validator, pending if pending is not None else {})
+        unknown = sorted(set(validator.frame.columns) - {column for column, *_ in columns} - {'admin_username', 'restaurant_name'})
+        return validator, unknown
+    
+    def _load(self, loader: BulkLoader, table: str, columns: List[str], rows: List[tuple]):
+        batches = []
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            began = time.perf_counter()
+            report = {'batch': len(batches) + 1, 'first_row': start + 1, 'rows': len(batch), 'loaded': 0, 'error': None}
+            try:
+                if self.method == 'infile':
+                    report['loaded'] = loader.load_file(table, columns, write_tsv(batch), len(batch))
+                    if report['loaded'] < len(batch):
+                        report['error'] = "; ".join(loader.warnings()) or "some rows were skipped by the server"
+                else:
+                    report['loaded'] = loader.load(table, columns, batch)
+            except Exception as e:
+                loader.rollback()
+                report['error'] = str(e)
+                logger.warning("%s batch %d failed: %s", table, report['batch'], e)
+            report['seconds'] = round(time.perf_counter() - began, 3)
+            batches.append(report)
+        return batches
+    
+    def import_frames(self, frames: Dict[str, pd.DataFrame]):
+        unknown_entities = set(frames) - set(ENTITIES)
+        if unknown_entities:
+            raise ImportFileError(f"Unknown entities: {', '.join(sorted(unknown_entities))}")
+        report = {'dry_run': self.dry_run, 'method': self.method, 'entities': {}}
+        pending = {}
+        loader = None if self.dry_run else BulkLoader(self.db.config, self.method, skip_checks=False)
+        try:
+            for entity in ENTITIES:
+                if entity not in frames:
+                    continue
+                began = time.perf_counter()
+                table, columns = SPECS[entity]
+                validator, unknown = self.validate(entity, frames[entity], pending if self.dry_run else {})
+                valid = validator.clean[~validator.invalid]
+                entity_report = {
+                    'table': table,
+                    'rows': len(validator.frame),
+                    'valid': len(valid),
+                    'invalid': int(validator.invalid.sum()),
+                    'error_count': validator.error_count,
+                    'errors': sorted(validator.errors, key=lambda error: error['row']),
+                    'ignored_columns': unknown,
+                    'loaded': 0,
+                    'batches': []
+                }
+                report['entities'][entity] = entity_report
+                if self.strict and validator.error_count:
+                    entity_report['skipped'] = "strict mode: fix the errors and import again"
+                    break
+                if loader is not None:
+                    column_names = [column for column, *_ in columns]
+                    rows = list(zip(*(_values(valid[column]) for column in column_names)))
+                    entity_report['batches'] = self._load(loader, table, column_names, rows)
+                    entity_report['loaded'] = sum(batch['loaded'] for batch in entity_report['batches'])
+                entity_report['seconds'] = round(time.perf_counter() - began, 3)
+                logger.info("%s: %d rows, %d invalid, %d loaded in %.2fs", table, entity_report['rows'], entity_report['invalid'], entity_report['loaded'], entity_report['seconds'])
+        finally:
+            if loader is not None:
+                loader.close()
+                self.db.cache.clear()
+        return report
+    
+    def import_files(self, paths: Dict[str, str]):
+        return self.import_frames({entity: read_frame(path) for entity, path in paths.items()})
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import users, restaurants and menu items from CSV or Parquet files")
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')))
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'))
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''))
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'food_delivery'))
+    parser.add_argument('--users', help="Users file: username, password, email, phone, address, role")
+    parser.add_argument('--restaurants', help="Restaurants file: name, address, admin_username or admin_id, phone, email, cuisine_type, opening_hours, is_active, latitude, longitude")
+    parser.add_argument('--menu-items', help="Menu items file: restaurant_name or restaurant_id, name, price, description, category, is_vegetarian, is_available, preparation_time, image_url")
+    parser.add_argument('--method', choices=['insert', 'infile'], default='insert')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--dry-run', action='store_true', help="Validate and resolve references without writing anything")
+    parser.add_argument('--strict', action='store_true', help="Stop before loading an entity that has any invalid rows")
+    parser.add_argument('--report', help="Write the full import report as JSON")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    
+    paths = {entity: path for entity, path in (('users', args.users), ('restaurants', args.restaurants), ('menu_items', args.menu_items)) if path}
+    if not paths:
+        parser.error("give at least one of --users, --restaurants or --menu-items")
+    db = DatabaseConnection(args.host, args.user, args.password, args.database, args.port)
+    try:
+        report = BulkImporter(db, args.method, args.batch_size, args.dry_run, args.strict).import_files(paths)
+    finally:
+        db.close()
+    
+    for entity, result in report['entities'].items():
+        print(f"{entity}: {result['rows']} rows, {result['valid']} valid, {result['invalid']} invalid, {result['loaded']} loaded")
+        for error in result['errors'][:20]:
+            print(f"  row {error['row']}: {error['column']} {error['message']} ({error['value']})")
+        if result['error_count'] > 20:
+            print(f"  ... {result['error_count'] - 20} more errors")
+        for batch in result['batches']:
+            if batch['error']:
+                print(f"  batch {batch['batch']} (rows {batch['first_row']}-{batch['first_row'] + batch['rows'] - 1}): {batch['error']}")
+    if args.report:
+        with open(args.report, 'w') as handle:
+            json.dump(report, handle, indent=2, default=str)
+        print(f"Report written to {args.report}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+from typing import Dict, Any, List
+
+import pymysql
+
+def format_tsv_value(value):
+    if value is None:
+        return '\\N'
+    if value is True or value is False:
+        return '1' if value else '0'
+    if value.__class__ is str:
+        if '\\' in value or '\t' in value or '\n' in value:
+            return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+        return value
+    return str(value)
+
+def write_tsv(rows: List[tuple]):
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', encoding='utf-8', delete=False) as handle:
+        handle.writelines("\t".join(map(format_tsv_value, row)) + "\n" for row in rows)
+    return handle.name
+
+class BulkLoader:
+    def __init__(self, config: Dict[str, Any], method: str = 'infile', skip_checks: bool = True):
+        if method not in ('infile', 'insert'):
+            raise ValueError(f"Unknown load method: {method}")
+        self.method = method
+        self.conn = pymysql.connect(**dict(config, autocommit=False, read_timeout=None, write_timeout=None, local_infile=method == 'infile', cursorclass=pymysql.cursors.Cursor))
+        self.rows_loaded = {}
+        if skip_checks:
+            with self.conn.cursor() as cursor:
+                cursor.execute("SET SESSION foreign_key_checks = 0")
+                cursor.execute("SET SESSION unique_checks = 0")
+    
+    def scalar(self, query: str, params: tuple = None):
+        with self.conn.cursor() as cursor:
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+        self.conn.commit()
+        return row[0] if row else None
+    
+    def load(self, table: str, columns: List[str], rows: List[tuple]):
+        if not rows:
+            return 0
+        if self.method == 'infile':
+            return self.load_file(table, columns, write_tsv(rows), len(rows))
+        with self.conn.cursor() as cursor:
+            loaded = cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})", rows)
+        self.conn.commit()
+        self.rows_loaded[table] = self.rows_loaded.get(table, 0) + loaded
+        return loaded
+    
+    def load_file(self, table: str, columns: List[str], path: str, row_count: int):
+        loaded = 0
+        try:
+            if row_count:
+                with self.conn.cursor() as cursor:
+                    loaded = cursor.execute(f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 ({', '.join(columns)})", (path,))
+                self.conn.commit()
+        finally:
+            os.unlink(path)
+        self.rows_loaded[table] = self.rows_loaded.get(table, 0) + loaded
+        return loaded
+    
+    def warnings(self, limit: int = 5):
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"SHOW WARNINGS LIMIT {int(limit)}")
+            return [row[2] for row in cursor.fetchall()]
+    
+    def rollback(self):
+        self.conn.rollback()
+    
+    def execute(self, query: str, params: tuple = None):
+        with self.conn.cursor() as cursor:
+            rowcount = cursor.execute(query, params)
+        self.conn.commit()
+        return rowcount
+    
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,383 @@
+import argparse
+import itertools
+import logging
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from sql.bulk_loading import BulkLoader, write_tsv
+from sql.db_operations import DatabaseConnection, SalesRollupOperations
+
+logger = logging.getLogger(__name__)
+
+CITY_CENTER = (12.9716, 77.5946)
+CITY_SPREAD = 0.15
+
+STREETS = ['MG Road', 'Brigade Road', 'Indiranagar', 'Koramangala', 'Jayanagar', 'Whitefield', 'HSR Layout', 'Malleshwaram', 'BTM Layout', 'Hebbal', 'Electronic City', 'Banashankari']
+
+CUISINES = {
+    'South Indian': [('Masala Dosa', 'Main Course', True), ('Idli Sambar', 'Breakfast', True), ('Medu Vada', 'Breakfast', True), ('Rava Dosa', 'Main Course', True), ('Filter Coffee', 'Beverage', True), ('Curd Rice', 'Main Course', True)],
+    'North Indian': [('Paneer Butter Masala', 'Main Course', True), ('Butter Chicken', 'Main Course', False), ('Dal Makhani', 'Main Course', True), ('Garlic Naan', 'Side', True), ('Chicken Tikka', 'Starter', False), ('Gulab Jamun', 'Dessert', True)],
+    'Chinese': [('Veg Hakka Noodles', 'Main Course', True), ('Chicken Manchurian', 'Starter', False), ('Fried Rice', 'Main Course', True), ('Spring Rolls', 'Appetizer', True), ('Chilli Chicken', 'Starter', False), ('Hot and Sour Soup', 'Appetizer', True)],
+    'Pizza': [('Margherita Pizza', 'Main Course', True), ('Pepperoni Pizza', 'Main Course', False), ('Farmhouse Pizza', 'Main Course', True), ('Garlic Bread', 'Side', True), ('Choco Lava Cake', 'Dessert', True), ('Cold Drink', 'Beverage', True)],
+    'Fast Food': [('Veg Burger', 'Main Course', True), ('Chicken Burger', 'Main Course', False), ('French Fries', 'Side', True), ('Chicken Wings', 'Starter', False), ('Milkshake', 'Beverage', True), ('Sundae', 'Dessert', True)],
+    'Biryani': [('Chicken Biryani', 'Main Course', False), ('Mutton Biryani', 'Main Course', False), ('Veg Biryani', 'Main Course', True), ('Raita', 'Side', True), ('Chicken 65', 'Starter', False), ('Double Ka Meetha', 'Dessert', True)]
+}
+
+DISH_VARIANTS = ['', 'Special ', 'Classic ', 'Spicy ', 'Family ', 'Mini ']
+
+REVIEWS = [None, None, None, 'Great food!', 'Delivered hot and fresh', 'Portion could be bigger', 'Will order again', 'Too spicy for me', 'Value for money']
+
+# Orders by hour of day, peaking at lunch and dinner
+HOUR_WEIGHTS = [1, 0.5, 0.3, 0.2, 0.2, 0.3, 1, 2, 4, 5, 5, 7, 12, 13, 9, 5, 4, 5, 8, 13, 15, 13, 8, 3]
+
+PAYMENT_METHODS = ['UPI', 'Credit Card', 'Debit Card', 'Cash', 'Net Banking']
+PAYMENT_WEIGHTS = [40, 22, 13, 20, 5]
+
+def _cumulative(weights):
+    return list(itertools.accumulate(weights))
+
+_worker_generator = None
+
+def _init_worker(generator):
+    global _worker_generator
+    _worker_generator = generator
+
+def _order_chunk_files(chunk: tuple):
+    return [(write_tsv(rows), len(rows)) for rows in _worker_generator.orders_chunk(*chunk)]
+
+class DatasetGenerator:
+    ORDER_TABLES = (
+        ('Orders', ['id', 'customer_id', 'restaurant_id', 'delivery_address', 'total_amount', 'status', 'payment_status', 'payment_method', 'delivery_partner_id', 'estimated_delivery_time', 'actual_delivery_time', 'created_at', 'updated_at']),
+        ('OrderItems', ['order_id', 'menu_item_id', 'quantity', 'price_per_item', 'subtotal']),
+        ('DeliveryTracking', ['order_id', 'delivery_partner_id', 'latitude', 'longitude', 'status', 'timestamp'])
+    )
+    
+    def __init__(self, seed: int = 42, orders: int = 100000, customers: int = None, restaurants: int = None, delivery_partners: int = None, items_per_restaurant: int = 24, days: int = 365, ratings_per_customer: int = 2, cart_fraction: float = 0.05, tracked_fraction: float = 0.02, tracking_points: int = 6, chunk_size: int = 50000, workers: int = None, now: datetime = None):
+        self.seed = seed
+        self.orders = orders
+        self.customers = customers or max(10, orders // 10)
+        self.restaurants = restaurants or max(5, orders // 500)
+        self.delivery_partners = delivery_partners or max(3, orders // 2000)
+        self.items_per_restaurant = items_per_restaurant
+        self.days = days
+        self.ratings_per_customer = ratings_per_customer
+        self.cart_fraction = cart_fraction
+        self.tracked_fraction = tracked_fraction
+        self.tracking_points = tracking_points
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self.now = (now or datetime.now()).replace(microsecond=0)
+        self.base = {}
+        self._restaurant_cw = _cumulative(1 / (rank + 1) ** 0.8 for rank in range(self.restaurants))
+        self._customer_cw = _cumulative(1 / (rank + 1) ** 0.5 for rank in range(self.customers))
+        self._hour_cw = _cumulative(HOUR_WEIGHTS)
+        self._day_cw = _cumulative(
+            (1 + (self.days - day) / self.days) * (1.25 if (self.now - timedelta(days=day)).weekday() >= 4 else 1.0)
+            for day in range(self.days)
+        )
+        self._restaurant_locations = []
+        self._prices = []
+    
+    def _rng(self, *scope):
+        return random.Random(":".join(map(str, (self.seed,) + scope)))
+    
+    def _location(self, rng: random.Random, center=CITY_CENTER, spread: float = CITY_SPREAD):
+        return round(center[0] + rng.uniform(-spread, spread), 8), round(center[1] + rng.uniform(-spread, spread), 8)
+    
+    def _address(self, index: int):
+        return f"{index % 900 + 1} {STREETS[index % len(STREETS)]}, Bangalore"
+    
+    def _chunks(self, total: int):
+        for index, start in enumerate(range(0, total, self.chunk_size)):
+            yield index, start, min(self.chunk_size, total - start)
+    
+    def _admin_id(self, restaurant_index: int):
+        return self.base['Users'] + 2 + restaurant_index
+    
+    def _customer_id(self, customer_index: int):
+        return self.base['Users'] + 2 + self.restaurants + customer_index
+    
+    def _partner_user_id(self, partner_index: int):
+        return self.base['Users'] + 2 + self.restaurants + self.customers + partner_index
+    
+    def _restaurant_id(self, restaurant_index: int):
+        return self.base['Restaurants'] + 1 + restaurant_index
+    
+    def _menu_item_id(self, restaurant_index: int, item_index: int):
+        return self.base['MenuItems'] + 1 + restaurant_index * self.items_per_restaurant + item_index
+    
+    def _partner_id(self, partner_index: int):
+        return self.base['DeliveryPartners'] + 1 + partner_index
+    
+    def users(self):
+        columns = ['id', 'username', 'password', 'email', 'phone', 'address', 'role']
+        base = self.base['Users']
+        rows = [(base + 1, f"sysadmin_{base + 1}", 'admin123', f"sysadmin_{base + 1}@example.com", '9000000000', self._address(0), 'system_admin')]
+        groups = (('restaurant_admin', 'rest123', self.restaurants, self._admin_id), ('customer', 'cust123', self.customers, self._customer_id), ('delivery_partner', 'del123', self.delivery_partners, self._partner_user_id))
+        for role, password, count, user_id in groups:
+            for index in range(count):
+                uid = user_id(index)
+                rows.append((uid, f"{role}_{uid}", password, f"{role}_{uid}@example.com", f"9{uid % 1000000000:09d}", self._address(uid), role))
+                if len(rows) >= self.chunk_size:
+                    yield columns, rows
+                    rows = []
+        yield columns, rows
+    
+    def restaurants_and_menus(self):
+        rng = self._rng('restaurants')
+        cuisines = list(CUISINES)
+        restaurant_rows = []
+        item_rows = []
+        for index in range(self.restaurants):
+            cuisine = rng.choice(cuisines)
+            latitude, longitude = self._location(rng)
+            self._restaurant_locations.append((latitude, longitude))
+            open_hour = rng.choice([7, 8, 10, 11])
+            restaurant_rows.append((
+                self._restaurant_id(index), f"{STREETS[index % len(STREETS)]} {cuisine} House {index + 1}", self._address(index),
+                f"080{index % 10000000:07d}", f"restaurant_{index + 1}@example.com", cuisine,
+                f"{open_hour:02d}:00 AM - 11:00 PM", rng.random() > 0.05, self._admin_id(index), latitude, longitude
+            ))
+            dishes = CUISINES[cuisine]
+            for item_index in range(self.items_per_restaurant):
+                name, category, is_vegetarian = dishes[item_index % len(dishes)]
+                variant = DISH_VARIANTS[(item_index // len(dishes)) % len(DISH_VARIANTS)]
+                price = float(rng.randrange(60, 480, 10))
+                self._prices.append(price)
+                item_rows.append((
+                    self._menu_item_id(index, item_index), self._restaurant_id(index), f"{variant}{name}", f"{variant}{name} from our {cuisine.lower()} kitchen",
+                    price, category, is_vegetarian, rng.random() > 0.03, rng.choice([10, 15, 20, 25, 30])
+                ))
+        yield 'Restaurants', ['id', 'name', 'address', 'phone', 'email', 'cuisine_type', 'opening_hours', 'is_active', 'admin_id', 'latitude', 'longitude'], restaurant_rows
+        for start in range(0, len(item_rows), self.chunk_size):
+            yield 'MenuItems', ['id', 'restaurant_id', 'name', 'description', 'price', 'category', 'is_vegetarian', 'is_available', 'preparation_time'], item_rows[start:start + self.chunk_size]
+    
+    def partners(self):
+        rng = self._rng('partners')
+        rows = []
+        for index in range(self.delivery_partners):
+            latitude, longitude = self._location(rng)
+            rows.append((
+                self._partner_id(index), self._partner_user_id(index), rng.choices(['bike', 'car', 'bicycle'], weights=[70, 10, 20])[0],
+                f"KA-{rng.randint(1, 60):02d}-{rng.choice('ABCDEFGHJK')}{rng.choice('ABCDEFGHJK')}-{rng.randint(1000, 9999)}", f"DL{rng.randint(10 ** 9, 10 ** 10 - 1)}",
+                rng.random() < 0.3, latitude, longitude, round(rng.uniform(3.5, 5.0), 2)
+            ))
+        return ['id', 'user_id', 'vehicle_type', 'vehicle_number', 'license_number', 'is_online', 'current_latitude', 'current_longitude', 'rating'], rows
+    
+    def _status(self, rng: random.Random, age_minutes: float):
+        if age_minutes < 15:
+            return rng.choice(['pending', 'confirmed'])
+        if age_minutes < 30:
+            return 'preparing'
+        if age_minutes < 45:
+            return rng.choice(['ready', 'picked_up'])
+        if age_minutes < 90:
+            return rng.choice(['picked_up', 'delivered'])
+        return 'cancelled' if rng.random() < 0.08 else 'delivered'
+    
+    def _payment_status(self, rng: random.Random, status: str, method: str):
+        if status == 'delivered':
+            return 'refunded' if rng.random() < 0.01 else 'paid'
+        if status == 'cancelled':
+            return 'pending' if method == 'Cash' else rng.choice(['refunded', 'failed'])
+        return 'pending' if method == 'Cash' else 'paid'
+    
+    def _track(self, rng: random.Random, order_id: int, restaurant_index: int, partner_user_id: int, picked_up_at: datetime, delivered: bool):
+        start = self._restaurant_locations[restaurant_index]
+        end = self._location(rng, start, 0.03)
+        points = []
+        for step in range(self.tracking_points):
+            fraction = step / max(1, self.tracking_points - 1)
+            status = 'picked_up' if step == 0 else 'delivered' if delivered and step == self.tracking_points - 1 else 'on_the_way'
+            points.append((
+                order_id, partner_user_id,
+                round(start[0] + (end[0] - start[0]) * fraction, 8), round(start[1] + (end[1] - start[1]) * fraction, 8),
+                status, picked_up_at + timedelta(minutes=4 * step)
+            ))
+        return points
+    
+    def orders_chunk(self, index: int, start: int, count: int):
+        rng = self._rng('orders', index)
+        restaurant_indexes = rng.choices(range(self.restaurants), cum_weights=self._restaurant_cw, k=count)
+        customer_indexes = rng.choices(range(self.customers), cum_weights=self._customer_cw, k=count)
+        days_ago = rng.choices(range(self.days), cum_weights=self._day_cw, k=count)
+        hours = rng.choices(range(24), cum_weights=self._hour_cw, k=count)
+        methods = rng.choices(PAYMENT_METHODS, weights=PAYMENT_WEIGHTS, k=count)
+        item_counts = rng.choices((1, 2, 3, 4, 5), weights=(35, 30, 18, 10, 7), k=count)
+        quantities = rng.choices((1, 2, 3), weights=(70, 22, 8), k=count * 5)
+        quantity_index = 0
+        midnight = self.now.replace(hour=0, minute=0, second=0)
+        ipr = self.items_per_restaurant
+        order_rows = []
+        item_rows = []
+        tracking_rows = []
+        for offset in range(count):
+            order_id = self.base['Orders'] + start + offset + 1
+            restaurant_index = restaurant_indexes[offset]
+            created_at = midnight - timedelta(days=days_ago[offset]) + timedelta(seconds=hours[offset] * 3600 + rng.randrange(3600))
+            if created_at > self.now:
+                created_at -= timedelta(days=1)
+            status = self._status(rng, (self.now - created_at).total_seconds() / 60)
+            method = methods[offset]
+            payment_status = self._payment_status(rng, status, method)
+            partner_index = rng.randrange(self.delivery_partners) if status in ('picked_up', 'delivered') else None
+            delivered_at = created_at + timedelta(minutes=rng.randint(25, 60)) if status == 'delivered' else None
+            total = 0.0
+            for item_index in rng.sample(range(ipr), min(ipr, item_counts[offset])):
+                price = self._prices[restaurant_index * ipr + item_index]
+                quantity = quantities[quantity_index]
+                quantity_index += 1
+                total += price * quantity
+                item_rows.append((order_id, self._menu_item_id(restaurant_index, item_index), quantity, price, price * quantity))
+            order_rows.append((
+                order_id, self._customer_id(customer_indexes[offset]), self._restaurant_id(restaurant_index), self._address(customer_indexes[offset]),
+                round(total, 2), status, payment_status, method,
+                None if partner_index is None else self._partner_user_id(partner_index),
+                created_at + timedelta(minutes=45), delivered_at, created_at, delivered_at or created_at
+            ))
+            if partner_index is not None and (status == 'picked_up' or rng.random() < self.tracked_fraction):
+                tracking_rows.extend(self._track(rng, order_id, restaurant_index, self._partner_user_id(partner_index), created_at + timedelta(minutes=20), status == 'delivered'))
+        return order_rows, item_rows, tracking_rows
+    
+    def ratings(self):
+        rng = self._rng('ratings')
+        restaurant_rows = []
+        item_rows = []
+        ipr = self.items_per_restaurant
+        for customer_index in range(self.customers):
+            rated = set(rng.choices(range(self.restaurants), cum_weights=self._restaurant_cw, k=rng.randint(0, 2 * self.ratings_per_customer)))
+            customer_id = self._customer_id(customer_index)
+            for restaurant_index in rated:
+                restaurant_rows.append((self._restaurant_id(restaurant_index), customer_id, rng.choices((1, 2, 3, 4, 5), weights=(4, 6, 15, 35, 40))[0], rng.choice(REVIEWS)))
+                for item_index in rng.sample(range(ipr), min(ipr, rng.randint(0, 2))):
+                    item_rows.append((self._menu_item_id(restaurant_index, item_index), customer_id, rng.choices((1, 2, 3, 4, 5), weights=(3, 5, 15, 37, 40))[0], rng.choice(REVIEWS)))
+            if len(restaurant_rows) >= self.chunk_size:
+                yield restaurant_rows, item_rows
+                restaurant_rows, item_rows = [], []
+        yield restaurant_rows, item_rows
+    
+    def carts(self):
+        rng = self._rng('carts')
+        ipr = self.items_per_restaurant
+        rows = []
+        for customer_index in range(self.customers):
+            if rng.random() >= self.cart_fraction:
+                continue
+            restaurant_index = rng.choices(range(self.restaurants), cum_weights=self._restaurant_cw)[0]
+            for item_index in rng.sample(range(ipr), min(ipr, rng.randint(1, 3))):
+                rows.append((self._customer_id(customer_index), self._menu_item_id(restaurant_index, item_index), rng.randint(1, 3)))
+        return ['customer_id', 'menu_item_id', 'quantity'], rows
+    
+    def load(self, db: DatabaseConnection, method: str = 'infile', rebuild_rollups: bool = True):
+        loader = BulkLoader(db.config, method)
+        timings = {}
+        try:
+            for table in ('Users', 'Restaurants', 'MenuItems', 'DeliveryPartners', 'Orders'):
+                self.base[table] = loader.scalar(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            
+            def timed(name, started):
+                timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+                logger.info("%s: %d rows in %.1fs", name, loader.rows_loaded.get(name, 0), timings[name])
+            
+            started = time.perf_counter()
+            for columns, rows in self.users():
+                loader.load('Users', columns, rows)
+            timed('Users', started)
+            
+            started = time.perf_counter()
+            for table, columns, rows in self.restaurants_and_menus():
+                loader.load(table, columns, rows)
+            timed('MenuItems', started)
+            
+            started = time.perf_counter()
+            loader.load('DeliveryPartners', *self.partners())
+            timed('DeliveryPartners', started)
+            
+            started = time.perf_counter()
+            if method == 'infile' and self.workers > 1:
+                with ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self,)) as pool:
+                    pending = deque()
+                    for chunk in self._chunks(self.orders):
+                        pending.append(pool.submit(_order_chunk_files, chunk))
+                        if len(pending) > 2 * self.workers:
+                            for (table, columns), (path, row_count) in zip(self.ORDER_TABLES, pending.popleft().result()):
+                                loader.load_file(table, columns, path, row_count)
+                    while pending:
+                        for (table, columns), (path, row_count) in zip(self.ORDER_TABLES, pending.popleft().result()):
+                            loader.load_file(table, columns, path, row_count)
+            else:
+                for chunk in self._chunks(self.orders):
+                    for (table, columns), rows in zip(self.ORDER_TABLES, self.orders_chunk(*chunk)):
+                        loader.load(table, columns, rows)
+            timed('Orders', started)
+            
+            started = time.perf_counter()
+            for restaurant_rows, item_rows in self.ratings():
+                loader.load('RestaurantRatings', ['restaurant_id', 'customer_id', 'rating', 'review'], restaurant_rows)
+                loader.load('ItemRatings', ['menu_item_id', 'customer_id', 'rating', 'review'], item_rows)
+            timed('RestaurantRatings', started)
+            
+            started = time.perf_counter()
+            loader.load('Cart', *self.carts())
+            timed('Cart', started)
+            
+            started = time.perf_counter()
+            loader.execute("""
+                UPDATE DeliveryPartners dp
+                JOIN (SELECT delivery_partner_id, COUNT(*) as deliveries FROM Orders WHERE status = 'delivered' AND id > %s GROUP BY delivery_partner_id) d ON d.delivery_partner_id = dp.user_id
+                SET dp.total_deliveries = dp.total_deliveries + d.deliveries
+            """, (self.base['Orders'],))
+            timed('DeliveryPartners.total_deliveries', started)
+        finally:
+            loader.close()
+        db.cache.clear()
+        db.partner_locations.invalidate()
+        if rebuild_rollups:
+            started = time.perf_counter()
+            rollup_db = db.long_running()
+            try:
+                SalesRollupOperations(rollup_db).rebuild()
+            finally:
+                rollup_db.close()
+            timings['rollups'] = time.perf_counter() - started
+        return {'rows': dict(loader.rows_loaded), 'seconds': timings}
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and bulk-load a synthetic food delivery dataset")
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')))
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'))
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''))
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'food_delivery'))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--orders', type=int, default=100000)
+    parser.add_argument('--customers', type=int)
+    parser.add_argument('--restaurants', type=int)
+    parser.add_argument('--delivery-partners', type=int)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--chunk-size', type=int, default=50000)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--method', choices=['infile', 'insert'], default='infile')
+    parser.add_argument('--skip-rollups', action='store_true')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    
+    generator = DatasetGenerator(
+        seed=args.seed, orders=args.orders, customers=args.customers, restaurants=args.restaurants,
+        delivery_partners=args.delivery_partners, days=args.days, chunk_size=args.chunk_size, workers=args.workers
+    )
+    db = DatabaseConnection(args.host, args.user, args.password, args.database, args.port, pool_size=2)
+    try:
+        result = generator.load(db, method=args.method, rebuild_rollups=not args.skip_rollups)
+    finally:
+        db.close()
+    for table, rows in result['rows'].items():
+        print(f"{table}: {rows} rows")
+    print(f"Total time: {sum(result['seconds'].values()):.1f}s")
+
+if __name__ == '__main__':
+    main()
@@ -1,55 +1,697 @@
+import logging
+import math
 import pymysql
+import re
+import sys
+import threading
+import time
+from pymysql.constants import CLIENT, SERVER_STATUS
 from typing import Optional, List, Dict, Any
+from collections import deque, OrderedDict
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+WRITE_TABLE_PATTERN = re.compile(r"^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)", re.IGNORECASE)
+
+# Tables whose rows change as a side effect of writing the key table (FK cascades, triggers)
+WRITE_SIDE_EFFECTS = {
+    'Users': ('Restaurants', 'MenuItems'),
+    'Restaurants': ('MenuItems',),
+    'RestaurantRatings': ('Restaurants',),
+    'ItemRatings': ('MenuItems',)
+}
+
+_fingerprints = {}
+
+ORDER_STATUSES = ('pending', 'confirmed', 'preparing', 'ready', 'picked_up', 'delivered', 'cancelled')
+
+ORDER_LINE_COLUMNS = ('order_id', 'created_at', 'status', 'payment_status', 'payment_method', 'total_amount', 'customer_id', 'customer_username', 'restaurant_id', 'restaurant_name', 'delivery_partner_id', 'delivery_partner_username', 'delivery_address', 'actual_delivery_time', 'menu_item_id', 'item_name', 'quantity', 'price_per_item', 'subtotal')
+
+def fingerprint_query(query: str):
+    fingerprint = _fingerprints.get(query)
+    if fingerprint is None:
+        fingerprint = re.sub(r"\s+", " ", query).strip()
+        fingerprint = re.sub(r"'(?:[^'\\]|\\.)*'", "?", fingerprint)
+        fingerprint = re.sub(r"\b\d+(?:\.\d+)?\b", "?", fingerprint)
+        fingerprint = fingerprint.replace("%s", "?")
+        fingerprint = re.sub(r"IN \(\?(?:, \?)*\)", "IN (?+)", fingerprint, flags=re.IGNORECASE)
+        if len(_fingerprints) >= 4096:
+            _fingerprints.clear()
+        _fingerprints[query] = fingerprint
+    return fingerprint
+
+def _redact(params):
+    if params is None:
+        return ()
+    if isinstance(params, list):
+        return f"<{len(params)} rows>"
+    return tuple(type(param).__name__ for param in params)
+
+def _operations_caller():
+    frame = sys._getframe(3)
+    while frame is not None:
+        qualname = frame.f_code.co_qualname
+        owner = qualname.split('.', 1)[0]
+        if owner.endswith('Operations') and '.' in qualname:
+            return qualname
+        frame = frame.f_back
+    return 'DatabaseConnection'
+
+def _placeholders(count: int):
+    return ', '.join(['%s'] * count)
+
+def _page(rows: List[Dict[str, Any]], limit: int, key):
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, key(rows[-1])
+    return rows, None
+
+class PoolTimeoutError(Exception):
+    pass
+
+class ConcurrentUpdateError(Exception):
+    pass
+
+def _update_columns(db, table: str, row_id: int, values: Dict[str, Any], expected_version: int = None):
+    assignments = [f"{column} = %s" for column in values] + ["version = version + 1"]
+    params = list(values.values()) + [row_id]
+    where = "id = %s"
+    if expected_version is not None:
+        where += " AND version = %s"
+        params.append(expected_version)
+    updated = db.execute_update(f"UPDATE {table} SET {', '.join(assignments)} WHERE {where}", tuple(params))
+    if not updated and expected_version is not None:
+        if db.execute_query(f"SELECT 1 FROM {table} WHERE id = %s", (row_id,), fetch=True):
+            raise ConcurrentUpdateError(f"{table} row {row_id} was modified since version {expected_version}")
+    return updated > 0
+
+class PooledConnection:
+    __slots__ = ('conn', 'created_at', 'last_used')
+    
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+class ConnectionPool:
+    def __init__(self, config: Dict[str, Any], max_size: int = 10, max_idle: int = None, idle_timeout: float = 300.0, max_lifetime: float = 3600.0, wait_timeout: float = 10.0, ping_after: float = 5.0):
+        self.config = config
+        self.max_size = max_size
+        self.max_idle = max_idle if max_idle is not None else max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.wait_timeout = wait_timeout
+        self.ping_after = ping_after
+        self._idle = deque()
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._counters = {
+            'checkouts': 0,
+            'connections_created': 0,
+            'connections_closed': 0,
+            'handshakes_avoided': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'timeouts': 0,
+            'evicted_idle': 0,
+            'evicted_lifetime': 0,
+            'failed_pings': 0
+        }
+    
+    def _connect(self):
+        conn = pymysql.connect(**self.config)
+        with self._cond:
+            self._counters['connections_created'] += 1
+        return PooledConnection(conn)
+    
+    def _close(self, pooled: PooledConnection):
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._counters['connections_closed'] += 1
+    
+    def _expired(self, pooled: PooledConnection, now: float):
+        if self.max_lifetime and now - pooled.created_at >= self.max_lifetime:
+            return 'evicted_lifetime'
+        if self.idle_timeout and now - pooled.last_used >= self.idle_timeout:
+            return 'evicted_idle'
+        return None
+    
+    def _evict_expired(self, now: float):
+        evicted = []
+        kept = deque()
+        while self._idle:
+            pooled = self._idle.popleft()
+            reason = self._expired(pooled, now)
+            if reason:
+                self._counters[reason] += 1
+                evicted.append(pooled)
+            else:
+                kept.append(pooled)
+        self._idle = kept
+        return evicted
+    
+    def acquire(self, timeout: float = None):
+        timeout = self.wait_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        waited = False
+        pooled = None
+        evicted = []
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError("Connection pool is closed")
+                evicted.extend(self._evict_expired(time.monotonic()))
+                if self._idle:
+                    pooled = self._idle.pop()
+                    self._in_use += 1
+                    self._counters['handshakes_avoided'] += 1
+                    break
+                if self._in_use < self.max_size:
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    raise PoolTimeoutError(f"Timed out after {timeout:.1f}s waiting for a connection ({self.max_size} in use)")
+                waited = True
+                self._cond.wait(remaining)
+            self._counters['checkouts'] += 1
+            if waited:
+                wait_time = time.monotonic() - start
+                self._counters['waits'] += 1
+                self._counters['wait_time_total'] += wait_time
+                self._counters['wait_time_max'] = max(self._counters['wait_time_max'], wait_time)
+        for stale in evicted:
+            self._close(stale)
+        try:
+            if pooled is None:
+                return self._connect()
+            if time.monotonic() - pooled.last_used >= self.ping_after:
+                try:
+                    pooled.conn.ping(reconnect=False)
+                except Exception:
+                    with self._cond:
+                        self._counters['failed_pings'] += 1
+                        self._counters['handshakes_avoided'] -= 1
+                    self._close(pooled)
+                    return self._connect()
+            return pooled
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+    
+    def release(self, pooled: PooledConnection, discard: bool = False):
+        if not discard and pooled.conn.open and pooled.conn.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+            try:
+                pooled.conn.rollback()
+            except Exception:
+                discard = True
+        now = time.monotonic()
+        to_close = []
+        with self._cond:
+            self._in_use -= 1
+            if discard or self._closed or not pooled.conn.open or self._expired(pooled, now) == 'evicted_lifetime':
+                to_close.append(pooled)
+            else:
+                pooled.last_used = now
+                self._idle.append(pooled)
+                while len(self._idle) > self.max_idle:
+                    to_close.append(self._idle.popleft())
+            self._cond.notify()
+        for stale in to_close:
+            self._close(stale)
+    
+    def close(self):
+        with self._cond:
+            self._closed = True
+            to_close = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for pooled in to_close:
+            self._close(pooled)
+    
+    def stats(self):
+        with self._cond:
+            stats = dict(self._counters)
+            stats['in_use'] = self._in_use
+            stats['idle'] = len(self._idle)
+            stats['size'] = self._in_use + len(self._idle)
+            stats['max_size'] = self.max_size
+        stats['wait_time_avg'] = stats['wait_time_total'] / stats['waits'] if stats['waits'] else 0.0
+        return stats
+
+class QueryCache:
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 30.0, table_ttls: Dict[str, float] = None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.table_ttls = dict(table_ttls or {})
+        self._entries = OrderedDict()
+        self._keys_by_table = {}
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+    
+    def _ttl(self, tables: tuple):
+        return min((self.table_ttls.get(table, self.default_ttl) for table in tables), default=self.default_ttl)
+    
+    def _remove(self, key):
+        _, _, tables = self._entries.pop(key)
+        for table in tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters['misses'] += 1
+                return False, None
+            value, expires_at, _ = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self._counters['expirations'] += 1
+                self._counters['misses'] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return True, value
+    
+    def put(self, key, value, tables: tuple):
+        ttl = self._ttl(tables)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, tables)
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._counters['evictions'] += 1
+    
+    def invalidate(self, *tables: str):
+        with self._lock:
+            for table in tables:
+                for key in list(self._keys_by_table.pop(table, ())):
+                    if key in self._entries:
+                        self._remove(key)
+                        self._counters['invalidations'] += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_table.clear()
+    
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+            stats['entries'] = len(self._entries)
+            stats['max_entries'] = self.max_entries
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+class QueryStats:
+    def __init__(self, slow_threshold_ms: float = 200.0, slow_log_size: int = 200):
+        self.slow_threshold_ms = slow_threshold_ms
+        self._statements = {}
+        self._slow = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+    
+    def record(self, query: str, params, elapsed: float, rows: int = 0, error: bool = False):
+        fingerprint = fingerprint_query(query)
+        caller = _operations_caller()
+        duration_ms = elapsed * 1000
+        bucket = next(i for i, bound in enumerate(LATENCY_BUCKETS_MS) if duration_ms <= bound)
+        with self._lock:
+            entry = self._statements.get((caller, fingerprint))
+            if entry is None:
+                entry = {'calls': 0, 'errors': 0, 'rows': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'histogram': [0] * len(LATENCY_BUCKETS_MS)}
+                self._statements[(caller, fingerprint)] = entry
+            entry['calls'] += 1
+            entry['errors'] += int(error)
+            entry['rows'] += rows or 0
+            entry['total_ms'] += duration_ms
+            entry['max_ms'] = max(entry['max_ms'], duration_ms)
+            entry['histogram'][bucket] += 1
+            slow = duration_ms >= self.slow_threshold_ms
+            if slow:
+                self._slow.append({
+                    'timestamp': datetime.now(),
+                    'method': caller,
+                    'fingerprint': fingerprint,
+                    'duration_ms': round(duration_ms, 2),
+                    'rows': rows,
+                    'params': _redact(params)
+                })
+        if slow:
+            logger.warning("Slow query (%.1f ms) in %s: %s params=%s", duration_ms, caller, fingerprint, _redact(params))
+    
+    def _percentile(self, histogram: List[int], calls: int, fraction: float):
+        target = calls * fraction
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, histogram):
+            seen += count
+            if seen >= target:
+                return bound
+        return LATENCY_BUCKETS_MS[-1]
+    
+    def summary(self):
+        with self._lock:
+            items = [(key, dict(entry, histogram=list(entry['histogram']))) for key, entry in self._statements.items()]
+        rows = []
+        for (caller, fingerprint), entry in items:
+            rows.append({
+                'method': caller,
+                'fingerprint': fingerprint,
+                'calls': entry['calls'],
+                'errors': entry['errors'],
+                'rows': entry['rows'],
+                'total_ms': round(entry['total_ms'], 2),
+                'avg_ms': round(entry['total_ms'] / entry['calls'], 2),
+                'max_ms': round(entry['max_ms'], 2),
+                'p50_ms': self._percentile(entry['histogram'], entry['calls'], 0.50),
+                'p95_ms': self._percentile(entry['histogram'], entry['calls'], 0.95),
+                'p99_ms': self._percentile(entry['histogram'], entry['calls'], 0.99)
+            })
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+    
+    def slow_queries(self, min_duration_ms: float = None):
+        with self._lock:
+            entries = list(reversed(self._slow))
+        if min_duration_ms is None:
+            return entries
+        return [entry for entry in entries if entry['duration_ms'] >= min_duration_ms]
+    
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+            self._slow.clear()
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * 6371.0088 * math.asin(math.sqrt(min(1.0, a)))
+
+class PartnerLocationIndex:
+    def __init__(self, cell_size: float = 0.01, refresh_interval: float = 60.0):
+        self.cell_size = cell_size
+        self.refresh_interval = refresh_interval
+        self._cells = {}
+        self._positions = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+    
+    def _cell(self, latitude: float, longitude: float):
+        return (math.floor(latitude / self.cell_size), math.floor(longitude / self.cell_size))
+    
+    def _remove(self, partner_id: int):
+        position = self._positions.pop(partner_id, None)
+        if position is not None:
+            members = self._cells.get(position[2])
+            members.discard(partner_id)
+            if not members:
+                del self._cells[position[2]]
+    
+    def needs_refresh(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_interval
+    
+    def load(self, rows: List[Dict[str, Any]]):
+        with self._lock:
+            self._cells.clear()
+            self._positions.clear()
+            for row in rows:
+                self._put(row['id'], float(row['current_latitude']), float(row['current_longitude']))
+            self._loaded_at = time.monotonic()
+    
+    def _put(self, partner_id: int, latitude: float, longitude: float):
+        self._remove(partner_id)
+        cell = self._cell(latitude, longitude)
+        self._positions[partner_id] = (latitude, longitude, cell)
+        self._cells.setdefault(cell, set()).add(partner_id)
+    
+    def update(self, partner_id: int, latitude: float, longitude: float):
+        with self._lock:
+            if partner_id in self._positions:
+                self._put(partner_id, float(latitude), float(longitude))
+    
+    def remove(self, partner_id: int):
+        with self._lock:
+            self._remove(partner_id)
+    
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = None
+    
+    def nearest(self, latitude: float, longitude: float, k: int = 5, radius_km: float = 5.0):
+        if k < 1:
+            return []
+        center_i, center_j = self._cell(latitude, longitude)
+        km_per_cell = self.cell_size * 111.32 * max(math.cos(math.radians(latitude)), 0.01)
+        max_ring = int(radius_km / km_per_cell) + 1
+        found = []
+        with self._lock:
+            for ring in range(max_ring + 1):
+                for i in range(center_i - ring, center_i + ring + 1):
+                    for j in range(center_j - ring, center_j + ring + 1):
+                        if ring and center_i - ring < i < center_i + ring and center_j - ring < j < center_j + ring:
+                            continue
+                        for partner_id in self._cells.get((i, j), ()):
+                            lat, lon, _ = self._positions[partner_id]
+                            distance = haversine_km(latitude, longitude, lat, lon)
+                            if distance <= radius_km:
+                                found.append((distance, partner_id))
+                if len(found) >= k:
+                    found.sort()
+                    if found[k - 1][0] <= ring * km_per_cell:
+                        break
+        found.sort()
+        return found[:k]
+    
+    def size(self):
+        with self._lock:
+            return len(self._positions)
 
 class DatabaseConnection:
-    def __init__(self, host: str, user: str, password: str, database: str, port: int = 3306):
+    def __init__(self, host: str, user: str, password: str, database: str, port: int = 3306, pool_size: int = 10, pool_timeout: float = 10.0, idle_timeout: float = 300.0, max_lifetime: float = 3600.0, cache_size: int = 1024, cache_ttls: Dict[str, float] = None, slow_query_ms: float = 200.0, query_timeout: float = 10.0):
         self.config = {
+            'autocommit': True,
             'charset': 'utf8mb4',
+            'client_flag': CLIENT.FOUND_ROWS,
             'connect_timeout': 10,
             'cursorclass': pymysql.cursors.DictCursor,
             'db': database,
             'host': host,
             'password': password,
-            'read_timeout': 10,
+            'read_timeout': query_timeout,
             'port': port,
             'user': user,
-            'write_timeout': 10
+            'write_timeout': query_timeout
         }
+        self.pool = ConnectionPool(self.config, max_size=pool_size, idle_timeout=idle_timeout, max_lifetime=max_lifetime, wait_timeout=pool_timeout)
+        self.cache = QueryCache(max_entries=cache_size, table_ttls=cache_ttls if cache_ttls is not None else {'Restaurants': 60.0, 'MenuItems': 60.0})
+        self.query_stats = QueryStats(slow_threshold_ms=slow_query_ms)
+        self.partner_locations = PartnerLocationIndex()
+        self._local = threading.local()
     
     @contextmanager
     def get_connection(self):
-        conn = pymysql.connect(**self.config)
+        active = getattr(self._local, 'conn', None)
+        if active is not None:
+            yield active
+            return
+        pooled = self.pool.acquire()
         try:
-            yield conn
-        finally:
-            conn.close()
+            yield pooled.conn
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            self.pool.release(pooled, discard=True)
+            raise
+        except BaseException:
+            self.pool.release(pooled)
+            raise
+        else:
+            self.pool.release(pooled)
+    
+    @contextmanager
+    def _measure(self, query: str, params):
+        outcome = {'rows': 0}
+        start = time.perf_counter()
+        try:
+            yield outcome
+        except GeneratorExit:
+            self.query_stats.record(query, params, time.perf_counter() - start, outcome['rows'])
+            raise
+        except BaseException:
+            self.query_stats.record(query, params, time.perf_counter() - start, outcome['rows'], error=True)
+            raise
+        else:
+            self.query_stats.record(query, params, time.perf_counter() - start, outcome['rows'])
     
     def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params or ())
-            if fetch:
-                result = cursor.fetchall()
+            with conn.cursor() as cursor, self._measure(query, params) as outcome:
+                outcome['rows'] = cursor.execute(query, params or ())
+                if fetch:
+                    return cursor.fetchall()
+                self._invalidate_written(query)
+                return cursor.lastrowid
+    
+    def execute_update(self, query: str, params: tuple = None):
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor, self._measure(query, params) as outcome:
+                rowcount = outcome['rows'] = cursor.execute(query, params or ())
+                self._invalidate_written(query)
+                return rowcount
+    
+    def execute_many(self, query: str, params_seq: List[tuple]):
+        params_seq = list(params_seq)
+        if not params_seq:
+            return 0
+        with self.transaction() as conn:
+            with conn.cursor() as cursor, self._measure(query, params_seq) as outcome:
+                rowcount = outcome['rows'] = cursor.executemany(query, params_seq)
+                self._invalidate_written(query)
+                return rowcount
+    
+    def cached_query(self, query: str, params: tuple = None, tables: tuple = ()):
+        if self.in_transaction():
+            return self.execute_query(query, params, fetch=True)
+        key = (query, params)
+        hit, rows = self.cache.get(key)
+        if not hit:
+            rows = self.execute_query(query, params, fetch=True)
+            self.cache.put(key, rows, tables)
+        return list(rows)
+    
+    def _invalidate_written(self, query: str):
+        match = WRITE_TABLE_PATTERN.match(query)
+        if not match:
+            return
+        table = match.group(1)
+        tables = (table,) + WRITE_SIDE_EFFECTS.get(table, ())
+        self.cache.invalidate(*tables)
+        if self.in_transaction():
+            self._local.written_tables.update(tables)
+    
+    def stream_query(self, query: str, params: tuple = None, chunk_size: int = None, as_dict: bool = True):
+        cursorclass = pymysql.cursors.SSDictCursor if as_dict else pymysql.cursors.SSCursor
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursorclass)
+            try:
+                with self._measure(query, params) as outcome:
+                    cursor.execute(query, params or ())
+                    if chunk_size:
+                        while True:
+                            rows = cursor.fetchmany(chunk_size)
+                            if not rows:
+                                break
+                            outcome['rows'] += len(rows)
+                            yield rows
+                    else:
+                        for row in cursor:
+                            outcome['rows'] += 1
+                            yield row
+            except GeneratorExit:
+                if self.in_transaction():
+                    cursor.close()
+                else:
+                    conn.close()
+                raise
+            else:
                 cursor.close()
-                return result
-            conn.commit()
-            last_id = cursor.lastrowid
-            cursor.close()
-            return last_id
+    
+    @contextmanager
+    def transaction(self):
+        active = getattr(self._local, 'conn', None)
+        if active is not None:
+            yield active
+            return
+        with self.get_connection() as conn:
+            conn.begin()
+            self._local.conn = conn
+            self._local.written_tables = set()
+            try:
+                yield conn
+            except BaseException:
+                try:
+                    conn.rollback()
+                except pymysql.err.MySQLError:
+                    pass
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._local.conn = None
+                self.cache.invalidate(*self._local.written_tables)
+    
+    def in_transaction(self):
+        return getattr(self._local, 'conn', None) is not None
+    
+    def pool_stats(self):
+        return self.pool.stats()
+    
+    def cache_stats(self):
+        return self.cache.stats()
+    
+    def query_summary(self):
+        return self.query_stats.summary()
+    
+    def slow_queries(self, min_duration_ms: float = None):
+        return self.query_stats.slow_queries(min_duration_ms)
+    
+    def long_running(self, query_timeout: float = None):
+        config = self.config
+        return DatabaseConnection(config['host'], config['user'], config['password'], config['db'], config['port'], pool_size=1, query_timeout=query_timeout, slow_query_ms=self.query_stats.slow_threshold_ms)
+    
+    def close(self):
+        self.pool.close()
 
 class UserOperations:
     def __init__(self, db: DatabaseConnection):
         self.db = db
+        self.rollups = SalesRollupOperations(db)
     
     def create(self, username: str, password: str, email: str, phone: str = None, address: str = None, role: str = 'customer'):
         query = "INSERT INTO Users (username, password, email, phone, address, role) VALUES (%s, %s, %s, %s, %s, %s)"
         return self.db.execute_query(query, (username, password, email, phone, address, role))
     
+    def create_many(self, users: List[Dict[str, Any]]):
+        query = "INSERT INTO Users (username, password, email, phone, address, role) VALUES (%s, %s, %s, %s, %s, %s)"
+        params = [(u['username'], u['password'], u['email'], u.get('phone'), u.get('address'), u.get('role', 'customer')) for u in users]
+        return self.db.execute_many(query, params)
+    
     def read_all(self):
         return self.db.execute_query("SELECT * FROM Users ORDER BY id", fetch=True)
     
+    def read_page(self, after: int = None, limit: int = 50, role: str = None):
+        conditions = []
+        params = []
+        if role is not None:
+            conditions.append("role = %s")
+            params.append(role)
+        if after is not None:
+            conditions.append("id > %s")
+            params.append(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT * FROM Users {where} ORDER BY id LIMIT %s"
+        rows = self.db.execute_query(query, tuple(params) + (limit + 1,), fetch=True)
+        return _page(rows, limit, lambda row: row['id'])
+    
     def read_by_id(self, user_id: int):
         result = self.db.execute_query("SELECT * FROM Users WHERE id = %s", (user_id,), fetch=True)
         return result[0] if result else None
@@ -61,33 +703,30 @@ class UserOperations:
     def read_by_role(self, role: str):
         return self.db.execute_query("SELECT * FROM Users WHERE role = %s ORDER BY id", (role,), fetch=True)
     
-    def update(self, user_id: int, username: str = None, password: str = None, email: str = None, phone: str = None, address: str = None, role: str = None):
-        user = self.read_by_id(user_id)
-        if not user:
-            return False
-        query = "UPDATE Users SET username = %s, password = %s, email = %s, phone = %s, address = %s, role = %s WHERE id = %s"
-        params = (
-            username or user['username'],
-            password or user['password'],
-            email or user['email'],
-            phone if phone is not None else user['phone'],
-            address if address is not None else user['address'],
-            role if role is not None else user['role'],
-            user_id
-        )
-        self.db.execute_query(query, params)
-        return True
+    def update(self, user_id: int, username: str = None, password: str = None, email: str = None, phone: str = None, address: str = None, role: str = None, expected_version: int = None):
+        values = {column: value for column, value in (('username', username), ('password', password), ('email', email)) if value}
+        values.update({column: value for column, value in (('phone', phone), ('address', address), ('role', role)) if value is not None})
+        return _update_columns(self.db, 'Users', user_id, values, expected_version)
     
     def delete(self, user_id: int):
-        self.db.execute_query("DELETE FROM Users WHERE id = %s", (user_id,))
+        # Deleting a customer cascades to their orders, which no trigger or updated_at scan can see
+        with self.db.transaction():
+            groups = self.rollups.groups_for_orders("customer_id = %s", (user_id,))
+            self.db.execute_query("DELETE FROM Users WHERE id = %s", (user_id,))
+            self.rollups.rebuild_groups(groups)
 
 class RestaurantOperations:
     def __init__(self, db: DatabaseConnection):
         self.db = db
     
-    def create(self, name: str, address: str, phone: str = None, email: str = None, cuisine_type: str = None, opening_hours: str = None, admin_id: int = None):
-        query = "INSERT INTO Restaurants (name, address, phone, email, cuisine_type, opening_hours, admin_id) VALUES (%s, %s, %s, %s, %s, %s, %s)"
-        return self.db.execute_query(query, (name, address, phone, email, cuisine_type, opening_hours, admin_id))
+    def create(self, name: str, address: str, phone: str = None, email: str = None, cuisine_type: str = None, opening_hours: str = None, admin_id: int = None, latitude: float = None, longitude: float = None):
+        query = "INSERT INTO Restaurants (name, address, phone, email, cuisine_type, opening_hours, admin_id, latitude, longitude) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+        return self.db.execute_query(query, (name, address, phone, email, cuisine_type, opening_hours, admin_id, latitude, longitude))
+    
+    def create_many(self, restaurants: List[Dict[str, Any]]):
+        query = "INSERT INTO Restaurants (name, address, phone, email, cuisine_type, opening_hours, admin_id, latitude, longitude) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+        params = [(r['name'], r['address'], r.get('phone'), r.get('email'), r.get('cuisine_type'), r.get('opening_hours'), r['admin_id'], r.get('latitude'), r.get('longitude')) for r in restaurants]
+        return self.db.execute_many(query, params)
     
     def read_all(self):
         query = """
@@ -96,7 +735,7 @@ class RestaurantOperations:
             LEFT JOIN Users u ON r.admin_id = u.id 
             ORDER BY r.id
         """
-        return self.db.execute_query(query, fetch=True)
+        return self.db.cached_query(query, tables=('Restaurants', 'Users'))
     
     def read_by_id(self, restaurant_id: int):
         query = """
@@ -105,30 +744,16 @@ class RestaurantOperations:
             LEFT JOIN Users u ON r.admin_id = u.id 
             WHERE r.id = %s
         """
-        result = self.db.execute_query(query, (restaurant_id,), fetch=True)
+        result = self.db.cached_query(query, (restaurant_id,), tables=('Restaurants', 'Users'))
         return result[0] if result else None
     
     def read_by_admin(self, admin_id: int):
-        return self.db.execute_query("SELECT * FROM Restaurants WHERE admin_id = %s ORDER BY id", (admin_id,), fetch=True)
-    
-    def update(self, restaurant_id: int, name: str = None, address: str = None, phone: str = None, email: str = None, cuisine_type: str = None, opening_hours: str = None, admin_id: int = None, is_active: bool = None):
-        restaurant = self.read_by_id(restaurant_id)
-        if not restaurant:
-            return False
-        query = "UPDATE Restaurants SET name = %s, address = %s, phone = %s, email = %s, cuisine_type = %s, opening_hours = %s, admin_id = %s, is_active = %s WHERE id = %s"
-        params = (
-            name or restaurant['name'],
-            address if address is not None else restaurant['address'],
-            phone if phone is not None else restaurant['phone'],
-            email if email is not None else restaurant['email'],
-            cuisine_type if cuisine_type is not None else restaurant['cuisine_type'],
-            opening_hours if opening_hours is not None else restaurant['opening_hours'],
-            admin_id if admin_id is not None else restaurant['admin_id'],
-            is_active if is_active is not None else restaurant['is_active'],
-            restaurant_id
-        )
-        self.db.execute_query(query, params)
-        return True
+        return self.db.cached_query("SELECT * FROM Restaurants WHERE admin_id = %s ORDER BY id", (admin_id,), tables=('Restaurants',))
+    
+    def update(self, restaurant_id: int, name: str = None, address: str = None, phone: str = None, email: str = None, cuisine_type: str = None, opening_hours: str = None, admin_id: int = None, is_active: bool = None, latitude: float = None, longitude: float = None, expected_version: int = None):
+        values = {'name': name} if name else {}
+        values.update({column: value for column, value in (('address', address), ('phone', phone), ('email', email), ('cuisine_type', cuisine_type), ('opening_hours', opening_hours), ('admin_id', admin_id), ('is_active', is_active), ('latitude', latitude), ('longitude', longitude)) if value is not None})
+        return _update_columns(self.db, 'Restaurants', restaurant_id, values, expected_version)
     
     def delete(self, restaurant_id: int):
         self.db.execute_query("DELETE FROM Restaurants WHERE id = %s", (restaurant_id,))
@@ -141,6 +766,14 @@ class MenuItemOperations:
         query = "INSERT INTO MenuItems (restaurant_id, name, description, price, category, is_vegetarian, preparation_time) VALUES (%s, %s, %s, %s, %s, %s, %s)"
         return self.db.execute_query(query, (restaurant_id, name, description, price, category, is_vegetarian, preparation_time))
     
+    def create_many(self, menu_items: List[Dict[str, Any]]):
+        query = "INSERT INTO MenuItems (restaurant_id, name, description, price, category, is_vegetarian, preparation_time) VALUES (%s, %s, %s, %s, %s, %s, %s)"
+        params = [
+            (m['restaurant_id'], m['name'], m.get('description'), m.get('price', 0.0), m.get('category'), m.get('is_vegetarian', True), m.get('preparation_time', 15))
+            for m in menu_items
+        ]
+        return self.db.execute_many(query, params)
+    
     def read_all(self):
         query = """
             SELECT mi.*, r.name as restaurant_name 
@@ -148,7 +781,28 @@ class MenuItemOperations:
             LEFT JOIN Restaurants r ON mi.restaurant_id = r.id 
             ORDER BY mi.restaurant_id, mi.name
         """
-        return self.db.execute_query(query, fetch=True)
+        return self.db.cached_query(query, tables=('MenuItems', 'Restaurants'))
+    
+    def read_page(self, after: int = None, limit: int = 50, restaurant_id: int = None):
+        conditions = []
+        params = []
+        if restaurant_id is not None:
+            conditions.append("mi.restaurant_id = %s")
+            params.append(restaurant_id)
+        if after is not None:
+            conditions.append("mi.id > %s")
+            params.append(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT mi.*, r.name as restaurant_name 
+            FROM MenuItems mi 
+            LEFT JOIN Restaurants r ON mi.restaurant_id = r.id 
+            {where}
+            ORDER BY mi.id
+            LIMIT %s
+        """
+        rows = self.db.execute_query(query, tuple(params) + (limit + 1,), fetch=True)
+        return _page(rows, limit, lambda row: row['id'])
     
     def read_by_id(self, menu_item_id: int):
         query = """
@@ -168,7 +822,7 @@ class MenuItemOperations:
             WHERE mi.restaurant_id = %s
             ORDER BY mi.name
         """
-        return self.db.execute_query(query, (restaurant_id,), fetch=True)
+        return self.db.cached_query(query, (restaurant_id,), tables=('MenuItems', 'Restaurants'))
     
     def read_available_by_restaurant(self, restaurant_id: int):
         query = """
@@ -178,25 +832,49 @@ class MenuItemOperations:
             WHERE mi.restaurant_id = %s AND mi.is_available = TRUE
             ORDER BY mi.name
         """
-        return self.db.execute_query(query, (restaurant_id,), fetch=True)
+        return self.db.cached_query(query, (restaurant_id,), tables=('MenuItems', 'Restaurants'))
+    
+    def search(self, query: str, filters: Dict[str, Any] = None, limit: int = 50):
+        terms = re.findall(r'\w+', query.lower())
+        if not terms:
+            return []
+        match = ' '.join(f"{term}*" for term in terms)
+        conditions = ["mi.is_available = TRUE", "r.is_active = TRUE"]
+        params = []
+        filters = filters or {}
+        for key, condition in (('restaurant_id', "mi.restaurant_id = %s"), ('category', "mi.category = %s"), ('is_vegetarian', "mi.is_vegetarian = %s"), ('min_price', "mi.price >= %s"), ('max_price', "mi.price <= %s")):
+            if filters.get(key) is not None:
+                conditions.append(condition)
+                params.append(filters[key])
+        # One MATCH per branch so each uses its own FULLTEXT index; an OR across the join would scan the catalog
+        sql = f"""
+            SELECT mi.*, r.name as restaurant_name, r.cuisine_type, hits.relevance
+            FROM (
+                SELECT id, SUM(score) as relevance
+                FROM (
+                    SELECT id, MATCH(name, description) AGAINST (%s IN BOOLEAN MODE) * 2 as score
+                    FROM MenuItems
+                    WHERE MATCH(name, description) AGAINST (%s IN BOOLEAN MODE)
+                    UNION ALL
+                    SELECT mi.id, MATCH(r.name, r.cuisine_type) AGAINST (%s IN BOOLEAN MODE)
+                    FROM Restaurants r
+                    JOIN MenuItems mi ON mi.restaurant_id = r.id
+                    WHERE MATCH(r.name, r.cuisine_type) AGAINST (%s IN BOOLEAN MODE)
+                ) matches
+                GROUP BY id
+            ) hits
+            JOIN MenuItems mi ON mi.id = hits.id
+            JOIN Restaurants r ON mi.restaurant_id = r.id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY hits.relevance DESC, r.rating DESC, mi.name
+            LIMIT %s
+        """
+        return self.db.cached_query(sql, (match, match, match, match, *params, limit), tables=('MenuItems', 'Restaurants'))
     
-    def update(self, menu_item_id: int, name: str = None, description: str = None, price: float = None, category: str = None, is_vegetarian: bool = None, preparation_time: int = None, is_available: bool = None):
-        menu_item = self.read_by_id(menu_item_id)
-        if not menu_item:
-            return False
-        query = "UPDATE MenuItems SET name = %s, description = %s, price = %s, category = %s, is_vegetarian = %s, preparation_time = %s, is_available = %s WHERE id = %s"
-        params = (
-            name or menu_item['name'],
-            description if description is not None else menu_item['description'],
-            price if price is not None else menu_item['price'],
-            category if category is not None else menu_item['category'],
-            is_vegetarian if is_vegetarian is not None else menu_item['is_vegetarian'],
-            preparation_time if preparation_time is not None else menu_item['preparation_time'],
-            is_available if is_available is not None else menu_item['is_available'],
-            menu_item_id
-        )
-        self.db.execute_query(query, params)
-        return True
+    def update(self, menu_item_id: int, name: str = None, description: str = None, price: float = None, category: str = None, is_vegetarian: bool = None, preparation_time: int = None, is_available: bool = None, expected_version: int = None):
+        values = {'name': name} if name else {}
+        values.update({column: value for column, value in (('description', description), ('price', price), ('category', category), ('is_vegetarian', is_vegetarian), ('preparation_time', preparation_time), ('is_available', is_available)) if value is not None})
+        return _update_columns(self.db, 'MenuItems', menu_item_id, values, expected_version)
     
     def delete(self, menu_item_id: int):
         self.db.execute_query("DELETE FROM MenuItems WHERE id = %s", (menu_item_id,))
@@ -204,6 +882,7 @@ class MenuItemOperations:
 class OrderOperations:
     def __init__(self, db: DatabaseConnection):
         self.db = db
+        self.rollups = SalesRollupOperations(db)
     
     def create(self, customer_id: int, restaurant_id: int, delivery_address: str, total_amount: float, payment_method: str = None):
         estimated_time = datetime.now() + timedelta(minutes=45)
@@ -221,6 +900,75 @@ class OrderOperations:
         """
         return self.db.execute_query(query, fetch=True)
     
+    def read_page(self, after: tuple = None, limit: int = 50, customer_id: int = None, restaurant_id: int = None, delivery_partner_id: int = None, status: str = None):
+        conditions = []
+        params = []
+        for column, value in (('o.customer_id', customer_id), ('o.restaurant_id', restaurant_id), ('o.delivery_partner_id', delivery_partner_id), ('o.status', status)):
+            if value is not None:
+                conditions.append(f"{column} = %s")
+                params.append(value)
+        if after is not None:
+            created_at, order_id = after
+            conditions.append("(o.created_at < %s OR (o.created_at = %s AND o.id < %s))")
+            params.extend([created_at, created_at, order_id])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT o.*, u.username as customer_username, r.name as restaurant_name, dp.username as delivery_partner_username
+            FROM Orders o
+            LEFT JOIN Users u ON o.customer_id = u.id
+            LEFT JOIN Restaurants r ON o.restaurant_id = r.id
+            LEFT JOIN Users dp ON o.delivery_partner_id = dp.id
+            {where}
+            ORDER BY o.created_at DESC, o.id DESC
+            LIMIT %s
+        """
+        rows = self.db.execute_query(query, tuple(params) + (limit + 1,), fetch=True)
+        return _page(rows, limit, lambda row: (row['created_at'], row['id']))
+    
+    def stream_all(self, chunk_size: int = 1000):
+        query = """
+            SELECT o.*, u.username as customer_username, r.name as restaurant_name, dp.username as delivery_partner_username
+            FROM Orders o
+            LEFT JOIN Users u ON o.customer_id = u.id
+            LEFT JOIN Restaurants r ON o.restaurant_id = r.id
+            LEFT JOIN Users dp ON o.delivery_partner_id = dp.id
+            ORDER BY o.id
+        """
+        return self.db.stream_query(query, chunk_size=chunk_size)
+    
+    def stream_order_items(self, chunk_size: int = 1000):
+        query = """
+            SELECT oi.*, mi.name as item_name
+            FROM OrderItems oi
+            JOIN MenuItems mi ON oi.menu_item_id = mi.id
+            ORDER BY oi.order_id, oi.id
+        """
+        return self.db.stream_query(query, chunk_size=chunk_size)
+    
+    def stream_order_lines(self, start: datetime = None, end: datetime = None, restaurant_id: int = None, chunk_size: int = 1000):
+        conditions = []
+        params = []
+        for condition, value in (("o.created_at >= %s", start), ("o.created_at < %s", end), ("o.restaurant_id = %s", restaurant_id)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT o.id, o.created_at, o.status, o.payment_status, o.payment_method, o.total_amount,
+                   o.customer_id, u.username, o.restaurant_id, r.name, o.delivery_partner_id, dp.username,
+                   o.delivery_address, o.actual_delivery_time,
+                   oi.menu_item_id, mi.name, oi.quantity, oi.price_per_item, oi.subtotal
+            FROM Orders o
+            LEFT JOIN OrderItems oi ON oi.order_id = o.id
+            LEFT JOIN MenuItems mi ON oi.menu_item_id = mi.id
+            LEFT JOIN Users u ON o.customer_id = u.id
+            LEFT JOIN Restaurants r ON o.restaurant_id = r.id
+            LEFT JOIN Users dp ON o.delivery_partner_id = dp.id
+            {where}
+            ORDER BY o.created_at, o.id
+        """
+        return self.db.stream_query(query, tuple(params), chunk_size=chunk_size, as_dict=False)
+    
     def read_by_id(self, order_id: int):
         query = """
             SELECT o.*, u.username as customer_username, r.name as restaurant_name, dp.username as delivery_partner_username
@@ -269,49 +1017,107 @@ class OrderOperations:
         """
         return self.db.execute_query(query, (delivery_partner_id,), fetch=True)
     
+    def read_available_for_pickup(self, limit: int = 50, near: tuple = None, radius_km: float = None):
+        params = []
+        distance = "NULL"
+        conditions = ["o.status = 'confirmed'", "o.delivery_partner_id IS NULL"]
+        having = ""
+        order_by = "o.created_at, o.id"
+        if near is not None:
+            latitude, longitude = near
+            distance = "111.045 * SQRT(POW(r.latitude - %s, 2) + POW((r.longitude - %s) * COS(RADIANS(%s)), 2))"
+            params.extend([latitude, longitude, latitude])
+            order_by = "distance_km IS NULL, distance_km, o.created_at"
+            if radius_km is not None:
+                delta = radius_km / 111.045
+                conditions.append("r.latitude BETWEEN %s AND %s")
+                params.extend([latitude - delta, latitude + delta])
+                having = "HAVING distance_km <= %s"
+                params.append(radius_km)
+        query = f"""
+            SELECT o.*, u.username as customer_username, r.name as restaurant_name, NULL as delivery_partner_username, {distance} as distance_km
+            FROM Orders o
+            LEFT JOIN Users u ON o.customer_id = u.id
+            LEFT JOIN Restaurants r ON o.restaurant_id = r.id
+            WHERE {' AND '.join(conditions)}
+            {having}
+            ORDER BY {order_by}
+            LIMIT %s
+        """
+        return self.db.execute_query(query, tuple(params) + (limit,), fetch=True)
+    
     def update_status(self, order_id: int, status: str):
-        query = "UPDATE Orders SET status = %s WHERE id = %s"
+        query = "UPDATE Orders SET status = %s, version = version + 1 WHERE id = %s"
         self.db.execute_query(query, (status, order_id))
     
     def update_payment_status(self, order_id: int, payment_status: str):
-        query = "UPDATE Orders SET payment_status = %s WHERE id = %s"
+        query = "UPDATE Orders SET payment_status = %s, version = version + 1 WHERE id = %s"
         self.db.execute_query(query, (payment_status, order_id))
     
     def assign_delivery_partner(self, order_id: int, delivery_partner_id: int):
-        query = "UPDATE Orders SET delivery_partner_id = %s, status = 'confirmed' WHERE id = %s"
+        query = "UPDATE Orders SET delivery_partner_id = %s, status = 'confirmed', version = version + 1 WHERE id = %s"
         self.db.execute_query(query, (delivery_partner_id, order_id))
     
-    def update(self, order_id: int, customer_id: int = None, restaurant_id: int = None, delivery_address: str = None, total_amount: float = None, status: str = None, payment_status: str = None, payment_method: str = None, delivery_partner_id: int = None):
-        order = self.read_by_id(order_id)
-        if not order:
-            return False
-        query = "UPDATE Orders SET customer_id = %s, restaurant_id = %s, delivery_address = %s, total_amount = %s, status = %s, payment_status = %s, payment_method = %s, delivery_partner_id = %s WHERE id = %s"
-        params = (
-            customer_id if customer_id is not None else order['customer_id'],
-            restaurant_id if restaurant_id is not None else order['restaurant_id'],
-            delivery_address if delivery_address is not None else order['delivery_address'],
-            total_amount if total_amount is not None else order['total_amount'],
-            status if status is not None else order['status'],
-            payment_status if payment_status is not None else order['payment_status'],
-            payment_method if payment_method is not None else order['payment_method'],
-            delivery_partner_id if delivery_partner_id is not None else order['delivery_partner_id'],
-            order_id
-        )
-        self.db.execute_query(query, params)
-        return True
+    def _touch(self, order_id: int):
+        self.db.execute_query("UPDATE Orders SET updated_at = CURRENT_TIMESTAMP WHERE id = %s", (order_id,))
+    
+    def update(self, order_id: int, customer_id: int = None, restaurant_id: int = None, delivery_address: str = None, total_amount: float = None, status: str = None, payment_status: str = None, payment_method: str = None, delivery_partner_id: int = None, expected_version: int = None):
+        values = {column: value for column, value in (('customer_id', customer_id), ('restaurant_id', restaurant_id), ('delivery_address', delivery_address), ('total_amount', total_amount), ('status', status), ('payment_status', payment_status), ('payment_method', payment_method), ('delivery_partner_id', delivery_partner_id)) if value is not None}
+        with self.db.transaction():
+            groups = self.rollups.groups_for_orders("id = %s", (order_id,))
+            updated = _update_columns(self.db, 'Orders', order_id, values, expected_version)
+            if updated and groups:
+                if restaurant_id is not None:
+                    groups = sorted(set(groups) | {(restaurant_id, groups[0][1])})
+                self.rollups.rebuild_groups(groups)
+        return updated
     
     def delete(self, order_id: int):
-        self.db.execute_query("DELETE FROM Orders WHERE id = %s", (order_id,))
+        with self.db.transaction():
+            groups = self.rollups.groups_for_orders("id = %s", (order_id,))
+            self.db.execute_query("DELETE FROM Orders WHERE id = %s", (order_id,))
+            self.rollups.rebuild_groups(groups)
     
     def add_item(self, order_id: int, menu_item_id: int, quantity: int = 1, price_per_item: float = None):
-        menu_item = self.db.execute_query("SELECT price FROM MenuItems WHERE id = %s", (menu_item_id,), fetch=True)[0]
-        price = price_per_item or menu_item['price']
+        price = price_per_item
+        if price is None:
+            price = self.db.execute_query("SELECT price FROM MenuItems WHERE id = %s", (menu_item_id,), fetch=True)[0]['price']
         subtotal = price * quantity
         query = "INSERT INTO OrderItems (order_id, menu_item_id, quantity, price_per_item, subtotal) VALUES (%s, %s, %s, %s, %s)"
-        self.db.execute_query(query, (order_id, menu_item_id, quantity, price, subtotal))
+        with self.db.transaction():
+            self.db.execute_query(query, (order_id, menu_item_id, quantity, price, subtotal))
+            self._touch(order_id)
+    
+    def get_prices(self, menu_item_ids: List[int]):
+        menu_item_ids = list(set(menu_item_ids))
+        if not menu_item_ids:
+            return {}
+        query = f"SELECT id, price FROM MenuItems WHERE id IN ({_placeholders(len(menu_item_ids))})"
+        return {row['id']: row['price'] for row in self.db.execute_query(query, tuple(menu_item_ids), fetch=True)}
+    
+    def add_items(self, order_id: int, items: List[Dict[str, Any]]):
+        missing = [item['menu_item_id'] for item in items if item.get('price_per_item') is None]
+        prices = self.get_prices(missing)
+        unknown = set(missing) - set(prices)
+        if unknown:
+            raise ValueError(f"Unknown menu item ids: {sorted(unknown)}")
+        params = []
+        for item in items:
+            quantity = item.get('quantity', 1)
+            price = item.get('price_per_item')
+            if price is None:
+                price = prices[item['menu_item_id']]
+            params.append((order_id, item['menu_item_id'], quantity, price, price * quantity))
+        query = "INSERT INTO OrderItems (order_id, menu_item_id, quantity, price_per_item, subtotal) VALUES (%s, %s, %s, %s, %s)"
+        with self.db.transaction():
+            inserted = self.db.execute_many(query, params)
+            self._touch(order_id)
+        return inserted
     
     def remove_item(self, order_id: int, menu_item_id: int):
-        self.db.execute_query("DELETE FROM OrderItems WHERE order_id = %s AND menu_item_id = %s", (order_id, menu_item_id))
+        with self.db.transaction():
+            self.db.execute_query("DELETE FROM OrderItems WHERE order_id = %s AND menu_item_id = %s", (order_id, menu_item_id))
+            self._touch(order_id)
     
     def get_order_items(self, order_id: int):
         query = """
@@ -321,6 +1127,22 @@ class OrderOperations:
             WHERE oi.order_id = %s
         """
         return self.db.execute_query(query, (order_id,), fetch=True)
+    
+    def get_order_items_for_orders(self, order_ids: List[int], chunk_size: int = 1000):
+        order_ids = list(dict.fromkeys(order_ids))
+        items_by_order = {order_id: [] for order_id in order_ids}
+        for start in range(0, len(order_ids), chunk_size):
+            chunk = order_ids[start:start + chunk_size]
+            query = f"""
+                SELECT oi.*, mi.name as item_name, mi.description as item_description
+                FROM OrderItems oi
+                JOIN MenuItems mi ON oi.menu_item_id = mi.id
+                WHERE oi.order_id IN ({_placeholders(len(chunk))})
+                ORDER BY oi.order_id, oi.id
+            """
+            for item in self.db.execute_query(query, tuple(chunk), fetch=True):
+                items_by_order[item['order_id']].append(item)
+        return items_by_order
 
 class DeliveryPartnerOperations:
     def __init__(self, db: DatabaseConnection):
@@ -362,10 +1184,61 @@ class DeliveryPartnerOperations:
     def update_online_status(self, delivery_partner_id: int, is_online: bool):
         query = "UPDATE DeliveryPartners SET is_online = %s WHERE id = %s"
         self.db.execute_query(query, (is_online, delivery_partner_id))
+        if is_online:
+            self.db.partner_locations.invalidate()
+        else:
+            self.db.partner_locations.remove(delivery_partner_id)
     
     def update_location(self, delivery_partner_id: int, latitude: float, longitude: float):
         query = "UPDATE DeliveryPartners SET current_latitude = %s, current_longitude = %s WHERE id = %s"
         self.db.execute_query(query, (latitude, longitude, delivery_partner_id))
+        self.db.partner_locations.update(delivery_partner_id, latitude, longitude)
+    
+    def update_locations(self, positions: List[Dict[str, Any]]):
+        if not positions:
+            return 0
+        rows = " UNION ALL ".join(["SELECT %s AS id, %s AS latitude, %s AS longitude"] * len(positions))
+        query = f"""
+            UPDATE DeliveryPartners dp
+            JOIN ({rows}) AS pos ON dp.id = pos.id
+            SET dp.current_latitude = pos.latitude, dp.current_longitude = pos.longitude
+        """
+        params = tuple(value for p in positions for value in (p['delivery_partner_id'], p['latitude'], p['longitude']))
+        updated = self.db.execute_update(query, params)
+        for p in positions:
+            self.db.partner_locations.update(p['delivery_partner_id'], p['latitude'], p['longitude'])
+        return updated
+    
+    def get_user_ids(self, delivery_partner_ids: List[int]):
+        delivery_partner_ids = list(set(delivery_partner_ids))
+        if not delivery_partner_ids:
+            return {}
+        query = f"SELECT id, user_id FROM DeliveryPartners WHERE id IN ({_placeholders(len(delivery_partner_ids))})"
+        return {row['id']: row['user_id'] for row in self.db.execute_query(query, tuple(delivery_partner_ids), fetch=True)}
+    
+    def refresh_location_index(self):
+        query = """
+            SELECT id, current_latitude, current_longitude
+            FROM DeliveryPartners
+            WHERE is_online = TRUE AND current_latitude IS NOT NULL AND current_longitude IS NOT NULL
+        """
+        self.db.partner_locations.load(self.db.execute_query(query, fetch=True))
+    
+    def find_nearest(self, latitude: float, longitude: float, k: int = 5, radius_km: float = 5.0):
+        if self.db.partner_locations.needs_refresh():
+            self.refresh_location_index()
+        nearest = self.db.partner_locations.nearest(latitude, longitude, k, radius_km)
+        if not nearest:
+            return []
+        partner_ids = [partner_id for _, partner_id in nearest]
+        query = f"""
+            SELECT dp.*, u.username, u.phone, u.email
+            FROM DeliveryPartners dp
+            JOIN Users u ON dp.user_id = u.id
+            WHERE dp.id IN ({_placeholders(len(partner_ids))}) AND dp.is_online = TRUE
+        """
+        partners = {row['id']: row for row in self.db.execute_query(query, tuple(partner_ids), fetch=True)}
+        return [dict(partners[partner_id], distance_km=distance) for distance, partner_id in nearest if partner_id in partners]
     
     def update_rating(self, delivery_partner_id: int, rating: float):
         query = "UPDATE DeliveryPartners SET rating = %s WHERE id = %s"
@@ -377,6 +1250,35 @@ class DeliveryPartnerOperations:
     
     def delete(self, delivery_partner_id: int):
         self.db.execute_query("DELETE FROM DeliveryPartners WHERE id = %s", (delivery_partner_id,))
+        self.db.partner_locations.remove(delivery_partner_id)
+
+class DeliveryTrackingOperations:
+    def __init__(self, db: DatabaseConnection):
+        self.db = db
+    
+    def add_point(self, order_id: int, delivery_partner_id: int, latitude: float, longitude: float, status: str = 'on_the_way'):
+        query = "INSERT INTO DeliveryTracking (order_id, delivery_partner_id, latitude, longitude, status) VALUES (%s, %s, %s, %s, %s)"
+        return self.db.execute_query(query, (order_id, delivery_partner_id, latitude, longitude, status))
+    
+    def add_points(self, points: List[Dict[str, Any]]):
+        query = "INSERT INTO DeliveryTracking (order_id, delivery_partner_id, latitude, longitude, status, timestamp) VALUES (%s, %s, %s, %s, %s, %s)"
+        params = [(p['order_id'], p['delivery_partner_id'], p['latitude'], p['longitude'], p.get('status', 'on_the_way'), p.get('timestamp') or datetime.now()) for p in points]
+        return self.db.execute_many(query, params)
+    
+    def read_by_order(self, order_id: int):
+        query = """
+            SELECT dt.*, u.username as delivery_partner_username
+            FROM DeliveryTracking dt
+            JOIN Users u ON dt.delivery_partner_id = u.id
+            WHERE dt.order_id = %s
+            ORDER BY dt.timestamp, dt.id
+        """
+        return self.db.execute_query(query, (order_id,), fetch=True)
+    
+    def read_latest(self, order_id: int):
+        query = "SELECT * FROM DeliveryTracking WHERE order_id = %s ORDER BY timestamp DESC, id DESC LIMIT 1"
+        result = self.db.execute_query(query, (order_id,), fetch=True)
+        return result[0] if result else None
 
 class CartOperations:
     def __init__(self, db: DatabaseConnection):
@@ -386,6 +1288,10 @@ class CartOperations:
         query = "INSERT INTO Cart (customer_id, menu_item_id, quantity) VALUES (%s, %s, %s) ON DUPLICATE KEY UPDATE quantity = %s"
         self.db.execute_query(query, (customer_id, menu_item_id, quantity, quantity))
     
+    def upsert_many(self, customer_id: int, items: List[Dict[str, Any]]):
+        query = "INSERT INTO Cart (customer_id, menu_item_id, quantity) VALUES (%s, %s, %s) ON DUPLICATE KEY UPDATE quantity = VALUES(quantity)"
+        return self.db.execute_many(query, [(customer_id, item['menu_item_id'], item.get('quantity', 1)) for item in items])
+    
     def update_quantity(self, customer_id: int, menu_item_id: int, quantity: int):
         if quantity <= 0:
             self.remove_item(customer_id, menu_item_id)
@@ -396,6 +1302,12 @@ class CartOperations:
     def remove_item(self, customer_id: int, menu_item_id: int):
         self.db.execute_query("DELETE FROM Cart WHERE customer_id = %s AND menu_item_id = %s", (customer_id, menu_item_id))
     
+    def remove_items(self, customer_id: int, menu_item_ids: List[int]):
+        if not menu_item_ids:
+            return 0
+        query = f"DELETE FROM Cart WHERE customer_id = %s AND menu_item_id IN ({_placeholders(len(menu_item_ids))})"
+        return self.db.execute_update(query, (customer_id, *menu_item_ids))
+    
     def get_cart(self, customer_id: int):
         query = """
             SELECT c.*, mi.name as item_name, mi.price, mi.restaurant_id, r.name as restaurant_name
@@ -432,6 +1344,14 @@ class RatingOperations:
         query = "INSERT INTO ItemRatings (menu_item_id, customer_id, rating, review) VALUES (%s, %s, %s, %s) ON DUPLICATE KEY UPDATE rating = %s, review = %s"
         self.db.execute_query(query, (menu_item_id, customer_id, rating, review, rating, review))
     
+    def upsert_restaurant_ratings(self, ratings: List[Dict[str, Any]]):
+        query = "INSERT INTO RestaurantRatings (restaurant_id, customer_id, rating, review) VALUES (%s, %s, %s, %s) ON DUPLICATE KEY UPDATE rating = VALUES(rating), review = VALUES(review)"
+        return self.db.execute_many(query, [(r['restaurant_id'], r['customer_id'], r['rating'], r.get('review')) for r in ratings])
+    
+    def upsert_item_ratings(self, ratings: List[Dict[str, Any]]):
+        query = "INSERT INTO ItemRatings (menu_item_id, customer_id, rating, review) VALUES (%s, %s, %s, %s) ON DUPLICATE KEY UPDATE rating = VALUES(rating), review = VALUES(review)"
+        return self.db.execute_many(query, [(r['menu_item_id'], r['customer_id'], r['rating'], r.get('review')) for r in ratings])
+    
     def get_restaurant_ratings(self, restaurant_id: int):
         query = """
             SELECT rr.*, u.username as customer_username
@@ -452,12 +1372,232 @@ class RatingOperations:
         """
         return self.db.execute_query(query, (menu_item_id,), fetch=True)
     
+    def delete_restaurant_rating(self, restaurant_id: int, customer_id: int):
+        return self.db.execute_update("DELETE FROM RestaurantRatings WHERE restaurant_id = %s AND customer_id = %s", (restaurant_id, customer_id))
+    
+    def delete_item_rating(self, menu_item_id: int, customer_id: int):
+        return self.db.execute_update("DELETE FROM ItemRatings WHERE menu_item_id = %s AND customer_id = %s", (menu_item_id, customer_id))
+    
     def get_restaurant_average_rating(self, restaurant_id: int):
-        query = "SELECT COALESCE(AVG(rating), 0) as avg_rating FROM RestaurantRatings WHERE restaurant_id = %s"
+        query = "SELECT COALESCE(rating_sum / NULLIF(rating_count, 0), 0) as avg_rating FROM Restaurants WHERE id = %s"
         result = self.db.execute_query(query, (restaurant_id,), fetch=True)
         return result[0]['avg_rating'] if result else 0.0
     
     def get_item_average_rating(self, menu_item_id: int):
-        query = "SELECT COALESCE(AVG(rating), 0) as avg_rating FROM ItemRatings WHERE menu_item_id = %s"
+        query = "SELECT COALESCE(rating_sum / NULLIF(rating_count, 0), 0) as avg_rating FROM MenuItems WHERE id = %s"
         result = self.db.execute_query(query, (menu_item_id,), fetch=True)
         return result[0]['avg_rating'] if result else 0.0
+    
+    def get_item_average_ratings(self, restaurant_id: int):
+        query = """
+            SELECT id, name, rating_count, COALESCE(rating_sum / NULLIF(rating_count, 0), 0) as avg_rating
+            FROM MenuItems
+            WHERE restaurant_id = %s
+        """
+        rows = self.db.cached_query(query, (restaurant_id,), tables=('MenuItems',))
+        return {row['id']: {'name': row['name'], 'avg_rating': row['avg_rating'], 'rating_count': row['rating_count']} for row in rows}
+    
+    def rebuild_rating_aggregates(self):
+        with self.db.transaction():
+            self.db.execute_update("""
+                UPDATE Restaurants r
+                LEFT JOIN (SELECT restaurant_id, SUM(rating) as total, COUNT(*) as cnt FROM RestaurantRatings GROUP BY restaurant_id) agg ON agg.restaurant_id = r.id
+                SET r.rating_sum = COALESCE(agg.total, 0), r.rating_count = COALESCE(agg.cnt, 0), r.rating = COALESCE(agg.total / agg.cnt, 0)
+            """)
+            self.db.execute_update("""
+                UPDATE MenuItems mi
+                LEFT JOIN (SELECT menu_item_id, SUM(rating) as total, COUNT(*) as cnt FROM ItemRatings GROUP BY menu_item_id) agg ON agg.menu_item_id = mi.id
+                SET mi.rating_sum = COALESCE(agg.total, 0), mi.rating_count = COALESCE(agg.cnt, 0)
+            """)
+
+class SalesRollupOperations:
+    WATERMARK = 'daily_sales'
+    
+    def __init__(self, db: DatabaseConnection, lag_seconds: float = 300.0, chunk_size: int = 200):
+        self.db = db
+        self.lag_seconds = lag_seconds
+        self.chunk_size = chunk_size
+    
+    def _rollup(self, where: str, params: tuple):
+        status_columns = ", ".join(f"{status}_orders" for status in ORDER_STATUSES)
+        status_counts = ", ".join(f"SUM(o.status = '{status}')" for status in ORDER_STATUSES)
+        self.db.execute_update(f"""
+            INSERT INTO RestaurantDailySales (restaurant_id, sales_date, total_orders, paid_orders, revenue, delivered_paid_orders, {status_columns})
+            SELECT o.restaurant_id, DATE(o.created_at), COUNT(*),
+                   SUM(o.payment_status = 'paid'),
+                   COALESCE(SUM(CASE WHEN o.payment_status = 'paid' THEN o.total_amount END), 0),
+                   SUM(o.status = 'delivered' AND o.payment_status = 'paid'),
+                   {status_counts}
+            FROM Orders o
+            WHERE {where}
+            GROUP BY o.restaurant_id, DATE(o.created_at)
+        """, params)
+        self.db.execute_update(f"""
+            INSERT INTO MenuItemDailySales (menu_item_id, sales_date, restaurant_id, quantity_sold, revenue)
+            SELECT oi.menu_item_id, DATE(o.created_at), o.restaurant_id, SUM(oi.quantity), SUM(oi.subtotal)
+            FROM Orders o
+            JOIN OrderItems oi ON oi.order_id = o.id
+            WHERE {where}
+            GROUP BY oi.menu_item_id, DATE(o.created_at), o.restaurant_id
+        """, params)
+    
+    def groups_for_orders(self, where: str, params: tuple):
+        query = f"SELECT DISTINCT restaurant_id, DATE(created_at) as sales_date FROM Orders WHERE {where} FOR UPDATE"
+        return [(row['restaurant_id'], row['sales_date']) for row in self.db.execute_query(query, params, fetch=True)]
+    
+    def rebuild_groups(self, groups: List[tuple]):
+        for start in range(0, len(groups), self.chunk_size):
+            chunk = groups[start:start + self.chunk_size]
+            keys = " OR ".join(["(restaurant_id = %s AND sales_date = %s)"] * len(chunk))
+            key_params = tuple(value for group in chunk for value in group)
+            self.db.execute_update(f"DELETE FROM RestaurantDailySales WHERE {keys}", key_params)
+            self.db.execute_update(f"DELETE FROM MenuItemDailySales WHERE {keys}", key_params)
+            ranges = " OR ".join(["(o.restaurant_id = %s AND o.created_at >= %s AND o.created_at < %s)"] * len(chunk))
+            range_params = tuple(value for restaurant_id, day in chunk for value in (restaurant_id, day, day + timedelta(days=1)))
+            self._rollup(ranges, range_params)
+    
+    def _lock_watermark(self):
+        query = "SELECT high_water_mark FROM RollupWatermarks WHERE name = %s FOR UPDATE"
+        rows = self.db.execute_query(query, (self.WATERMARK,), fetch=True)
+        if not rows:
+            self.db.execute_update("INSERT IGNORE INTO RollupWatermarks (name) VALUES (%s)", (self.WATERMARK,))
+            rows = self.db.execute_query(query, (self.WATERMARK,), fetch=True)
+        return rows[0]['high_water_mark']
+    
+    def _set_watermark(self, mark: datetime):
+        self.db.execute_update("UPDATE RollupWatermarks SET high_water_mark = %s, refreshed_at = CURRENT_TIMESTAMP WHERE name = %s", (mark, self.WATERMARK))
+    
+    def refresh(self):
+        with self.db.transaction():
+            watermark = self._lock_watermark()
+            new_mark = self.db.execute_query("SELECT MAX(updated_at) as mark FROM Orders", fetch=True)[0]['mark']
+            groups = []
+            if watermark is None:
+                logger.warning("Sales rollups have not been built yet, rebuild them from the admin view or the data generator")
+            elif new_mark is not None:
+                rows = self.db.execute_query("""
+                    SELECT DISTINCT restaurant_id, DATE(created_at) as sales_date
+                    FROM Orders
+                    WHERE updated_at > %s
+                """, (watermark - timedelta(seconds=self.lag_seconds),), fetch=True)
+                groups = [(row['restaurant_id'], row['sales_date']) for row in rows]
+                self.rebuild_groups(groups)
+                self._set_watermark(new_mark)
+        return groups
+    
+    def _rebuild_range(self, start: date = None, end: date = None):
+        conditions = []
+        params = []
+        if start is not None:
+            conditions.append("sales_date >= %s")
+            params.append(start)
+        if end is not None:
+            conditions.append("sales_date < %s")
+            params.append(end)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        self.db.execute_update(f"DELETE FROM RestaurantDailySales {where}", tuple(params))
+        self.db.execute_update(f"DELETE FROM MenuItemDailySales {where}", tuple(params))
+        order_conditions = [condition.replace("sales_date", "o.created_at") for condition in conditions] or ["TRUE"]
+        self._rollup(" AND ".join(order_conditions), tuple(params))
+    
+    def rebuild(self, start: date = None, end: date = None):
+        with self.db.transaction():
+            self._lock_watermark()
+            new_mark = self.db.execute_query("SELECT MAX(updated_at) as mark FROM Orders", fetch=True)[0]['mark']
+            self._rebuild_range(start, end)
+            if start is None and end is None:
+                self._set_watermark(new_mark or datetime.now())
+
+class RollupRefresher:
+    def __init__(self, db: DatabaseConnection, interval: float = 60.0):
+        self.db = db
+        self.interval = interval
+        self._stopping = threading.Event()
+        self._thread = None
+    
+    def _run(self):
+        refresh_db = self.db.long_running()
+        try:
+            rollups = SalesRollupOperations(refresh_db)
+            while True:
+                try:
+                    rollups.refresh()
+                except Exception:
+                    logger.exception("Sales rollup refresh failed")
+                if self._stopping.wait(self.interval):
+                    return
+        finally:
+            refresh_db.close()
+    
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='rollup-refresher', daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+class RestaurantAnalyticsOperations:
+    def __init__(self, db: DatabaseConnection):
+        self.db = db
+    
+    def _filters(self, restaurant_id: int = None, start: datetime = None, end: datetime = None, alias: str = 's'):
+        conditions = []
+        params = []
+        if restaurant_id is not None:
+            conditions.append(f"{alias}.restaurant_id = %s")
+            params.append(restaurant_id)
+        if start is not None:
+            conditions.append(f"{alias}.sales_date >= %s")
+            params.append(start.date() if isinstance(start, datetime) else start)
+        if end is not None:
+            conditions.append(f"{alias}.sales_date < %s")
+            params.append(end.date() if isinstance(end, datetime) else end)
+        return " AND ".join(conditions) or "TRUE", tuple(params)
+    
+    def get_summary(self, restaurant_id: int = None, start: datetime = None, end: datetime = None):
+        where, params = self._filters(restaurant_id, start, end)
+        query = f"""
+            SELECT COALESCE(SUM(s.total_orders), 0) as total_orders,
+                   COALESCE(SUM(s.revenue), 0) as total_revenue,
+                   COALESCE(SUM(s.revenue) / NULLIF(SUM(s.total_orders), 0), 0) as avg_order_value,
+                   COALESCE(SUM(s.delivered_paid_orders), 0) as delivered_paid_orders
+            FROM RestaurantDailySales s
+            WHERE {where}
+        """
+        return self.db.execute_query(query, params, fetch=True)[0]
+    
+    def get_status_distribution(self, restaurant_id: int = None, start: datetime = None, end: datetime = None):
+        where, params = self._filters(restaurant_id, start, end)
+        totals = ", ".join(f"COALESCE(SUM(s.{status}_orders), 0) as {status}" for status in ORDER_STATUSES)
+        row = self.db.execute_query(f"SELECT {totals} FROM RestaurantDailySales s WHERE {where}", params, fetch=True)[0]
+        distribution = [{'status': status, 'order_count': row[status]} for status in ORDER_STATUSES if row[status]]
+        return sorted(distribution, key=lambda entry: entry['order_count'], reverse=True)
+    
+    def get_top_items(self, restaurant_id: int = None, limit: int = 10, start: datetime = None, end: datetime = None):
+        where, params = self._filters(restaurant_id, start, end)
+        query = f"""
+            SELECT s.menu_item_id, mi.name as item_name, SUM(s.quantity_sold) as quantity_sold, SUM(s.revenue) as revenue
+            FROM MenuItemDailySales s
+            JOIN MenuItems mi ON s.menu_item_id = mi.id
+            WHERE {where}
+            GROUP BY s.menu_item_id, mi.name
+            ORDER BY quantity_sold DESC
+            LIMIT %s
+        """
+        return self.db.execute_query(query, params + (limit,), fetch=True)
+    
+    def get_daily_sales(self, restaurant_id: int = None, start: datetime = None, end: datetime = None):
+        where, params = self._filters(restaurant_id, start, end)
+        query = f"""
+            SELECT s.sales_date, SUM(s.total_orders) as total_orders, SUM(s.revenue) as revenue
+            FROM RestaurantDailySales s
+            WHERE {where}
+            GROUP BY s.sales_date
+            ORDER BY s.sales_date
+        """
+        return self.db.execute_query(query, params, fetch=True)
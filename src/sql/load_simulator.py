@@ -0,0 +1,439 @@
+import abc
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+
+import pymysql
+
+from sql.db_operations import PoolTimeoutError
+from sql.registry import OperationsRegistry
+from sql.session_cart import SessionCart
+
+logger = logging.getLogger(__name__)
+
+ROLES = ('customer', 'partner', 'admin')
+
+LOCK_ERRORS = {1205: 'lock_wait_timeout', 1213: 'deadlock'}
+
+SEARCH_TERMS = ('chicken', 'paneer', 'pizza', 'biryani', 'dosa', 'noodles', 'burger', 'salad')
+
+ADMIN_TRANSITIONS = {'pending': 'confirmed', 'confirmed': 'preparing', 'preparing': 'ready'}
+
+class ActionStats:
+    def __init__(self, max_samples: int = 10000, seed: int = None):
+        self.max_samples = max_samples
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._calls = {}
+        self._max = {}
+        self._errors = {}
+    
+    def record(self, action: str, elapsed_ms: float, error: str = None):
+        with self._lock:
+            calls = self._calls.get(action, 0) + 1
+            self._calls[action] = calls
+            self._max[action] = max(self._max.get(action, elapsed_ms), elapsed_ms)
+            samples = self._samples.setdefault(action, [])
+            if len(samples) < self.max_samples:
+                samples.append(elapsed_ms)
+            else:
+                slot = self._rng.randrange(calls)
+                if slot < self.max_samples:
+                    samples[slot] = elapsed_ms
+            if error is not None:
+                errors = self._errors.setdefault(action, {})
+                errors[error] = errors.get(error, 0) + 1
+    
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float):
+        return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+    
+    def summary(self, elapsed: float):
+        with self._lock:
+            items = [(action, self._calls[action], self._max[action], sorted(samples), dict(self._errors.get(action, {}))) for action, samples in self._samples.items()]
+        rows = []
+        for action, calls, slowest, ordered, errors in sorted(items):
+            rows.append({
+                'action': action,
+                'calls': calls,
+                'per_second': round(calls / elapsed, 2) if elapsed else 0.0,
+                'errors': sum(errors.values()),
+                'error_types': errors,
+                'p50_ms': round(self._percentile(ordered, 0.50), 2),
+                'p95_ms': round(self._percentile(ordered, 0.95), 2),
+                'p99_ms': round(self._percentile(ordered, 0.99), 2),
+                'max_ms': round(slowest, 2)
+            })
+        return rows
+
+def _error_type(error: Exception):
+    if isinstance(error, PoolTimeoutError):
+        return 'pool_timeout'
+    if isinstance(error, pymysql.err.MySQLError) and error.args and error.args[0] in LOCK_ERRORS:
+        return LOCK_ERRORS[error.args[0]]
+    return type(error).__name__
+
+class VirtualUser(abc.ABC):
+    role = None
+    
+    def __init__(self, simulator, rng: random.Random):
+        self.simulator = simulator
+        self.ops = simulator.ops
+        self.rng = rng
+    
+    def timed(self, action: str, call, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = call(*args, **kwargs)
+        except Exception as e:
+            self.simulator.stats.record(f"{self.role}.{action}", (time.perf_counter() - start) * 1000, _error_type(e))
+            raise
+        self.simulator.stats.record(f"{self.role}.{action}", (time.perf_counter() - start) * 1000)
+        return result
+    
+    def think(self):
+        self.simulator.think(self.rng)
+    
+    @abc.abstractmethod
+    def session(self):
+        pass
+
+class CustomerUser(VirtualUser):
+    role = 'customer'
+    
+    def __init__(self, simulator, rng: random.Random, customer_id: int):
+        super().__init__(simulator, rng)
+        self.customer_id = customer_id
+        self.cart = SessionCart(self.ops.cart_ops, customer_id, flush_interval=simulator.cart_flush_interval)
+    
+    def browse(self):
+        if self.rng.random() < self.simulator.search_ratio:
+            return self.timed('search', self.ops.menu_item_ops.search, self.rng.choice(SEARCH_TERMS), {'max_price': 500}, limit=50)
+        restaurants = [r for r in self.timed('list_restaurants', self.ops.restaurant_ops.read_all) if r['is_active']]
+        if not restaurants:
+            return []
+        self.think()
+        return self.timed('view_menu', self.ops.menu_item_ops.read_available_by_restaurant, self.rng.choice(restaurants)['id'])
+    
+    def fill_cart(self, menu_items: List[Dict[str, Any]]):
+        restaurant_id = self.cart.items()[0]['restaurant_id'] if self.cart.items() else menu_items[0]['restaurant_id']
+        choices = [item for item in menu_items if item['restaurant_id'] == restaurant_id and item['is_available']]
+        for item in self.rng.sample(choices, min(len(choices), self.rng.randint(1, 3))):
+            self.cart.add_item(item, self.rng.randint(1, 3))
+        self.timed('flush_cart', self.cart.flush_if_due)
+    
+    def checkout(self):
+        order_ops = self.ops.order_ops
+        
+        def place_order(cart_items):
+            with order_ops.db.transaction():
+                prices = order_ops.get_prices([item['menu_item_id'] for item in cart_items])
+                total_amount = sum(prices[item['menu_item_id']] * item['quantity'] for item in cart_items)
+                order_id = order_ops.create(self.customer_id, cart_items[0]['restaurant_id'], f"{self.rng.randint(1, 999)} Load Test Road", total_amount, self.rng.choice(['Cash', 'UPI', 'Credit Card']))
+                order_ops.add_items(order_id, [
+                    {'menu_item_id': item['menu_item_id'], 'quantity': item['quantity'], 'price_per_item': prices[item['menu_item_id']]}
+                    for item in cart_items
+                ])
+                self.ops.cart_ops.clear_cart(self.customer_id)
+            return order_id
+        
+        with self.cart.checkout() as cart_items:
+            order_id = self.timed('checkout', place_order, cart_items)
+        self.simulator.count('orders_placed')
+        return order_id
+    
+    def check_orders(self):
+        orders, _ = self.timed('list_orders', self.ops.order_ops.read_page, limit=20, customer_id=self.customer_id)
+        if orders:
+            self.timed('order_items', self.ops.order_ops.get_order_items_for_orders, [order['id'] for order in orders])
+    
+    def session(self):
+        menu_items = self.browse()
+        self.think()
+        if menu_items:
+            self.fill_cart(menu_items)
+            self.think()
+        if self.cart.items() and self.rng.random() < self.simulator.checkout_ratio:
+            self.checkout()
+            self.think()
+        self.check_orders()
+
+class PartnerUser(VirtualUser):
+    role = 'partner'
+    
+    def __init__(self, simulator, rng: random.Random, partner: Dict[str, Any]):
+        super().__init__(simulator, rng)
+        self.partner_id = partner['id']
+        self.user_id = partner['user_id']
+    
+    def session(self):
+        partner = self.timed('profile', self.ops.delivery_partner_ops.read_by_id, self.partner_id)
+        if not partner:
+            return
+        if not partner['is_online']:
+            self.timed('go_online', self.ops.delivery_partner_ops.update_online_status, self.partner_id, True)
+        near = None
+        if partner['current_latitude'] is not None and partner['current_longitude'] is not None:
+            near = (float(partner['current_latitude']), float(partner['current_longitude']))
+            self.timed('update_location', self.ops.location_ingestor.submit, self.partner_id, near[0] + self.rng.uniform(-0.005, 0.005), near[1] + self.rng.uniform(-0.005, 0.005))
+        available = self.timed('poll_available', self.ops.order_ops.read_available_for_pickup, limit=50, near=near)
+        if available:
+            self.timed('order_items', self.ops.order_ops.get_order_items_for_orders, [order['id'] for order in available])
+            self.think()
+            self.timed('accept', self.ops.order_ops.assign_delivery_partner, self.rng.choice(available[:5])['id'], self.user_id)
+            self.simulator.count('orders_accepted')
+        self.think()
+        orders, _ = self.timed('my_orders', self.ops.order_ops.read_page, limit=20, delivery_partner_id=self.user_id)
+        for order in orders:
+            if order['status'] in ('confirmed', 'preparing', 'ready'):
+                self.timed('pick_up', self.ops.order_ops.update_status, order['id'], 'picked_up')
+                self.simulator.count('orders_picked_up')
+                self.think()
+            elif order['status'] == 'picked_up':
+                self.timed('deliver', self.ops.order_ops.update_status, order['id'], 'delivered')
+                self.simulator.count('orders_delivered')
+                self.think()
+
+class AdminUser(VirtualUser):
+    role = 'admin'
+    
+    def __init__(self, simulator, rng: random.Random, admin_id: int):
+        super().__init__(simulator, rng)
+        self.admin_id = admin_id
+    
+    def session(self):
+        restaurants = self.timed('restaurants', self.ops.restaurant_ops.read_by_admin, self.admin_id)
+        if not restaurants:
+            return
+        restaurant_id = self.rng.choice(restaurants)['id']
+        status = self.rng.choice(list(ADMIN_TRANSITIONS))
+        orders, _ = self.timed('list_orders', self.ops.order_ops.read_page, limit=20, restaurant_id=restaurant_id, status=status)
+        if orders:
+            self.timed('order_items', self.ops.order_ops.get_order_items_for_orders, [order['id'] for order in orders])
+        for order in orders[:self.rng.randint(1, 5)]:
+            self.think()
+            self.timed('advance_status', self.ops.order_ops.update_status, order['id'], ADMIN_TRANSITIONS[order['status']])
+            self.simulator.count('statuses_advanced')
+        if self.rng.random() < self.simulator.analytics_ratio:
+            self.think()
+            start = datetime.now() - timedelta(days=30)
+            analytics_ops = self.ops.analytics_ops
+            self.timed('analytics_summary', analytics_ops.get_summary, restaurant_id, start=start)
+            self.timed('analytics_daily_sales', analytics_ops.get_daily_sales, restaurant_id, start=start)
+            self.timed('analytics_status_distribution', analytics_ops.get_status_distribution, restaurant_id, start=start)
+            self.timed('analytics_top_items', analytics_ops.get_top_items, restaurant_id, limit=10, start=start)
+
+class LoadSimulator:
+    def __init__(self, ops: OperationsRegistry, users: int = 20, mix: Dict[str, float] = None, think_time: tuple = (0.5, 2.0), duration: float = 60.0, ramp_up: float = 10.0, seed: int = None, search_ratio: float = 0.3, checkout_ratio: float = 0.6, analytics_ratio: float = 0.3, cart_flush_interval: float = 30.0):
+        self.ops = ops
+        self.db = ops.db
+        self.users = users
+        self.mix = mix or {'customer': 0.7, 'partner': 0.2, 'admin': 0.1}
+        self.think_time = think_time
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.seed = seed
+        self.search_ratio = search_ratio
+        self.checkout_ratio = checkout_ratio
+        self.analytics_ratio = analytics_ratio
+        self.cart_flush_interval = cart_flush_interval
+        self.stats = ActionStats(seed=seed)
+        self._counters = {}
+        self._counter_lock = threading.Lock()
+        self._stop = threading.Event()
+    
+    def count(self, name: str, amount: int = 1):
+        with self._counter_lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+    
+    def think(self, rng: random.Random):
+        low, high = self.think_time
+        self._stop.wait(rng.uniform(low, high))
+    
+    def _identities(self):
+        customers = [row['id'] for row in self.db.execute_query("SELECT id FROM Users WHERE role = 'customer' ORDER BY id LIMIT %s", (self.users,), fetch=True)]
+        partners = self.db.execute_query("SELECT id, user_id FROM DeliveryPartners ORDER BY id LIMIT %s", (self.users,), fetch=True)
+        admins = [row['id'] for row in self.db.execute_query("SELECT DISTINCT admin_id as id FROM Restaurants WHERE admin_id IS NOT NULL ORDER BY admin_id LIMIT %s", (self.users,), fetch=True)]
+        return {'customer': customers, 'partner': partners, 'admin': admins}
+    
+    def _roles(self, rng: random.Random):
+        total = sum(self.mix.values())
+        counts = {role: int(self.users * self.mix.get(role, 0) / total) for role in ROLES}
+        for role in sorted(ROLES, key=lambda role: self.mix.get(role, 0), reverse=True)[:self.users - sum(counts.values())]:
+            counts[role] += 1
+        roles = [role for role in ROLES for _ in range(counts[role])]
+        rng.shuffle(roles)
+        return roles
+    
+    def _build_users(self):
+        rng = random.Random(self.seed)
+        identities = self._identities()
+        virtual_users = []
+        for n, role in enumerate(self._roles(rng)):
+            if not identities[role]:
+                raise RuntimeError(f"No {role} accounts in the database to simulate; load data with sql.data_generator first")
+            identity = identities[role][n % len(identities[role])]
+            user_rng = random.Random(rng.random())
+            if role == 'customer':
+                virtual_users.append(CustomerUser(self, user_rng, identity))
+            elif role == 'partner':
+                virtual_users.append(PartnerUser(self, user_rng, identity))
+            else:
+                virtual_users.append(AdminUser(self, user_rng, identity))
+        return virtual_users
+    
+    def _run_user(self, virtual_user: VirtualUser, delay: float, deadline: float):
+        if self._stop.wait(delay):
+            return
+        while not self._stop.is_set() and time.monotonic() < deadline:
+            try:
+                virtual_user.session()
+                self.count(f"{virtual_user.role}_sessions")
+            except Exception as e:
+                self.count(f"{virtual_user.role}_failed_sessions")
+                logger.debug("%s session failed: %s", virtual_user.role, e)
+            self.think(virtual_user.rng)
+        if isinstance(virtual_user, CustomerUser):
+            try:
+                virtual_user.cart.flush()
+            except Exception as e:
+                logger.warning("Could not flush cart for customer %s: %s", virtual_user.customer_id, e)
+    
+    def _lock_status(self):
+        rows = self.db.execute_query("SHOW GLOBAL STATUS WHERE Variable_name IN ('Innodb_row_lock_waits', 'Innodb_row_lock_time', 'Innodb_row_lock_current_waits')", fetch=True)
+        return {row['Variable_name']: int(row['Value']) for row in rows}
+    
+    def run(self):
+        virtual_users = self._build_users()
+        lock_before = self._lock_status()
+        pool_before = self.db.pool_stats()
+        self.db.query_stats.reset()
+        start = time.monotonic()
+        deadline = start + self.ramp_up + self.duration
+        threads = [
+            threading.Thread(target=self._run_user, args=(virtual_user, self.ramp_up * n / max(1, len(virtual_users)), deadline), name=f"vu-{virtual_user.role}-{n}", daemon=True)
+            for n, virtual_user in enumerate(virtual_users)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        elapsed = time.monotonic() - start
+        lock_after = self._lock_status()
+        pool_after = self.db.pool_stats()
+        actions = self.stats.summary(elapsed)
+        with self._counter_lock:
+            counters = dict(self._counters)
+        return {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'settings': {
+                'users': self.users,
+                'roles': {role: sum(1 for virtual_user in virtual_users if virtual_user.role == role) for role in ROLES},
+                'think_time': list(self.think_time),
+                'duration': self.duration,
+                'ramp_up': self.ramp_up,
+                'seed': self.seed
+            },
+            'elapsed_seconds': round(elapsed, 2),
+            'throughput': {
+                'actions_per_second': round(sum(row['calls'] for row in actions) / elapsed, 2),
+                'sessions_per_second': round(sum(value for name, value in counters.items() if name.endswith('_sessions') and 'failed' not in name) / elapsed, 2),
+                'queries_per_second': round(sum(row['calls'] for row in self.db.query_summary()) / elapsed, 2)
+            },
+            'errors': sum(row['errors'] for row in actions),
+            'counters': counters,
+            'lock_waits': {
+                'row_lock_waits': lock_after['Innodb_row_lock_waits'] - lock_before['Innodb_row_lock_waits'],
+                'row_lock_time_ms': lock_after['Innodb_row_lock_time'] - lock_before['Innodb_row_lock_time'],
+                'lock_wait_timeouts': sum(row['error_types'].get('lock_wait_timeout', 0) for row in actions),
+                'deadlocks': sum(row['error_types'].get('deadlock', 0) for row in actions),
+                'pool_waits': pool_after['waits'] - pool_before['waits'],
+                'pool_wait_seconds': round(pool_after['wait_time_total'] - pool_before['wait_time_total'], 3),
+                'pool_timeouts': pool_after['timeouts'] - pool_before['timeouts']
+            },
+            'actions': actions,
+            'location_ingestion': self.ops.location_ingestor.stats(),
+            'slowest_queries': self.db.query_summary()[:10]
+        }
+    
+    def stop(self):
+        self._stop.set()
+
+def _parse_mix(value: str):
+    mix = {}
+    for part in value.split(','):
+        role, _, weight = part.partition('=')
+        if role.strip() not in ROLES:
+            raise argparse.ArgumentTypeError(f"Unknown role '{role}' in mix; expected one of {', '.join(ROLES)}")
+        mix[role.strip()] = float(weight)
+    return mix
+
+def _print_report(report: Dict[str, Any]):
+    print(f"\n{report['settings']['users']} virtual users {report['settings']['roles']} for {report['elapsed_seconds']}s")
+    print(f"Throughput: {report['throughput']['actions_per_second']} actions/s, {report['throughput']['sessions_per_second']} sessions/s, {report['throughput']['queries_per_second']} queries/s")
+    print(f"Errors: {report['errors']}  Lock waits: {report['lock_waits']}")
+    print(f"Counters: {report['counters']}\n")
+    print(f"{'action':40} {'calls':>8} {'/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for row in report['actions']:
+        print(f"{row['action']:40} {row['calls']:>8} {row['per_second']:>8} {row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9} {row['errors']:>7}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the Operations classes with concurrent virtual customers, delivery partners and restaurant admins. Writes orders, carts and status changes to the target database.")
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')))
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'))
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''))
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'food_delivery'))
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--mix', type=_parse_mix, default='customer=70,partner=20,admin=10')
+    parser.add_argument('--think-min', type=float, default=0.5)
+    parser.add_argument('--think-max', type=float, default=2.0)
+    parser.add_argument('--duration', type=float, default=60.0)
+    parser.add_argument('--ramp-up', type=float, default=10.0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--search-ratio', type=float, default=0.3)
+    parser.add_argument('--checkout-ratio', type=float, default=0.6)
+    parser.add_argument('--analytics-ratio', type=float, default=0.3)
+    parser.add_argument('--pool-size', type=int, default=10)
+    parser.add_argument('--output', help="Write the full report as JSON")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    
+    ops = OperationsRegistry.connect(args.host, args.user, args.password, args.database, args.port, pool_size=args.pool_size, slow_query_ms=float('inf'))
+    simulator = LoadSimulator(
+        ops,
+        users=args.users,
+        mix=args.mix,
+        think_time=(args.think_min, args.think_max),
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        seed=args.seed,
+        search_ratio=args.search_ratio,
+        checkout_ratio=args.checkout_ratio,
+        analytics_ratio=args.analytics_ratio
+    )
+    logger.info("Starting %s virtual users for %ss (ramp-up %ss)", args.users, args.duration, args.ramp_up)
+    try:
+        report = simulator.run()
+    finally:
+        ops.close()
+    _print_report(report)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2, default=str)
+        print(f"\nReport written to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+from datetime import datetime
+
+from sql.db_operations import DatabaseConnection, DeliveryPartnerOperations, DeliveryTrackingOperations
+
+logger = logging.getLogger(__name__)
+
+class IngestionQueueFull(Exception):
+    pass
+
+class LocationIngestor:
+    def __init__(self, db: DatabaseConnection, max_pending: int = 10000, flush_size: int = 500, flush_interval: float = 2.0, block_timeout: float = 0.0):
+        self.partner_ops = DeliveryPartnerOperations(db)
+        self.tracking_ops = DeliveryTrackingOperations(db)
+        self.max_pending = max_pending
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self._pending = {}
+        self._user_ids = {}
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopping = False
+        self._counters = {
+            'accepted': 0,
+            'coalesced': 0,
+            'rejected': 0,
+            'blocked': 0,
+            'blocked_time': 0.0,
+            'flushes': 0,
+            'positions_written': 0,
+            'tracking_rows_written': 0,
+            'flush_errors': 0,
+            'last_flush_ms': 0.0,
+            'max_pending_seen': 0
+        }
+    
+    def submit(self, delivery_partner_id: int, latitude: float, longitude: float, order_id: int = None, status: str = 'on_the_way', timestamp: datetime = None):
+        ping = {
+            'delivery_partner_id': delivery_partner_id,
+            'latitude': latitude,
+            'longitude': longitude,
+            'order_id': order_id,
+            'status': status,
+            'timestamp': timestamp or datetime.now()
+        }
+        with self._cond:
+            if delivery_partner_id in self._pending:
+                self._pending[delivery_partner_id] = ping
+                self._counters['coalesced'] += 1
+                return True
+            if len(self._pending) >= self.max_pending:
+                start = time.monotonic()
+                deadline = start + self.block_timeout
+                self._counters['blocked'] += 1
+                self._cond.notify_all()
+                while len(self._pending) >= self.max_pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                self._counters['blocked_time'] += time.monotonic() - start
+                if len(self._pending) >= self.max_pending:
+                    self._counters['rejected'] += 1
+                    raise IngestionQueueFull(f"{len(self._pending)} partners pending, ping for {delivery_partner_id} dropped")
+            self._pending[delivery_partner_id] = ping
+            self._counters['accepted'] += 1
+            self._counters['max_pending_seen'] = max(self._counters['max_pending_seen'], len(self._pending))
+            if len(self._pending) >= self.flush_size:
+                self._cond.notify_all()
+        return True
+    
+    def flush(self):
+        with self._flush_lock:
+            with self._cond:
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._cond.notify_all()
+            if not batch:
+                return 0
+            start = time.perf_counter()
+            try:
+                tracked = [ping for ping in batch if ping['order_id'] is not None]
+                unknown = {ping['delivery_partner_id'] for ping in tracked} - set(self._user_ids)
+                if unknown:
+                    self._user_ids.update(self.partner_ops.get_user_ids(list(unknown)))
+                points = [
+                    dict(ping, delivery_partner_id=self._user_ids[ping['delivery_partner_id']])
+                    for ping in tracked if ping['delivery_partner_id'] in self._user_ids
+                ]
+                with self.partner_ops.db.transaction():
+                    for start_index in range(0, len(batch), self.flush_size):
+                        self.partner_ops.update_locations(batch[start_index:start_index + self.flush_size])
+                    self.tracking_ops.add_points(points)
+            except Exception:
+                with self._cond:
+                    self._counters['flush_errors'] += 1
+                    for ping in batch:
+                        self._pending.setdefault(ping['delivery_partner_id'], ping)
+                raise
+            with self._cond:
+                self._counters['flushes'] += 1
+                self._counters['positions_written'] += len(batch)
+                self._counters['tracking_rows_written'] += len(points)
+                self._counters['last_flush_ms'] = (time.perf_counter() - start) * 1000
+            return len(batch)
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._stopping and len(self._pending) < self.flush_size:
+                    self._cond.wait(self.flush_interval)
+                stopping = self._stopping
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Location flush failed")
+                if not stopping:
+                    time.sleep(self.flush_interval)
+            if stopping:
+                return
+    
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='location-ingestor', daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def stats(self):
+        with self._cond:
+            stats = dict(self._counters)
+            stats['pending'] = len(self._pending)
+            stats['max_pending'] = self.max_pending
+        return stats
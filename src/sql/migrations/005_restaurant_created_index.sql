@@ -0,0 +1,3 @@
+-- user-005: composite index for per-restaurant analytics over a date range
+
+CALL add_index_if_missing('Orders', 'idx_restaurant_created', 'INDEX idx_restaurant_created (restaurant_id, created_at)');
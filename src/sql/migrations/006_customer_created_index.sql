@@ -0,0 +1,3 @@
+-- user-006: keyset pagination of a customer's orders by (created_at, id)
+
+CALL add_index_if_missing('Orders', 'idx_customer_created', 'INDEX idx_customer_created (customer_id, created_at)');
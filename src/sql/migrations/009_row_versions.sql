@@ -0,0 +1,6 @@
+-- user-009: version columns for optimistic concurrency checks in update()
+
+CALL add_column_if_missing('Users', 'version', 'INT NOT NULL DEFAULT 0 AFTER role');
+CALL add_column_if_missing('Restaurants', 'version', 'INT NOT NULL DEFAULT 0 AFTER admin_id');
+CALL add_column_if_missing('MenuItems', 'version', 'INT NOT NULL DEFAULT 0 AFTER image_url');
+CALL add_column_if_missing('Orders', 'version', 'INT NOT NULL DEFAULT 0 AFTER actual_delivery_time');
@@ -0,0 +1,5 @@
+-- user-013: restaurant coordinates and the open-orders index for the available-for-pickup query
+
+CALL add_column_if_missing('Restaurants', 'latitude', 'DECIMAL(10,8) AFTER admin_id');
+CALL add_column_if_missing('Restaurants', 'longitude', 'DECIMAL(11,8) AFTER latitude');
+CALL add_index_if_missing('Orders', 'idx_open_orders', 'INDEX idx_open_orders (status, delivery_partner_id, created_at)');
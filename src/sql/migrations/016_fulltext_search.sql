@@ -0,0 +1,4 @@
+-- user-016: FULLTEXT indexes for menu search across all restaurants
+
+CALL add_index_if_missing('Restaurants', 'ft_restaurant_search', 'FULLTEXT INDEX ft_restaurant_search (name, cuisine_type)');
+CALL add_index_if_missing('MenuItems', 'ft_menu_search', 'FULLTEXT INDEX ft_menu_search (name, description)');
@@ -0,0 +1,109 @@
+-- user-017: incremental rating aggregates maintained by triggers
+
+CALL add_column_if_missing('Restaurants', 'rating_sum', 'INT NOT NULL DEFAULT 0 AFTER longitude');
+CALL add_column_if_missing('Restaurants', 'rating_count', 'INT NOT NULL DEFAULT 0 AFTER rating_sum');
+CALL add_column_if_missing('MenuItems', 'rating_sum', 'INT NOT NULL DEFAULT 0 AFTER image_url');
+CALL add_column_if_missing('MenuItems', 'rating_count', 'INT NOT NULL DEFAULT 0 AFTER rating_sum');
+
+-- Replace the recomputing rating trigger with the incremental ones
+DROP TRIGGER IF EXISTS update_restaurant_rating;
+DROP TRIGGER IF EXISTS restaurant_rating_insert;
+DROP TRIGGER IF EXISTS restaurant_rating_update;
+DROP TRIGGER IF EXISTS restaurant_rating_delete;
+DROP TRIGGER IF EXISTS item_rating_insert;
+DROP TRIGGER IF EXISTS item_rating_update;
+DROP TRIGGER IF EXISTS item_rating_delete;
+
+DELIMITER //
+CREATE TRIGGER restaurant_rating_insert
+AFTER INSERT ON RestaurantRatings
+FOR EACH ROW
+BEGIN
+    UPDATE Restaurants
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1,
+        rating = rating_sum / rating_count
+    WHERE id = NEW.restaurant_id;
+END//
+
+CREATE TRIGGER restaurant_rating_update
+AFTER UPDATE ON RestaurantRatings
+FOR EACH ROW
+BEGIN
+    UPDATE Restaurants
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1,
+        rating = COALESCE(rating_sum / NULLIF(rating_count, 0), 0)
+    WHERE id = OLD.restaurant_id;
+    UPDATE Restaurants
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1,
+        rating = rating_sum / rating_count
+    WHERE id = NEW.restaurant_id;
+END//
+
+CREATE TRIGGER restaurant_rating_delete
+AFTER DELETE ON RestaurantRatings
+FOR EACH ROW
+BEGIN
+    UPDATE Restaurants
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1,
+        rating = COALESCE(rating_sum / NULLIF(rating_count, 0), 0)
+    WHERE id = OLD.restaurant_id;
+END//
+
+CREATE TRIGGER item_rating_insert
+AFTER INSERT ON ItemRatings
+FOR EACH ROW
+BEGIN
+    UPDATE MenuItems
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1
+    WHERE id = NEW.menu_item_id;
+END//
+
+CREATE TRIGGER item_rating_update
+AFTER UPDATE ON ItemRatings
+FOR EACH ROW
+BEGIN
+    UPDATE MenuItems
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1
+    WHERE id = OLD.menu_item_id;
+    UPDATE MenuItems
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1
+    WHERE id = NEW.menu_item_id;
+END//
+
+CREATE TRIGGER item_rating_delete
+AFTER DELETE ON ItemRatings
+FOR EACH ROW
+BEGIN
+    UPDATE MenuItems
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1
+    WHERE id = OLD.menu_item_id;
+END//
+DELIMITER ;
+
+-- Backfill the aggregates from the existing ratings; the triggers keep them current from here on
+UPDATE Restaurants r
+LEFT JOIN (
+    SELECT restaurant_id, SUM(rating) AS rating_sum, COUNT(*) AS rating_count
+    FROM RestaurantRatings
+    GROUP BY restaurant_id
+) agg ON agg.restaurant_id = r.id
+SET r.rating_sum = COALESCE(agg.rating_sum, 0),
+    r.rating_count = COALESCE(agg.rating_count, 0),
+    r.rating = COALESCE(agg.rating_sum / agg.rating_count, 0);
+
+UPDATE MenuItems mi
+LEFT JOIN (
+    SELECT menu_item_id, SUM(rating) AS rating_sum, COUNT(*) AS rating_count
+    FROM ItemRatings
+    GROUP BY menu_item_id
+) agg ON agg.menu_item_id = mi.id
+SET mi.rating_sum = COALESCE(agg.rating_sum, 0),
+    mi.rating_count = COALESCE(agg.rating_count, 0);
@@ -0,0 +1,48 @@
+-- user-018: Orders.updated_at for the incremental refresh, plus the daily sales rollup tables
+
+-- Added as NULL first so existing rows can take created_at; re-runs find no NULLs and leave updated_at alone
+CALL add_column_if_missing('Orders', 'updated_at', 'TIMESTAMP NULL DEFAULT NULL ON UPDATE CURRENT_TIMESTAMP AFTER created_at');
+UPDATE Orders SET updated_at = created_at WHERE updated_at IS NULL;
+ALTER TABLE Orders MODIFY COLUMN updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+CALL add_index_if_missing('Orders', 'idx_updated', 'INDEX idx_updated (updated_at)');
+
+-- Daily sales rollups, refreshed incrementally from Orders.updated_at
+CREATE TABLE IF NOT EXISTS RestaurantDailySales (
+    restaurant_id INT NOT NULL,
+    sales_date DATE NOT NULL,
+    total_orders INT NOT NULL DEFAULT 0,
+    paid_orders INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    delivered_paid_orders INT NOT NULL DEFAULT 0,
+    pending_orders INT NOT NULL DEFAULT 0,
+    confirmed_orders INT NOT NULL DEFAULT 0,
+    preparing_orders INT NOT NULL DEFAULT 0,
+    ready_orders INT NOT NULL DEFAULT 0,
+    picked_up_orders INT NOT NULL DEFAULT 0,
+    delivered_orders INT NOT NULL DEFAULT 0,
+    cancelled_orders INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (restaurant_id, sales_date),
+    FOREIGN KEY (restaurant_id) REFERENCES Restaurants(id) ON DELETE CASCADE,
+    INDEX idx_sales_date (sales_date)
+);
+
+CREATE TABLE IF NOT EXISTS MenuItemDailySales (
+    menu_item_id INT NOT NULL,
+    sales_date DATE NOT NULL,
+    restaurant_id INT NOT NULL,
+    quantity_sold INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (menu_item_id, sales_date),
+    FOREIGN KEY (menu_item_id) REFERENCES MenuItems(id) ON DELETE CASCADE,
+    FOREIGN KEY (restaurant_id) REFERENCES Restaurants(id) ON DELETE CASCADE,
+    INDEX idx_restaurant_date (restaurant_id, sales_date),
+    INDEX idx_sales_date (sales_date)
+);
+
+CREATE TABLE IF NOT EXISTS RollupWatermarks (
+    name VARCHAR(50) PRIMARY KEY,
+    high_water_mark TIMESTAMP NULL,
+    refreshed_at TIMESTAMP NULL
+);
+
+-- The rollups start empty; build them once from the System Admin overview
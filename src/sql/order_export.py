@@ -0,0 +1,150 @@
+import argparse
+import csv
+import gzip
+import io
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from sql.db_operations import DatabaseConnection, OrderOperations, ORDER_LINE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('csv', 'csv.gz', 'parquet')
+
+MONEY = pa.decimal128(10, 2)
+
+PARQUET_SCHEMA = pa.schema([
+    ('order_id', pa.int64()),
+    ('created_at', pa.timestamp('s')),
+    ('status', pa.string()),
+    ('payment_status', pa.string()),
+    ('payment_method', pa.string()),
+    ('total_amount', MONEY),
+    ('customer_id', pa.int64()),
+    ('customer_username', pa.string()),
+    ('restaurant_id', pa.int64()),
+    ('restaurant_name', pa.string()),
+    ('delivery_partner_id', pa.int64()),
+    ('delivery_partner_username', pa.string()),
+    ('delivery_address', pa.string()),
+    ('actual_delivery_time', pa.timestamp('s')),
+    ('menu_item_id', pa.int64()),
+    ('item_name', pa.string()),
+    ('quantity', pa.int32()),
+    ('price_per_item', MONEY),
+    ('subtotal', MONEY)
+])
+
+class _CountingWriter(io.RawIOBase):
+    def __init__(self, handle):
+        self.handle = handle
+        self.bytes_written = 0
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        written = self.handle.write(data)
+        self.bytes_written += len(data)
+        return written
+
+class OrderExporter:
+    def __init__(self, order_ops: OrderOperations, chunk_size: int = 5000):
+        self.order_ops = order_ops
+        self.chunk_size = chunk_size
+    
+    def _write_csv(self, chunks, handle, compress: bool):
+        binary = gzip.GzipFile(fileobj=handle, mode='wb', compresslevel=6) if compress else handle
+        text = io.TextIOWrapper(io.BufferedWriter(binary, 1 << 20), encoding='utf-8', newline='')
+        try:
+            writer = csv.writer(text)
+            writer.writerow(ORDER_LINE_COLUMNS)
+            for rows in chunks:
+                writer.writerows(rows)
+                yield rows
+        finally:
+            text.flush()
+            text.detach()
+            if compress:
+                binary.close()
+    
+    def _write_parquet(self, chunks, handle):
+        with pq.ParquetWriter(handle, PARQUET_SCHEMA, compression='zstd') as writer:
+            for rows in chunks:
+                columns = zip(*rows)
+                writer.write_table(pa.Table.from_arrays([pa.array(values, type=field.type) for values, field in zip(columns, PARQUET_SCHEMA)], schema=PARQUET_SCHEMA))
+                yield rows
+    
+    def export(self, handle, fmt: str = 'csv', start: datetime = None, end: datetime = None, restaurant_id: int = None, progress=None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        counter = _CountingWriter(handle)
+        chunks = self.order_ops.stream_order_lines(start, end, restaurant_id, chunk_size=self.chunk_size)
+        written = self._write_parquet(chunks, counter) if fmt == 'parquet' else self._write_csv(chunks, counter, fmt == 'csv.gz')
+        began = time.perf_counter()
+        rows = orders = 0
+        last_order = None
+        try:
+            for chunk in written:
+                rows += len(chunk)
+                for row in chunk:
+                    if row[0] != last_order:
+                        orders += 1
+                        last_order = row[0]
+                if progress is not None:
+                    progress(rows, orders)
+        finally:
+            written.close()
+            chunks.close()
+        seconds = time.perf_counter() - began
+        return {
+            'format': fmt,
+            'rows': rows,
+            'orders': orders,
+            'bytes': counter.bytes_written,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(rows / seconds) if seconds else rows,
+            'mb_per_second': round(counter.bytes_written / 1048576 / seconds, 2) if seconds else 0.0
+        }
+    
+    def export_to_path(self, path: str, fmt: str = None, start: datetime = None, end: datetime = None, restaurant_id: int = None, progress=None):
+        fmt = fmt or next((candidate for candidate in ('csv.gz', 'parquet', 'csv') if path.endswith(f".{candidate}")), 'csv')
+        with open(path, 'wb') as handle:
+            return self.export(handle, fmt, start, end, restaurant_id, progress)
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream order history joined with order items to CSV or Parquet")
+    parser.add_argument('--host', default=os.getenv('DB_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('DB_PORT', '3306')))
+    parser.add_argument('--user', default=os.getenv('DB_USER', 'root'))
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD', ''))
+    parser.add_argument('--database', default=os.getenv('DB_NAME', 'food_delivery'))
+    parser.add_argument('--start', type=datetime.fromisoformat, help="First day to include, e.g. 2025-01-01")
+    parser.add_argument('--end', type=datetime.fromisoformat, help="Last day to include, e.g. 2025-12-31")
+    parser.add_argument('--restaurant-id', type=int)
+    parser.add_argument('--format', choices=FORMATS, help="Defaults to the output file extension")
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--output', required=True)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    
+    db = DatabaseConnection(args.host, args.user, args.password, args.database, args.port)
+    end = args.end + timedelta(days=1) if args.end is not None else None
+    
+    def progress(rows: int, orders: int):
+        if rows % (args.chunk_size * 100) == 0:
+            logger.info("%d rows, %d orders exported", rows, orders)
+    
+    try:
+        stats = OrderExporter(OrderOperations(db), args.chunk_size).export_to_path(args.output, args.format, args.start, end, args.restaurant_id, progress)
+    finally:
+        db.close()
+    print(f"Exported {stats['rows']} rows from {stats['orders']} orders to {args.output} ({stats['bytes'] / 1048576:.1f} MB) in {stats['seconds']}s: {stats['rows_per_second']} rows/s, {stats['mb_per_second']} MB/s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import atexit
+
+from sql.db_operations import (
+    DatabaseConnection,
+    UserOperations,
+    RestaurantOperations,
+    MenuItemOperations,
+    OrderOperations,
+    DeliveryPartnerOperations,
+    CartOperations,
+    RatingOperations,
+    RestaurantAnalyticsOperations,
+    RollupRefresher
+)
+from sql.location_ingestion import LocationIngestor
+
+class OperationsRegistry:
+    def __init__(self, db: DatabaseConnection):
+        self.db = db
+        self.user_ops = UserOperations(db)
+        self.restaurant_ops = RestaurantOperations(db)
+        self.menu_item_ops = MenuItemOperations(db)
+        self.order_ops = OrderOperations(db)
+        self.delivery_partner_ops = DeliveryPartnerOperations(db)
+        self.cart_ops = CartOperations(db)
+        self.rating_ops = RatingOperations(db)
+        self.analytics_ops = RestaurantAnalyticsOperations(db)
+        self.location_ingestor = LocationIngestor(db)
+        self.location_ingestor.start()
+        atexit.register(self.location_ingestor.stop)
+        self.rollup_refresher = RollupRefresher(db)
+        self.rollup_refresher.start()
+        atexit.register(self.rollup_refresher.stop)
+    
+    @classmethod
+    def connect(cls, host: str, user: str, password: str, database: str, port: int = 3306, **options):
+        db = DatabaseConnection(host, user, password, database, port, **options)
+        try:
+            with db.get_connection():
+                pass
+        except Exception:
+            db.close()
+            raise
+        return cls(db)
+    
+    def close(self):
+        atexit.unregister(self.location_ingestor.stop)
+        self.location_ingestor.stop()
+        atexit.unregister(self.rollup_refresher.stop)
+        self.rollup_refresher.stop()
+        self.db.close()
@@ -9,6 +9,7 @@ CREATE TABLE Users (
     phone VARCHAR(20),
     address TEXT,
     role ENUM('system_admin', 'restaurant_admin', 'customer', 'delivery_partner') NOT NULL,
+    version INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     INDEX idx_username (username),
     INDEX idx_email (email),
@@ -27,11 +28,17 @@ CREATE TABLE Restaurants (
     rating DECIMAL(3,2) DEFAULT 0.00,
     is_active BOOLEAN DEFAULT TRUE,
     admin_id INT NOT NULL,
+    latitude DECIMAL(10,8),
+    longitude DECIMAL(11,8),
+    rating_sum INT NOT NULL DEFAULT 0,
+    rating_count INT NOT NULL DEFAULT 0,
+    version INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (admin_id) REFERENCES Users(id) ON DELETE CASCADE,
     INDEX idx_name (name),
     INDEX idx_cuisine (cuisine_type),
-    INDEX idx_admin (admin_id)
+    INDEX idx_admin (admin_id),
+    FULLTEXT INDEX ft_restaurant_search (name, cuisine_type)
 );
 
 -- Menu items (Food) table
@@ -46,12 +53,16 @@ CREATE TABLE MenuItems (
     is_available BOOLEAN DEFAULT TRUE,
     preparation_time INT DEFAULT 15,
     image_url VARCHAR(255),
+    rating_sum INT NOT NULL DEFAULT 0,
+    rating_count INT NOT NULL DEFAULT 0,
+    version INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (restaurant_id) REFERENCES Restaurants(id) ON DELETE CASCADE,
     INDEX idx_restaurant (restaurant_id),
     INDEX idx_category (category),
     INDEX idx_price (price),
-    INDEX idx_available (is_available)
+    INDEX idx_available (is_available),
+    FULLTEXT INDEX ft_menu_search (name, description)
 );
 
 -- Orders table
@@ -67,15 +78,21 @@ CREATE TABLE Orders (
     delivery_partner_id INT NULL,
     estimated_delivery_time TIMESTAMP,
     actual_delivery_time TIMESTAMP NULL,
+    version INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (customer_id) REFERENCES Users(id) ON DELETE CASCADE,
     FOREIGN KEY (restaurant_id) REFERENCES Restaurants(id) ON DELETE CASCADE,
     FOREIGN KEY (delivery_partner_id) REFERENCES Users(id) ON DELETE SET NULL,
     INDEX idx_customer (customer_id),
     INDEX idx_restaurant (restaurant_id),
     INDEX idx_status (status),
+    INDEX idx_customer_created (customer_id, created_at),
+    INDEX idx_open_orders (status, delivery_partner_id, created_at),
     INDEX idx_delivery_partner (delivery_partner_id),
-    INDEX idx_created (created_at)
+    INDEX idx_created (created_at),
+    INDEX idx_restaurant_created (restaurant_id, created_at),
+    INDEX idx_updated (updated_at)
 );
 
 -- Order items table (many-to-many relationship)
@@ -171,18 +188,116 @@ CREATE TABLE Cart (
     INDEX idx_customer (customer_id)
 );
 
--- Triggers for automatic rating updates
+-- Daily sales rollups, refreshed incrementally from Orders.updated_at
+CREATE TABLE RestaurantDailySales (
+    restaurant_id INT NOT NULL,
+    sales_date DATE NOT NULL,
+    total_orders INT NOT NULL DEFAULT 0,
+    paid_orders INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    delivered_paid_orders INT NOT NULL DEFAULT 0,
+    pending_orders INT NOT NULL DEFAULT 0,
+    confirmed_orders INT NOT NULL DEFAULT 0,
+    preparing_orders INT NOT NULL DEFAULT 0,
+    ready_orders INT NOT NULL DEFAULT 0,
+    picked_up_orders INT NOT NULL DEFAULT 0,
+    delivered_orders INT NOT NULL DEFAULT 0,
+    cancelled_orders INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (restaurant_id, sales_date),
+    FOREIGN KEY (restaurant_id) REFERENCES Restaurants(id) ON DELETE CASCADE,
+    INDEX idx_sales_date (sales_date)
+);
+
+CREATE TABLE MenuItemDailySales (
+    menu_item_id INT NOT NULL,
+    sales_date DATE NOT NULL,
+    restaurant_id INT NOT NULL,
+    quantity_sold INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (menu_item_id, sales_date),
+    FOREIGN KEY (menu_item_id) REFERENCES MenuItems(id) ON DELETE CASCADE,
+    FOREIGN KEY (restaurant_id) REFERENCES Restaurants(id) ON DELETE CASCADE,
+    INDEX idx_restaurant_date (restaurant_id, sales_date),
+    INDEX idx_sales_date (sales_date)
+);
+
+CREATE TABLE RollupWatermarks (
+    name VARCHAR(50) PRIMARY KEY,
+    high_water_mark TIMESTAMP NULL,
+    refreshed_at TIMESTAMP NULL
+);
+
+-- Triggers for incremental rating aggregates
 DELIMITER //
-CREATE TRIGGER update_restaurant_rating 
+CREATE TRIGGER restaurant_rating_insert
 AFTER INSERT ON RestaurantRatings
 FOR EACH ROW
 BEGIN
-    UPDATE Restaurants 
-    SET rating = (
-        SELECT COALESCE(AVG(rating), 0) 
-        FROM RestaurantRatings 
-        WHERE restaurant_id = NEW.restaurant_id
-    )
+    UPDATE Restaurants
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1,
+        rating = rating_sum / rating_count
     WHERE id = NEW.restaurant_id;
 END//
+
+CREATE TRIGGER restaurant_rating_update
+AFTER UPDATE ON RestaurantRatings
+FOR EACH ROW
+BEGIN
+    UPDATE Restaurants
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1,
+        rating = COALESCE(rating_sum / NULLIF(rating_count, 0), 0)
+    WHERE id = OLD.restaurant_id;
+    UPDATE Restaurants
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1,
+        rating = rating_sum / rating_count
+    WHERE id = NEW.restaurant_id;
+END//
+
+CREATE TRIGGER restaurant_rating_delete
+AFTER DELETE ON RestaurantRatings
+FOR EACH ROW
+BEGIN
+    UPDATE Restaurants
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1,
+        rating = COALESCE(rating_sum / NULLIF(rating_count, 0), 0)
+    WHERE id = OLD.restaurant_id;
+END//
+
+CREATE TRIGGER item_rating_insert
+AFTER INSERT ON ItemRatings
+FOR EACH ROW
+BEGIN
+    UPDATE MenuItems
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1
+    WHERE id = NEW.menu_item_id;
+END//
+
+CREATE TRIGGER item_rating_update
+AFTER UPDATE ON ItemRatings
+FOR EACH ROW
+BEGIN
+    UPDATE MenuItems
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1
+    WHERE id = OLD.menu_item_id;
+    UPDATE MenuItems
+    SET rating_sum = rating_sum + NEW.rating,
+        rating_count = rating_count + 1
+    WHERE id = NEW.menu_item_id;
+END//
+
+CREATE TRIGGER item_rating_delete
+AFTER DELETE ON ItemRatings
+FOR EACH ROW
+BEGIN
+    UPDATE MenuItems
+    SET rating_sum = rating_sum - OLD.rating,
+        rating_count = rating_count - 1
+    WHERE id = OLD.menu_item_id;
+END//
 DELIMITER ;
@@ -0,0 +1,159 @@
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any
+
+from sql.db_operations import CartOperations
+
+logger = logging.getLogger(__name__)
+
+FLUSH_TICK = 1.0
+
+_pending_carts = set()
+_pending_lock = threading.Lock()
+_flusher = None
+
+def _flush_pending():
+    while True:
+        time.sleep(FLUSH_TICK)
+        with _pending_lock:
+            carts = list(_pending_carts)
+        for cart in carts:
+            try:
+                cart.flush_if_due()
+            except Exception:
+                logger.exception("Failed to flush cart for customer %s", cart.customer_id)
+
+def _track_pending(cart):
+    global _flusher
+    with _pending_lock:
+        _pending_carts.add(cart)
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_pending, name='session-cart-flusher', daemon=True)
+            _flusher.start()
+
+def _untrack_pending(cart):
+    with _pending_lock:
+        _pending_carts.discard(cart)
+
+class SessionCart:
+    def __init__(self, cart_ops: CartOperations, customer_id: int, flush_interval: float = 30.0):
+        self.cart_ops = cart_ops
+        self.customer_id = customer_id
+        self.flush_interval = flush_interval
+        self._items = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+        self.writes_coalesced = 0
+        self.flushes = 0
+        for row in cart_ops.get_cart(customer_id):
+            self._items[row['menu_item_id']] = {
+                'menu_item_id': row['menu_item_id'],
+                'item_name': row['item_name'],
+                'price': row['price'],
+                'restaurant_id': row['restaurant_id'],
+                'restaurant_name': row['restaurant_name'],
+                'quantity': row['quantity']
+            }
+    
+    def _touch(self, menu_item_id: int):
+        if menu_item_id in self._dirty:
+            self.writes_coalesced += 1
+        elif not self._dirty:
+            _track_pending(self)
+        self._dirty.add(menu_item_id)
+    
+    def add_item(self, menu_item: Dict[str, Any], quantity: int = 1):
+        with self._lock:
+            self._items[menu_item['id']] = {
+                'menu_item_id': menu_item['id'],
+                'item_name': menu_item['name'],
+                'price': menu_item['price'],
+                'restaurant_id': menu_item['restaurant_id'],
+                'restaurant_name': menu_item['restaurant_name'],
+                'quantity': quantity
+            }
+            self._touch(menu_item['id'])
+    
+    def update_quantity(self, menu_item_id: int, quantity: int):
+        if quantity <= 0:
+            self.remove_item(menu_item_id)
+            return
+        with self._lock:
+            if menu_item_id in self._items and self._items[menu_item_id]['quantity'] != quantity:
+                self._items[menu_item_id]['quantity'] = quantity
+                self._touch(menu_item_id)
+    
+    def remove_item(self, menu_item_id: int):
+        with self._lock:
+            if self._items.pop(menu_item_id, None) is not None:
+                self._touch(menu_item_id)
+    
+    def items(self):
+        with self._lock:
+            rows = [dict(item) for item in self._items.values()]
+        return sorted(rows, key=lambda item: (item['restaurant_name'], item['item_name']))
+    
+    def total(self):
+        with self._lock:
+            return sum(item['price'] * item['quantity'] for item in self._items.values())
+    
+    def is_dirty(self):
+        return bool(self._dirty)
+    
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                dirty = self._dirty
+                self._dirty = set()
+                upserts = [{'menu_item_id': menu_item_id, 'quantity': self._items[menu_item_id]['quantity']} for menu_item_id in dirty if menu_item_id in self._items]
+                removals = [menu_item_id for menu_item_id in dirty if menu_item_id not in self._items]
+            if not dirty:
+                return 0
+            try:
+                with self.cart_ops.db.transaction():
+                    if upserts:
+                        self.cart_ops.upsert_many(self.customer_id, upserts)
+                    if removals:
+                        self.cart_ops.remove_items(self.customer_id, removals)
+            except Exception:
+                with self._lock:
+                    self._dirty |= dirty
+                raise
+            with self._lock:
+                if not self._dirty:
+                    _untrack_pending(self)
+            self._flushed_at = time.monotonic()
+            self.flushes += 1
+            return len(dirty)
+    
+    def flush_if_due(self):
+        if self._dirty and time.monotonic() - self._flushed_at >= self.flush_interval:
+            return self.flush()
+        return 0
+    
+    @contextmanager
+    def checkout(self):
+        # Held for the whole checkout so an in-flight flush cannot re-insert Cart rows after clear_cart
+        with self._flush_lock:
+            yield self.items()
+            with self._lock:
+                self._items.clear()
+                self._dirty.clear()
+                _untrack_pending(self)
+            self._flushed_at = time.monotonic()
+
+def flush_all_carts():
+    with _pending_lock:
+        carts = list(_pending_carts)
+    for cart in carts:
+        try:
+            cart.flush()
+        except Exception:
+            logger.exception("Failed to flush cart for customer %s", cart.customer_id)
+
+atexit.register(flush_all_carts)
@@ -1,5 +1,8 @@
 import streamlit as st
 from typing import Dict, Any
+from ui.pagination import paginate
+from ui.navigation import select_section
+from sql.session_cart import SessionCart
 
 def render_customer_view(user_ops, restaurant_ops, menu_item_ops, order_ops, cart_ops, rating_ops):
     st.header("Food Delivery - Customer View")
@@ -8,36 +11,67 @@ def render_customer_view(user_ops, restaurant_ops, menu_item_ops, order_ops, car
         st.session_state.current_customer_id = 6  # Default customer for demo
     
     customer_id = st.session_state.current_customer_id
+    cart = get_session_cart(cart_ops, customer_id)
     
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Browse Food", "Cart", "My Orders", "Rate & Review", "Profile"])
+    section = select_section("customer_section", ["Browse Food", "Cart", "My Orders", "Rate & Review", "Profile"])
     
-    with tab1:
-        render_food_browsing(restaurant_ops, menu_item_ops, cart_ops, customer_id)
+    if section == "Browse Food":
+        render_food_browsing(restaurant_ops, menu_item_ops, cart)
     
-    with tab2:
-        render_cart(cart_ops, order_ops, customer_id)
+    if section == "Cart":
+        render_cart(cart, order_ops, customer_id)
     
-    with tab3:
+    if section == "My Orders":
         render_customer_orders(order_ops, customer_id)
     
-    with tab4:
+    if section == "Rate & Review":
         render_ratings(rating_ops, restaurant_ops, menu_item_ops, customer_id)
     
-    with tab5:
+    if section == "Profile":
         render_customer_profile(user_ops, customer_id)
+    
+    try:
+        cart.flush_if_due()
+    except Exception as e:
+        st.warning(f"Cart changes not saved yet: {str(e)}")
+
+def get_session_cart(cart_ops, customer_id):
+    key = f"session_cart_{customer_id}"
+    if key not in st.session_state:
+        st.session_state[key] = SessionCart(cart_ops, customer_id)
+    cart = st.session_state[key]
+    cart.cart_ops = cart_ops
+    return cart
 
-def render_food_browsing(restaurant_ops, menu_item_ops, cart_ops, customer_id):
+def render_food_browsing(restaurant_ops, menu_item_ops, cart):
     st.subheader("Browse Restaurants & Menu")
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
         search_term = st.text_input("Search for food or restaurants...")
+        max_price = st.number_input("Max Price (0 for any)", min_value=0.0, value=0.0, step=50.0)
         
     with col2:
         filter_veg = st.checkbox("Vegetarian Only")
         filter_category = st.selectbox("Category", ["All", "Appetizer", "Main Course", "Dessert", "Beverage", "Side", "Starter"])
     
+    if search_term:
+        filters = {
+            'is_vegetarian': True if filter_veg else None,
+            'category': None if filter_category == "All" else filter_category,
+            'max_price': max_price or None
+        }
+        menu_items = menu_item_ops.search(search_term, filters, limit=50)
+        
+        if not menu_items:
+            st.info(f"No dishes or restaurants match '{search_term}'")
+            return
+        
+        st.markdown(f"#### {len(menu_items)} Results")
+        render_menu_items(menu_items, cart, show_restaurant=True)
+        return
+    
     restaurants = restaurant_ops.read_all()
     if not restaurants:
         st.info("No restaurants available")
@@ -72,12 +106,13 @@ def render_food_browsing(restaurant_ops, menu_item_ops, cart_ops, customer_id):
     if filter_category != "All":
         menu_items = [item for item in menu_items if item['category'] == filter_category]
     
-    if search_term:
-        search_term = search_term.lower()
-        menu_items = [item for item in menu_items if search_term in item['name'].lower()]
+    if max_price:
+        menu_items = [item for item in menu_items if item['price'] <= max_price]
     
     st.markdown("#### Menu Items")
-    
+    render_menu_items(menu_items, cart)
+
+def render_menu_items(menu_items, cart, show_restaurant: bool = False):
     for item in menu_items:
         with st.container():
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
@@ -85,12 +120,16 @@ def render_food_browsing(restaurant_ops, menu_item_ops, cart_ops, customer_id):
             with col1:
                 veg_indicator = "[Veg]" if item['is_vegetarian'] else "[Non-Veg]"
                 st.markdown(f"**{veg_indicator} {item['name']}**")
+                if show_restaurant:
+                    st.write(f"From: {item['restaurant_name']}")
                 st.write(item['description'] or "No description available")
                 st.write(f"Category: {item['category'] or 'Not specified'}")
             
             with col2:
                 st.markdown(f"**₹{item['price']:.2f}**")
                 st.write(f"Time: {item['preparation_time']} min")
+                if item['rating_count']:
+                    st.write(f"Rating: {item['rating_sum'] / item['rating_count']:.1f} ({item['rating_count']})")
             
             with col3:
                 quantity = st.number_input(
@@ -103,23 +142,21 @@ def render_food_browsing(restaurant_ops, menu_item_ops, cart_ops, customer_id):
             
             with col4:
                 if st.button("Add to Cart", key=f"add_{item['id']}"):
-                    cart_ops.add_item(customer_id, item['id'], quantity)
+                    cart.add_item(item, quantity)
                     st.success(f"Added {quantity} x {item['name']} to cart!")
                     st.rerun()
             
             st.divider()
 
-def render_cart(cart_ops, order_ops, customer_id):
+def render_cart(cart, order_ops, customer_id):
     st.subheader("Your Cart")
     
-    cart_items = cart_ops.get_cart(customer_id)
+    cart_items = cart.items()
     
     if not cart_items:
         st.info("Your cart is empty")
         return
     
-    total_amount = cart_ops.get_cart_total(customer_id)
-    
     st.markdown("#### Cart Items")
     
     for item in cart_items:
@@ -138,21 +175,22 @@ def render_cart(cart_ops, order_ops, customer_id):
                 min_value=0,
                 max_value=10,
                 value=item['quantity'],
-                key=f"cart_qty_{item['id']}"
+                key=f"cart_qty_{item['menu_item_id']}"
             )
             
             if new_quantity != item['quantity']:
-                cart_ops.update_quantity(customer_id, item['menu_item_id'], new_quantity)
-                st.rerun()
+                cart.update_quantity(item['menu_item_id'], new_quantity)
+                if new_quantity == 0:
+                    st.rerun()
         
         with col4:
-            if st.button("Remove", key=f"remove_{item['id']}"):
-                cart_ops.remove_item(customer_id, item['menu_item_id'])
+            if st.button("Remove", key=f"remove_{item['menu_item_id']}"):
+                cart.remove_item(item['menu_item_id'])
                 st.rerun()
         
         st.divider()
     
-    st.markdown(f"### Total: ₹{total_amount:.2f}")
+    st.markdown(f"### Total: ₹{cart.total():.2f}")
     
     with st.form("checkout_form"):
         st.subheader("Delivery Information")
@@ -164,13 +202,19 @@ def render_cart(cart_ops, order_ops, customer_id):
                 st.error("Please provide delivery address")
             else:
                 try:
-                    restaurant_id = cart_items[0]['restaurant_id']
-                    order_id = order_ops.create(customer_id, restaurant_id, delivery_address, total_amount, payment_method)
-                    
-                    for item in cart_items:
-                        order_ops.add_item(order_id, item['menu_item_id'], item['quantity'], item['price'])
-                    
-                    cart_ops.clear_cart(customer_id)
+                    with cart.checkout() as cart_items:
+                        restaurant_id = cart_items[0]['restaurant_id']
+                        with order_ops.db.transaction():
+                            prices = order_ops.get_prices([item['menu_item_id'] for item in cart_items])
+                            total_amount = sum(prices[item['menu_item_id']] * item['quantity'] for item in cart_items)
+                            order_id = order_ops.create(customer_id, restaurant_id, delivery_address, total_amount, payment_method)
+                            
+                            order_ops.add_items(order_id, [
+                                {'menu_item_id': item['menu_item_id'], 'quantity': item['quantity'], 'price_per_item': prices[item['menu_item_id']]}
+                                for item in cart_items
+                            ])
+                            
+                            cart.cart_ops.clear_cart(customer_id)
                     st.success(f"Order placed successfully! Order ID: {order_id}")
                     st.rerun()
                 except Exception as e:
@@ -179,12 +223,18 @@ def render_cart(cart_ops, order_ops, customer_id):
 def render_customer_orders(order_ops, customer_id):
     st.subheader("Your Orders")
     
-    orders = order_ops.read_by_customer(customer_id)
+    orders = paginate(
+        f"customer_orders_{customer_id}",
+        lambda after, limit: order_ops.read_page(after=after, limit=limit, customer_id=customer_id),
+        page_size=20
+    )
     
     if not orders:
         st.info("No orders found")
         return
     
+    items_by_order = order_ops.get_order_items_for_orders([order['id'] for order in orders])
+    
     for order in orders:
         with st.expander(f"Order #{order['id']} - {order['restaurant_name']} - ₹{order['total_amount']:.2f}"):
             col1, col2, col3 = st.columns(3)
@@ -204,7 +254,7 @@ def render_customer_orders(order_ops, customer_id):
                 if order['actual_delivery_time']:
                     st.write(f"**Delivered:** {order['actual_delivery_time']}")
             
-            order_items = order_ops.get_order_items(order['id'])
+            order_items = items_by_order.get(order['id'], [])
             
             if order_items:
                 st.markdown("**Order Items:**")
@@ -214,9 +264,9 @@ def render_customer_orders(order_ops, customer_id):
 def render_ratings(rating_ops, restaurant_ops, menu_item_ops, customer_id):
     st.subheader("Rate & Review")
     
-    tab_restaurant, tab_items = st.tabs(["Rate Restaurants", "Rate Food Items"])
+    section = select_section("customer_rating_section", ["Rate Restaurants", "Rate Food Items"])
     
-    with tab_restaurant:
+    if section == "Rate Restaurants":
         restaurants = restaurant_ops.read_all()
         if restaurants:
             selected_restaurant = st.selectbox(
@@ -247,7 +297,7 @@ def render_ratings(rating_ops, restaurant_ops, menu_item_ops, customer_id):
                         st.write(f"_{rating['review']}_")
                     st.divider()
     
-    with tab_items:
+    if section == "Rate Food Items":
         menu_items = menu_item_ops.read_all()
         if menu_items:
             selected_item = st.selectbox(
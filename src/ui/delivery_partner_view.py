@@ -1,14 +1,26 @@
 import streamlit as st
 from typing import Dict, Any
+from ui.pagination import paginate
+from ui.navigation import select_section, active_section
+from sql.async_operations import AsyncDeliveryPartnerOperations, AsyncOrderOperations, run_queries
+from sql.location_ingestion import IngestionQueueFull
 
-def render_delivery_partner_view(user_ops, order_ops, delivery_partner_ops):
+PARTNER_SECTIONS = ["Available Orders", "My Orders", "Profile", "Earnings"]
+
+def render_delivery_partner_view(user_ops, order_ops, delivery_partner_ops, location_ingestor):
     st.header("Delivery Partner View")
     
     if 'current_delivery_partner_id' not in st.session_state:
         st.session_state.current_delivery_partner_id = 1  # Default delivery partner for demo
     
     partner_id = st.session_state.current_delivery_partner_id
-    partner = delivery_partner_ops.read_by_id(partner_id)
+    show_earnings = active_section("partner_section", PARTNER_SECTIONS) == "Earnings"
+    calls = [AsyncDeliveryPartnerOperations(order_ops.db).read_by_id(partner_id)]
+    if show_earnings:
+        calls.append(AsyncOrderOperations(order_ops.db).read_by_delivery_partner(partner_id))
+    results = run_queries(*calls)
+    partner = results[0]
+    partner_orders = results[1] if show_earnings else None
     
     if not partner:
         st.error("Delivery partner not found")
@@ -31,24 +43,24 @@ def render_delivery_partner_view(user_ops, order_ops, delivery_partner_ops):
     with col4:
         st.metric("Vehicle", partner['vehicle_type'].title())
     
-    tab1, tab2, tab3, tab4 = st.tabs(["Available Orders", "My Orders", "Profile", "Earnings"])
+    section = select_section("partner_section", PARTNER_SECTIONS)
     
-    with tab1:
-        render_available_orders(order_ops, delivery_partner_ops, partner_id)
+    if section == "Available Orders":
+        render_available_orders(order_ops, delivery_partner_ops, partner)
     
-    with tab2:
+    if section == "My Orders":
         render_my_orders(order_ops, partner_id)
     
-    with tab3:
-        render_partner_profile(user_ops, delivery_partner_ops, partner)
+    if section == "Profile":
+        render_partner_profile(user_ops, delivery_partner_ops, location_ingestor, partner)
     
-    with tab4:
-        render_earnings(order_ops, partner_id)
+    if section == "Earnings":
+        render_earnings(partner_orders)
 
-def render_available_orders(order_ops, delivery_partner_ops, partner_id):
+def render_available_orders(order_ops, delivery_partner_ops, partner):
     st.subheader("Available Orders")
     
-    partner = delivery_partner_ops.read_by_id(partner_id)
+    partner_id = partner['id']
     
     if not partner['is_online']:
         st.warning("You are currently offline. Go online to see available orders.")
@@ -58,8 +70,11 @@ def render_available_orders(order_ops, delivery_partner_ops, partner_id):
         delivery_partner_ops.update_online_status(partner_id, False)
         st.rerun()
     
-    orders = order_ops.read_all()
-    available_orders = [order for order in orders if order['status'] == 'confirmed' and not order['delivery_partner_id']]
+    near = None
+    if partner['current_latitude'] is not None and partner['current_longitude'] is not None:
+        near = (float(partner['current_latitude']), float(partner['current_longitude']))
+    
+    available_orders = order_ops.read_available_for_pickup(limit=50, near=near)
     
     if not available_orders:
         st.info("No orders available for pickup")
@@ -67,6 +82,8 @@ def render_available_orders(order_ops, delivery_partner_ops, partner_id):
     
     st.markdown(f"#### {len(available_orders)} Orders Available")
     
+    items_by_order = order_ops.get_order_items_for_orders([order['id'] for order in available_orders])
+    
     for order in available_orders:
         with st.expander(f"Order #{order['id']} - {order['restaurant_name']} - ₹{order['total_amount']:.2f}"):
             col1, col2 = st.columns(2)
@@ -81,8 +98,10 @@ def render_available_orders(order_ops, delivery_partner_ops, partner_id):
                 st.write(f"**Delivery Address:**")
                 st.write(order['delivery_address'])
                 st.write(f"**Order Time:** {order['created_at']}")
+                if order['distance_km'] is not None:
+                    st.write(f"**Restaurant Distance:** {order['distance_km']:.1f} km")
             
-            order_items = order_ops.get_order_items(order['id'])
+            order_items = items_by_order.get(order['id'], [])
             
             if order_items:
                 st.markdown("**Order Items:**")
@@ -100,16 +119,20 @@ def render_available_orders(order_ops, delivery_partner_ops, partner_id):
 def render_my_orders(order_ops, partner_id):
     st.subheader("My Orders")
     
-    orders = order_ops.read_by_delivery_partner(partner_id)
+    status_filter = st.selectbox("Filter by Status", ["All", "confirmed", "preparing", "ready", "picked_up", "delivered"])
+    status = None if status_filter == "All" else status_filter
+    
+    orders = paginate(
+        f"partner_orders_{partner_id}_{status_filter}",
+        lambda after, limit: order_ops.read_page(after=after, limit=limit, delivery_partner_id=partner_id, status=status),
+        page_size=20
+    )
     
     if not orders:
         st.info("No orders assigned to you")
         return
     
-    status_filter = st.selectbox("Filter by Status", ["All", "confirmed", "preparing", "ready", "picked_up", "delivered"])
-    
-    if status_filter != "All":
-        orders = [order for order in orders if order['status'] == status_filter]
+    items_by_order = order_ops.get_order_items_for_orders([order['id'] for order in orders])
     
     for order in orders:
         with st.expander(f"Order #{order['id']} - {order['restaurant_name']} → {order['customer_username']} - ₹{order['total_amount']:.2f}"):
@@ -126,7 +149,7 @@ def render_my_orders(order_ops, partner_id):
                 st.write(order['delivery_address'])
                 st.write(f"**Order Time:** {order['created_at']}")
             
-            order_items = order_ops.get_order_items(order['id'])
+            order_items = items_by_order.get(order['id'], [])
             
             if order_items:
                 st.markdown("**Order Items:**")
@@ -158,7 +181,7 @@ def render_my_orders(order_ops, partner_id):
                     st.success("Order delivered! Great job!")
                     st.rerun()
 
-def render_partner_profile(user_ops, delivery_partner_ops, partner):
+def render_partner_profile(user_ops, delivery_partner_ops, location_ingestor, partner):
     st.subheader("My Profile")
     
     user = user_ops.read_by_id(partner['user_id'])
@@ -226,15 +249,16 @@ def render_partner_profile(user_ops, delivery_partner_ops, partner):
         
         if st.form_submit_button("Update Location"):
             try:
-                delivery_partner_ops.update_location(partner['id'], latitude, longitude)
-                st.success("Location updated successfully!")
+                location_ingestor.submit(partner['id'], latitude, longitude)
+                st.success("Location update queued, it will be saved within a few seconds.")
+            except IngestionQueueFull:
+                st.warning("Location updates are backed up right now, please try again shortly.")
             except Exception as e:
                 st.error(f"Error updating location: {str(e)}")
 
-def render_earnings(order_ops, partner_id):
+def render_earnings(orders):
     st.subheader("My Earnings")
     
-    orders = order_ops.read_by_delivery_partner(partner_id)
     delivered_orders = [order for order in orders if order['status'] == 'delivered' and order['payment_status'] == 'paid']
     
     if not delivered_orders:
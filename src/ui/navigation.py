@@ -0,0 +1,8 @@
+import streamlit as st
+from typing import List
+
+def select_section(key: str, labels: List[str]):
+    return st.radio("Section", labels, key=key, horizontal=True, label_visibility="collapsed")
+
+def active_section(key: str, labels: List[str]):
+    return st.session_state.get(key, labels[0])
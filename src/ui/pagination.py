@@ -0,0 +1,26 @@
+import streamlit as st
+
+def paginate(key: str, fetch_page, page_size: int = 50):
+    state_key = f"page_cursors_{key}"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = [None]
+    
+    cursors = st.session_state[state_key]
+    rows, next_after = fetch_page(after=cursors[-1], limit=page_size)
+    
+    col1, col2, col3 = st.columns([1, 1, 4])
+    
+    with col1:
+        if st.button("Previous", key=f"{key}_prev", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+    
+    with col2:
+        if st.button("Next", key=f"{key}_next", disabled=next_after is None):
+            cursors.append(next_after)
+            st.rerun()
+    
+    with col3:
+        st.write(f"Page {len(cursors)}")
+    
+    return rows
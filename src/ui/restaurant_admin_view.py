@@ -1,7 +1,10 @@
 import streamlit as st
 from typing import Dict, Any
+from datetime import datetime, timedelta
+from ui.pagination import paginate
+from ui.navigation import select_section
 
-def render_restaurant_admin_view(user_ops, restaurant_ops, menu_item_ops, order_ops, rating_ops):
+def render_restaurant_admin_view(user_ops, restaurant_ops, menu_item_ops, order_ops, rating_ops, analytics_ops):
     st.header("Restaurant Admin View")
     
     if 'current_restaurant_admin_id' not in st.session_state:
@@ -24,29 +27,29 @@ def render_restaurant_admin_view(user_ops, restaurant_ops, menu_item_ops, order_
     
     st.markdown(f"### Managing: {selected_restaurant['name']}")
     
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Menu Management", "Orders", "Restaurant Info", "Ratings & Reviews", "Analytics"])
+    section = select_section("restaurant_admin_section", ["Menu Management", "Orders", "Restaurant Info", "Ratings & Reviews", "Analytics"])
     
-    with tab1:
+    if section == "Menu Management":
         render_menu_management(menu_item_ops, selected_restaurant['id'])
     
-    with tab2:
+    if section == "Orders":
         render_restaurant_orders(order_ops, selected_restaurant['id'])
     
-    with tab3:
+    if section == "Restaurant Info":
         render_restaurant_info(restaurant_ops, selected_restaurant)
     
-    with tab4:
+    if section == "Ratings & Reviews":
         render_restaurant_ratings(rating_ops, selected_restaurant['id'])
     
-    with tab5:
-        render_analytics(order_ops, menu_item_ops, selected_restaurant['id'])
+    if section == "Analytics":
+        render_analytics(analytics_ops, selected_restaurant['id'])
 
 def render_menu_management(menu_item_ops, restaurant_id):
     st.subheader("Menu Management")
     
-    tab_add, tab_view, tab_edit = st.tabs(["Add Item", "View Menu", "Edit Items"])
+    section = select_section("menu_management_section", ["Add Item", "View Menu", "Edit Items"])
     
-    with tab_add:
+    if section == "Add Item":
         with st.form("add_menu_item"):
             st.markdown("#### Add New Menu Item")
             
@@ -72,7 +75,7 @@ def render_menu_management(menu_item_ops, restaurant_id):
                 else:
                     st.warning("Please fill in all required fields")
     
-    with tab_view:
+    if section == "View Menu":
         menu_items = menu_item_ops.read_by_restaurant(restaurant_id)
         
         if not menu_items:
@@ -102,7 +105,7 @@ def render_menu_management(menu_item_ops, restaurant_id):
             
             st.divider()
     
-    with tab_edit:
+    if section == "Edit Items":
         menu_items = menu_item_ops.read_by_restaurant(restaurant_id)
         
         if not menu_items:
@@ -133,7 +136,8 @@ def render_menu_management(menu_item_ops, restaurant_id):
                             try:
                                 menu_item_ops.update(
                                     item_id, name, description, price, category, 
-                                    is_vegetarian, preparation_time, is_available
+                                    is_vegetarian, preparation_time, is_available,
+                                    expected_version=item['version']
                                 )
                                 st.success("Item updated successfully!")
                                 st.rerun()
@@ -152,16 +156,20 @@ def render_menu_management(menu_item_ops, restaurant_id):
 def render_restaurant_orders(order_ops, restaurant_id):
     st.subheader("Restaurant Orders")
     
-    orders = order_ops.read_by_restaurant(restaurant_id)
+    status_filter = st.selectbox("Filter by Status", ["All", "pending", "confirmed", "preparing", "ready", "picked_up", "delivered", "cancelled"])
+    status = None if status_filter == "All" else status_filter
+    
+    orders = paginate(
+        f"restaurant_orders_{restaurant_id}_{status_filter}",
+        lambda after, limit: order_ops.read_page(after=after, limit=limit, restaurant_id=restaurant_id, status=status),
+        page_size=20
+    )
     
     if not orders:
         st.info("No orders found")
         return
     
-    status_filter = st.selectbox("Filter by Status", ["All", "pending", "confirmed", "preparing", "ready", "picked_up", "delivered", "cancelled"])
-    
-    if status_filter != "All":
-        orders = [order for order in orders if order['status'] == status_filter]
+    items_by_order = order_ops.get_order_items_for_orders([order['id'] for order in orders])
     
     for order in orders:
         with st.expander(f"Order #{order['id']} - {order['customer_username']} - ₹{order['total_amount']:.2f} - {order['status'].replace('_', ' ').title()}"):
@@ -179,7 +187,7 @@ def render_restaurant_orders(order_ops, restaurant_id):
                 if order['delivery_partner_username']:
                     st.write(f"**Delivery Partner:** {order['delivery_partner_username']}")
             
-            order_items = order_ops.get_order_items(order['id'])
+            order_items = items_by_order.get(order['id'], [])
             
             if order_items:
                 st.markdown("**Order Items:**")
@@ -227,11 +235,18 @@ def render_restaurant_info(restaurant_ops, restaurant):
         opening_hours = st.text_input("Opening Hours", value=restaurant['opening_hours'] or "")
         is_active = st.checkbox("Restaurant Active", value=bool(restaurant['is_active']))
         
+        col1, col2 = st.columns(2)
+        with col1:
+            latitude = st.number_input("Latitude", value=float(restaurant['latitude'] or 0.0), format="%.6f")
+        with col2:
+            longitude = st.number_input("Longitude", value=float(restaurant['longitude'] or 0.0), format="%.6f")
+        
         if st.form_submit_button("Update Restaurant Info"):
             try:
                 restaurant_ops.update(
                     restaurant['id'], name, address, phone, email, 
-                    cuisine_type, opening_hours, restaurant['admin_id'], is_active
+                    cuisine_type, opening_hours, restaurant['admin_id'], is_active,
+                    latitude=latitude or None, longitude=longitude or None
                 )
                 st.success("Restaurant information updated successfully!")
                 st.rerun()
@@ -263,6 +278,14 @@ def render_restaurant_ratings(rating_ops, restaurant_id):
     
     st.markdown(f"### Average Rating: {avg_rating:.1f} ({'★' * int(avg_rating)})")
     
+    item_ratings = [rating for rating in rating_ops.get_item_average_ratings(restaurant_id).values() if rating['rating_count']]
+    if item_ratings:
+        st.markdown("#### Menu Item Ratings")
+        st.dataframe([
+            {'Item': rating['name'], 'Average': round(float(rating['avg_rating']), 2), 'Ratings': rating['rating_count']}
+            for rating in sorted(item_ratings, key=lambda rating: rating['avg_rating'], reverse=True)
+        ], use_container_width=True)
+    
     st.markdown("#### Customer Reviews")
     
     for rating in ratings:
@@ -272,51 +295,42 @@ def render_restaurant_ratings(rating_ops, restaurant_id):
             else:
                 st.write("No review provided")
 
-def render_analytics(order_ops, menu_item_ops, restaurant_id):
+def render_analytics(analytics_ops, restaurant_id):
     st.subheader("Restaurant Analytics")
     
-    orders = order_ops.read_by_restaurant(restaurant_id)
-    menu_items = menu_item_ops.read_by_restaurant(restaurant_id)
+    period = st.selectbox("Period", ["All Time", "Last 7 Days", "Last 30 Days", "Last 365 Days"], key="analytics_period")
+    period_days = {"Last 7 Days": 7, "Last 30 Days": 30, "Last 365 Days": 365}
+    start = datetime.now() - timedelta(days=period_days[period]) if period in period_days else None
     
-    if not orders:
+    summary = analytics_ops.get_summary(restaurant_id, start=start)
+    
+    if not summary['total_orders']:
         st.info("No orders to analyze")
         return
     
-    total_orders = len(orders)
-    total_revenue = sum(order['total_amount'] for order in orders if order['payment_status'] == 'paid')
-    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Total Orders", total_orders)
+        st.metric("Total Orders", summary['total_orders'])
     
     with col2:
-        st.metric("Total Revenue", f"₹{total_revenue:.2f}")
+        st.metric("Total Revenue", f"₹{summary['total_revenue']:.2f}")
     
     with col3:
-        avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
-        st.metric("Average Order Value", f"₹{avg_order_value:.2f}")
+        st.metric("Average Order Value", f"₹{summary['avg_order_value']:.2f}")
     
-    st.markdown("#### Order Status Distribution")
+    if start is not None:
+        daily_sales = analytics_ops.get_daily_sales(restaurant_id, start=start)
+        if daily_sales:
+            st.markdown("#### Daily Revenue")
+            st.line_chart({str(day['sales_date']): float(day['revenue']) for day in daily_sales})
     
-    status_counts = {}
-    for order in orders:
-        status = order['status']
-        status_counts[status] = status_counts.get(status, 0) + 1
+    st.markdown("#### Order Status Distribution")
     
-    for status, count in status_counts.items():
-        st.write(f"**{status.replace('_', ' ').title()}:** {count}")
+    for row in analytics_ops.get_status_distribution(restaurant_id, start=start):
+        st.write(f"**{row['status'].replace('_', ' ').title()}:** {row['order_count']}")
     
     st.markdown("#### Popular Items")
     
-    item_sales = {}
-    for order in orders:
-        order_items = order_ops.get_order_items(order['id'])
-        for item in order_items:
-            item_name = item['item_name']
-            item_sales[item_name] = item_sales.get(item_name, 0) + item['quantity']
-    
-    if item_sales:
-        sorted_items = sorted(item_sales.items(), key=lambda x: x[1], reverse=True)
-        for item_name, quantity in sorted_items[:10]:
-            st.write(f"**{item_name}:** {quantity} sold")
+    for item in analytics_ops.get_top_items(restaurant_id, limit=10, start=start):
+        st.write(f"**{item['item_name']}:** {item['quantity_sold']} sold")
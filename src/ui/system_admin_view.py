@@ -1,35 +1,54 @@
+import os
+import tempfile
+import time
 import streamlit as st
 from typing import Dict, Any
+from datetime import date, datetime, timedelta
+from ui.pagination import paginate
+from ui.navigation import select_section
+from sql.async_operations import AsyncOrderOperations, AsyncRestaurantAnalyticsOperations, AsyncRestaurantOperations, AsyncUserOperations, run_queries
+from sql.db_operations import SalesRollupOperations
+from sql.bulk_import import BulkImporter, ImportFileError, read_frame
+from sql.order_export import OrderExporter
 
-def render_system_admin_view(user_ops, restaurant_ops, menu_item_ops, order_ops, delivery_partner_ops):
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), 'food_delivery_exports')
+EXPORT_RETENTION = 3600.0
+
+def render_system_admin_view(user_ops, restaurant_ops, menu_item_ops, order_ops, delivery_partner_ops, analytics_ops):
     st.header("System Admin View")
     
-    tabs = st.tabs(["Users", "Restaurants", "Menu Items", "Orders", "Delivery Partners", "System Overview"])
+    section = select_section("system_admin_section", ["Users", "Restaurants", "Menu Items", "Orders", "Delivery Partners", "Bulk Import", "System Overview", "Performance"])
     
-    with tabs[0]:
+    if section == "Users":
         render_user_management(user_ops)
     
-    with tabs[1]:
+    if section == "Restaurants":
         render_restaurant_management(restaurant_ops, user_ops)
     
-    with tabs[2]:
+    if section == "Menu Items":
         render_menu_item_management(menu_item_ops, restaurant_ops)
     
-    with tabs[3]:
-        render_order_management(order_ops)
+    if section == "Orders":
+        render_order_management(order_ops, restaurant_ops)
     
-    with tabs[4]:
+    if section == "Delivery Partners":
         render_delivery_partner_management(delivery_partner_ops, user_ops)
     
-    with tabs[5]:
-        render_system_overview(user_ops, restaurant_ops, order_ops)
+    if section == "Bulk Import":
+        render_bulk_import(user_ops.db)
+    
+    if section == "System Overview":
+        render_system_overview(user_ops, restaurant_ops, order_ops, analytics_ops)
+    
+    if section == "Performance":
+        render_performance(user_ops.db)
 
 def render_user_management(user_ops):
     st.subheader("User Management")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["Create User", "View Users", "Update User", "Delete User"])
+    section = select_section("admin_user_section", ["Create User", "View Users", "Update User", "Delete User"])
     
-    with tab1:
+    if section == "Create User":
         with st.form("create_user"):
             st.markdown("#### Create New User")
             
@@ -51,14 +70,14 @@ def render_user_management(user_ops):
                 else:
                     st.warning("Please fill all required fields")
     
-    with tab2:
-        users = user_ops.read_all()
+    if section == "View Users":
+        users = paginate("admin_users", user_ops.read_page)
         if users:
             st.dataframe(users, use_container_width=True)
         else:
             st.info("No users found")
     
-    with tab3:
+    if section == "Update User":
         users = user_ops.read_all()
         if users:
             user_options = {f"{u['username']} (ID: {u['id']}) - {u['role']}": u['id'] for u in users}
@@ -80,7 +99,7 @@ def render_user_management(user_ops):
                         
                         if st.form_submit_button("Update User"):
                             try:
-                                user_ops.update(user_id, username, password or None, email, phone, address, role)
+                                user_ops.update(user_id, username, password or None, email, phone, address, role, expected_version=user['version'])
                                 st.success("User updated successfully!")
                                 st.rerun()
                             except Exception as e:
@@ -88,7 +107,7 @@ def render_user_management(user_ops):
         else:
             st.info("No users available")
     
-    with tab4:
+    if section == "Delete User":
         users = user_ops.read_all()
         if users:
             user_options = {f"{u['username']} (ID: {u['id']}) - {u['role']}": u['id'] for u in users}
@@ -108,9 +127,9 @@ def render_user_management(user_ops):
 def render_restaurant_management(restaurant_ops, user_ops):
     st.subheader("Restaurant Management")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["Create Restaurant", "View Restaurants", "Update Restaurant", "Delete Restaurant"])
+    section = select_section("admin_restaurant_section", ["Create Restaurant", "View Restaurants", "Update Restaurant", "Delete Restaurant"])
     
-    with tab1:
+    if section == "Create Restaurant":
         with st.form("create_restaurant"):
             st.markdown("#### Create New Restaurant")
             
@@ -142,14 +161,14 @@ def render_restaurant_management(restaurant_ops, user_ops):
                 else:
                     st.warning("Please fill all required fields")
     
-    with tab2:
+    if section == "View Restaurants":
         restaurants = restaurant_ops.read_all()
         if restaurants:
             st.dataframe(restaurants, use_container_width=True)
         else:
             st.info("No restaurants found")
     
-    with tab3:
+    if section == "Update Restaurant":
         restaurants = restaurant_ops.read_all()
         if restaurants:
             restaurant_options = {f"{r['name']} (ID: {r['id']})": r['id'] for r in restaurants}
@@ -183,7 +202,7 @@ def render_restaurant_management(restaurant_ops, user_ops):
                             try:
                                 admin_id = admin_options[selected_admin] if selected_admin else restaurant['admin_id']
                                 restaurant_ops.update(restaurant_id, name, address, phone, email, cuisine_type, 
-                                                    opening_hours, admin_id, is_active)
+                                                    opening_hours, admin_id, is_active, expected_version=restaurant['version'])
                                 st.success("Restaurant updated successfully!")
                                 st.rerun()
                             except Exception as e:
@@ -191,7 +210,7 @@ def render_restaurant_management(restaurant_ops, user_ops):
         else:
             st.info("No restaurants available")
     
-    with tab4:
+    if section == "Delete Restaurant":
         restaurants = restaurant_ops.read_all()
         if restaurants:
             restaurant_options = {f"{r['name']} (ID: {r['id']})": r['id'] for r in restaurants}
@@ -211,9 +230,9 @@ def render_restaurant_management(restaurant_ops, user_ops):
 def render_menu_item_management(menu_item_ops, restaurant_ops):
     st.subheader("Menu Item Management")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["Create Menu Item", "View Menu Items", "Update Menu Item", "Delete Menu Item"])
+    section = select_section("admin_menu_item_section", ["Create Menu Item", "View Menu Items", "Update Menu Item", "Delete Menu Item"])
     
-    with tab1:
+    if section == "Create Menu Item":
         with st.form("create_menu_item"):
             st.markdown("#### Create New Menu Item")
             
@@ -247,14 +266,14 @@ def render_menu_item_management(menu_item_ops, restaurant_ops):
                 else:
                     st.warning("Please fill all required fields")
     
-    with tab2:
-        menu_items = menu_item_ops.read_all()
+    if section == "View Menu Items":
+        menu_items = paginate("admin_menu_items", menu_item_ops.read_page)
         if menu_items:
             st.dataframe(menu_items, use_container_width=True)
         else:
             st.info("No menu items found")
     
-    with tab3:
+    if section == "Update Menu Item":
         menu_items = menu_item_ops.read_all()
         if menu_items:
             item_options = {f"{item['name']} (ID: {item['id']}) - {item['restaurant_name']}": item['id'] for item in menu_items}
@@ -278,7 +297,7 @@ def render_menu_item_management(menu_item_ops, restaurant_ops):
                         if st.form_submit_button("Update Menu Item"):
                             try:
                                 menu_item_ops.update(item_id, name, description, price, category, 
-                                                   is_vegetarian, preparation_time, is_available)
+                                                   is_vegetarian, preparation_time, is_available, expected_version=item['version'])
                                 st.success("Menu item updated successfully!")
                                 st.rerun()
                             except Exception as e:
@@ -286,7 +305,7 @@ def render_menu_item_management(menu_item_ops, restaurant_ops):
         else:
             st.info("No menu items available")
     
-    with tab4:
+    if section == "Delete Menu Item":
         menu_items = menu_item_ops.read_all()
         if menu_items:
             item_options = {f"{item['name']} (ID: {item['id']}) - {item['restaurant_name']}": item['id'] for item in menu_items}
@@ -303,10 +322,94 @@ def render_menu_item_management(menu_item_ops, restaurant_ops):
         else:
             st.info("No menu items available")
 
-def render_order_management(order_ops):
+def render_bulk_import(db):
+    st.subheader("Bulk Import")
+    st.caption("Upload CSV or Parquet files. Restaurants may reference admins by admin_username, menu items may reference restaurants by restaurant_name.")
+    
+    uploads = {
+        'users': st.file_uploader("Users (username, password, email, phone, address, role)", type=["csv", "parquet"], key="import_users"),
+        'restaurants': st.file_uploader("Restaurants (name, address, admin_username, cuisine_type, ...)", type=["csv", "parquet"], key="import_restaurants"),
+        'menu_items': st.file_uploader("Menu Items (restaurant_name, name, price, category, ...)", type=["csv", "parquet"], key="import_menu_items")
+    }
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        method = st.selectbox("Load Method", ["insert", "infile"], help="infile uses LOAD DATA LOCAL INFILE and needs local_infile=ON on the server")
+    
+    with col2:
+        batch_size = st.number_input("Batch Size", min_value=100, max_value=100000, value=5000, step=1000)
+    
+    with col3:
+        strict = st.checkbox("Stop on invalid rows", value=False)
+    
+    selected = {entity: upload for entity, upload in uploads.items() if upload is not None}
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        dry_run = st.button("Validate (Dry Run)", disabled=not selected)
+    
+    with col2:
+        run_import = st.button("Import", type="primary", disabled=not selected)
+    
+    if dry_run or run_import:
+        try:
+            frames = {entity: read_frame(upload, upload.name) for entity, upload in selected.items()}
+            with st.spinner("Importing..." if run_import else "Validating..."):
+                report = BulkImporter(db, method, int(batch_size), dry_run=not run_import, strict=strict).import_frames(frames)
+        except ImportFileError as e:
+            st.error(str(e))
+            return
+        except Exception as e:
+            st.error(f"Error importing data: {str(e)}")
+            return
+        
+        for entity, result in report['entities'].items():
+            st.markdown(f"#### {entity.replace('_', ' ').title()}")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("Rows", result['rows'])
+            
+            with col2:
+                st.metric("Valid", result['valid'])
+            
+            with col3:
+                st.metric("Invalid", result['invalid'])
+            
+            with col4:
+                st.metric("Loaded", result['loaded'])
+            
+            if result['ignored_columns']:
+                st.warning(f"Ignored columns: {', '.join(result['ignored_columns'])}")
+            
+            if result['errors']:
+                st.dataframe(result['errors'], use_container_width=True)
+                if result['error_count'] > len(result['errors']):
+                    st.caption(f"Showing {len(result['errors'])} of {result['error_count']} errors")
+            
+            failed_batches = [batch for batch in result['batches'] if batch['error']]
+            if failed_batches:
+                st.error(f"{len(failed_batches)} batches failed")
+                st.dataframe(failed_batches, use_container_width=True)
+            
+            if result.get('skipped'):
+                st.info(result['skipped'])
+        
+        if run_import:
+            st.success("Import finished")
+        else:
+            st.info("Dry run finished; nothing was written")
+
+def render_order_management(order_ops, restaurant_ops):
     st.subheader("Order Management")
     
-    orders = order_ops.read_all()
+    with st.expander("Export Order History"):
+        render_order_export(order_ops, restaurant_ops)
+    
+    orders = paginate("admin_orders", order_ops.read_page)
     
     if not orders:
         st.info("No orders found")
@@ -361,12 +464,92 @@ def render_order_management(order_ops):
                 except Exception as e:
                     st.error(f"Error updating order status: {str(e)}")
 
+def _discard_export(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _export_served(path: str):
+    st.session_state.pop('order_export', None)
+    _discard_export(path)
+
+def _sweep_exports():
+    cutoff = time.time() - EXPORT_RETENTION
+    with os.scandir(EXPORT_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+def render_order_export(order_ops, restaurant_ops):
+    today = date.today()
+    date_range = st.date_input("Order Dates", value=(today - timedelta(days=30), today), max_value=today, key="export_dates")
+    
+    restaurants = restaurant_ops.read_all()
+    restaurant_options = {"All Restaurants": None}
+    restaurant_options.update({f"{r['name']} (ID: {r['id']})": r['id'] for r in restaurants})
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selected_restaurant = st.selectbox("Restaurant", list(restaurant_options.keys()), key="export_restaurant")
+    
+    with col2:
+        fmt = st.selectbox("Format", ["csv", "csv.gz", "parquet"], key="export_format")
+    
+    if st.button("Prepare Export", disabled=len(date_range) != 2):
+        start, end = date_range
+        previous = st.session_state.pop('order_export', None)
+        if previous:
+            _discard_export(previous['path'])
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        _sweep_exports()
+        progress = st.empty()
+        with tempfile.NamedTemporaryFile(suffix=f".{fmt}", dir=EXPORT_DIR, delete=False) as handle:
+            try:
+                stats = OrderExporter(order_ops).export(
+                    handle,
+                    fmt,
+                    datetime.combine(start, datetime.min.time()),
+                    datetime.combine(end + timedelta(days=1), datetime.min.time()),
+                    restaurant_options[selected_restaurant],
+                    lambda rows, orders: progress.caption(f"{rows:,} rows from {orders:,} orders exported...")
+                )
+            except Exception as e:
+                _discard_export(handle.name)
+                st.error(f"Error exporting orders: {str(e)}")
+                return
+        progress.empty()
+        st.session_state.order_export = dict(stats, path=handle.name, filename=f"orders_{start}_{end}.{fmt}")
+    
+    export = st.session_state.get('order_export')
+    if export:
+        try:
+            handle = open(export['path'], 'rb')
+        except FileNotFoundError:
+            st.session_state.pop('order_export', None)
+            st.warning("This export has expired, please prepare it again.")
+            return
+        with handle:
+            st.caption(f"{export['rows']:,} rows from {export['orders']:,} orders, {export['bytes'] / 1048576:.1f} MB in {export['seconds']}s ({export['rows_per_second']:,} rows/s)")
+            st.download_button(
+                "Download Export",
+                handle,
+                file_name=export['filename'],
+                mime="application/octet-stream",
+                on_click=_export_served,
+                args=(export['path'],)
+            )
+
 def render_delivery_partner_management(delivery_partner_ops, user_ops):
     st.subheader("Delivery Partner Management")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["Create Delivery Partner", "View Partners", "Update Partner", "Delete Partner"])
+    section = select_section("admin_delivery_partner_section", ["Create Delivery Partner", "View Partners", "Update Partner", "Delete Partner"])
     
-    with tab1:
+    if section == "Create Delivery Partner":
         with st.form("create_delivery_partner"):
             st.markdown("#### Create New Delivery Partner")
             
@@ -396,14 +579,14 @@ def render_delivery_partner_management(delivery_partner_ops, user_ops):
                 else:
                     st.warning("Please fill all required fields")
     
-    with tab2:
+    if section == "View Partners":
         partners = delivery_partner_ops.read_all()
         if partners:
             st.dataframe(partners, use_container_width=True)
         else:
             st.info("No delivery partners found")
     
-    with tab3:
+    if section == "Update Partner":
         partners = delivery_partner_ops.read_all()
         if partners:
             partner_options = {f"{p['username']} (ID: {p['id']})": p['id'] for p in partners}
@@ -429,7 +612,7 @@ def render_delivery_partner_management(delivery_partner_ops, user_ops):
         else:
             st.info("No delivery partners available")
     
-    with tab4:
+    if section == "Delete Partner":
         partners = delivery_partner_ops.read_all()
         if partners:
             partner_options = {f"{p['username']} (ID: {p['id']})": p['id'] for p in partners}
@@ -446,12 +629,16 @@ def render_delivery_partner_management(delivery_partner_ops, user_ops):
         else:
             st.info("No delivery partners available")
 
-def render_system_overview(user_ops, restaurant_ops, order_ops):
+def render_system_overview(user_ops, restaurant_ops, order_ops, analytics_ops):
     st.subheader("System Overview")
     
-    users = user_ops.read_all()
-    restaurants = restaurant_ops.read_all()
-    orders = order_ops.read_all()
+    db = user_ops.db
+    users, restaurants, sales, recent_page = run_queries(
+        AsyncUserOperations(db).read_all(),
+        AsyncRestaurantOperations(db).read_all(),
+        AsyncRestaurantAnalyticsOperations(db).get_summary(),
+        AsyncOrderOperations(db).read_page(limit=5)
+    )
     
     col1, col2, col3 = st.columns(3)
     
@@ -478,21 +665,79 @@ def render_system_overview(user_ops, restaurant_ops, order_ops):
             st.write(f"Average Rating: {avg_rating:.1f} ⭐")
     
     with col3:
-        st.metric("Total Orders", len(orders))
+        st.metric("Total Orders", sales['total_orders'])
         
-        if orders:
-            total_revenue = sum(order['total_amount'] for order in orders if order['payment_status'] == 'paid')
-            st.write(f"Total Revenue: ₹{total_revenue:.2f}")
-            
-            avg_order_value = total_revenue / len(orders) if orders else 0
-            st.write(f"Average Order Value: ₹{avg_order_value:.2f}")
+        if sales['total_orders']:
+            st.write(f"Total Revenue: ₹{sales['total_revenue']:.2f}")
+            st.write(f"Average Order Value: ₹{sales['avg_order_value']:.2f}")
+            st.write(f"Paid Deliveries: {sales['delivered_paid_orders']}")
     
     st.markdown("#### Recent Orders")
     
-    recent_orders = sorted(orders, key=lambda x: x['created_at'], reverse=True)[:5]
+    recent_orders, _ = recent_page
     
     if recent_orders:
         for order in recent_orders:
             st.write(f"**Order #{order['id']}** - {order['customer_username']} - {order['restaurant_name']} - ₹{order['total_amount']:.2f} - {order['status'].replace('_', ' ').title()}")
     else:
         st.info("No recent orders")
+    
+    with st.expander("Sales Rollups"):
+        st.write("Sales figures are served from daily rollups that a background task refreshes every minute. Build them once after creating or upgrading the database.")
+        if st.button("Build Sales Rollups"):
+            rollup_db = analytics_ops.db.long_running()
+            try:
+                SalesRollupOperations(rollup_db).rebuild()
+            finally:
+                rollup_db.close()
+            st.success("Sales rollups built")
+            st.rerun()
+
+def render_performance(db):
+    st.subheader("Performance")
+    
+    pool_stats = db.pool_stats()
+    cache_stats = db.cache_stats()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Connections In Use", f"{pool_stats['in_use']} / {pool_stats['max_size']}")
+    
+    with col2:
+        st.metric("Idle Connections", pool_stats['idle'])
+    
+    with col3:
+        st.metric("Handshakes Avoided", pool_stats['handshakes_avoided'])
+    
+    with col4:
+        st.metric("Cache Hit Ratio", f"{cache_stats['hit_ratio']:.0%}")
+    
+    with st.expander("Connection Pool"):
+        st.json(pool_stats)
+    
+    with st.expander("Query Cache"):
+        st.json(cache_stats)
+    
+    st.markdown("#### Statements")
+    
+    capture_threshold = float(db.query_stats.slow_threshold_ms)
+    threshold = st.number_input("Slow Query Threshold (ms)", min_value=capture_threshold, value=capture_threshold, step=50.0, key="slow_query_threshold", help=f"Statements slower than {capture_threshold:.0f} ms are logged for every session; this filters the log for your view only")
+    
+    summary = db.query_summary()
+    if summary:
+        st.dataframe(summary, use_container_width=True)
+    else:
+        st.info("No queries recorded yet")
+    
+    st.markdown("#### Slow Queries")
+    
+    slow_queries = db.slow_queries(threshold)
+    if slow_queries:
+        st.dataframe([dict(q, params=str(q['params'])) for q in slow_queries], use_container_width=True)
+    else:
+        st.info("No slow queries recorded")
+    
+    if st.button("Reset Statistics"):
+        db.query_stats.reset()
+        st.rerun()